@@ -1,6 +1,6 @@
 import setuptools
 
-requirements = ['selenium~=4.6', "cdp-socket>=1.2.5", "numpy", "scipy~=1.7", "aiofiles",
+requirements = ['selenium~=4.6', "cdp-socket>=1.2.5", "numpy", "aiofiles",
                 'platformdirs']
 
 with open('README.md', 'r', encoding='utf-8') as fh:
@@ -46,6 +46,7 @@ setuptools.setup(
     include_package_data=True,
     extras_require={
         'dev': ['check-manifest'],
+        'fast': ['msgspec'],
         # 'test': ['coverage'],
     },
     license='https://github.com/kaliiiiiiiiii/Selenium-Driverless/blob/master/LICENSE.md'
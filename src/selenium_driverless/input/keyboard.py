@@ -0,0 +1,241 @@
+import asyncio
+import random
+import typing
+
+from selenium_driverless.input.pointer import Modifiers
+
+if typing.TYPE_CHECKING:
+    from selenium_driverless.types.target import Target
+
+KEY_MAPPING = {
+    'a': ('KeyA', 65), 'b': ('KeyB', 66), 'c': ('KeyC', 67), 'd': ('KeyD', 68), 'e': ('KeyE', 69),
+    'f': ('KeyF', 70), 'g': ('KeyG', 71), 'h': ('KeyH', 72), 'i': ('KeyI', 73), 'j': ('KeyJ', 74),
+    'k': ('KeyK', 75), 'l': ('KeyL', 76), 'm': ('KeyM', 77), 'n': ('KeyN', 78), 'o': ('KeyO', 79),
+    'p': ('KeyP', 80), 'q': ('KeyQ', 81), 'r': ('KeyR', 82), 's': ('KeyS', 83), 't': ('KeyT', 84),
+    'u': ('KeyU', 85), 'v': ('KeyV', 86), 'w': ('KeyW', 87), 'x': ('KeyX', 88), 'y': ('KeyY', 89),
+    'z': ('KeyZ', 90), 'A': ('KeyA', 65), 'B': ('KeyB', 66), 'C': ('KeyC', 67), 'D': ('KeyD', 68),
+    'E': ('KeyE', 69), 'F': ('KeyF', 70), 'G': ('KeyG', 71), 'H': ('KeyH', 72), 'I': ('KeyI', 73),
+    'J': ('KeyJ', 74), 'K': ('KeyK', 75), 'L': ('KeyL', 76), 'M': ('KeyM', 77), 'N': ('KeyN', 78),
+    'O': ('KeyO', 79), 'P': ('KeyP', 80), 'Q': ('KeyQ', 81), 'R': ('KeyR', 82), 'S': ('KeyS', 83),
+    'T': ('KeyT', 84), 'U': ('KeyU', 85), 'V': ('KeyV', 86), 'W': ('KeyW', 87), 'X': ('KeyX', 88),
+    'Y': ('KeyY', 89), 'Z': ('KeyZ', 90), '0': ('Digit0', 48), '1': ('Digit1', 49), '2': ('Digit2', 50),
+    '3': ('Digit3', 51), '4': ('Digit4', 52), '5': ('Digit5', 53), '6': ('Digit6', 54), '7': ('Digit7', 55),
+    '8': ('Digit8', 56), '9': ('Digit9', 57), '!': ('Digit1', 49), '"': ('Quote', 222), '#': ('Digit3', 51),
+    '$': ('Digit4', 52), '%': ('Digit5', 53), '&': ('Digit7', 55), "'": ('Quote', 222), '(': ('Digit9', 57),
+    ')': ('Digit0', 48), '*': ('Digit8', 56), '+': ('Equal', 187), ',': ('Comma', 188), '-': ('Minus', 189),
+    '.': ('Period', 190), '/': ('Slash', 191), ':': ('Semicolon', 186), ';': ('Semicolon', 186),
+    '<': ('Comma', 188),
+    '=': ('Equal', 187), '>': ('Period', 190), '?': ('Slash', 191), '@': ('Digit2', 50),
+    '[': ('BracketLeft', 219),
+    '\\': ('Backslash', 220), ']': ('BracketRight', 221), '^': ('Digit6', 54), '_': ('Minus', 189),
+    '`': ('Backquote', 192),
+    '{': ('BracketLeft', 219), '|': ('Backslash', 220), '}': ('BracketRight', 221), '~': ('Backquote', 192),
+    ' ': ('Space', 32), '\r': ('Enter', 13)
+}
+
+SHIFT_KEY_NEEDED = '~!@#$%^&*()_+{}|:"<>?'
+
+
+class KeyEventKind:
+    """the kinds of events a timing model gets asked the delay for"""
+
+    SHIFT_DOWN = "shiftDown"
+    """pressing shift"""
+
+    KEY_DOWN = "keyDown"
+    """pressing a key"""
+
+    CHAR = "char"
+    """the char event of a key"""
+
+    KEY_UP = "keyUp"
+    """releasing a key"""
+
+    SHIFT_UP = "shiftUp"
+    """releasing shift"""
+
+    INSERT_TEXT = "insertText"
+    """inserting a chunk with ``Input.insertText``"""
+
+
+class TimingModel:
+    """decides the delay before each key event"""
+
+    def delay(self, kind: str, letter: typing.Optional[str]) -> float:
+        """the delay in seconds before the event
+
+        :param kind: one of :class:`KeyEventKind <selenium_driverless.input.keyboard.KeyEventKind>`
+        :param letter: the letter the event is for, ``None`` for ``insertText``
+        """
+        raise NotImplementedError()
+
+
+class HumanTiming(TimingModel):
+    """random delays before each event, like a human typing
+
+    :param min_delay: the minimum delay in seconds
+    :param max_delay: the maximum delay in seconds
+    """
+
+    def __init__(self, min_delay: float = 0.01, max_delay: float = 0.05):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+
+    def delay(self, kind: str, letter: typing.Optional[str]) -> float:
+        return random.uniform(self.min_delay, self.max_delay)
+
+
+class FastTiming(TimingModel):
+    """a fixed delay between keys, the events of a single key are dispatched at once
+
+    :param interval: the delay between keys in seconds
+    """
+
+    def __init__(self, interval: float = 0.002):
+        self.interval = interval
+
+    def delay(self, kind: str, letter: typing.Optional[str]) -> float:
+        if kind in (KeyEventKind.SHIFT_DOWN, KeyEventKind.INSERT_TEXT):
+            return self.interval
+        if kind == KeyEventKind.KEY_DOWN and not (letter.isupper() or letter in SHIFT_KEY_NEEDED):
+            return self.interval
+        return 0
+
+
+class InstantTiming(TimingModel):
+    """no delays at all"""
+
+    def delay(self, kind: str, letter: typing.Optional[str]) -> float:
+        return 0
+
+
+TIMING_MODELS: typing.Dict[str, typing.Type[TimingModel]] = {
+    "human": HumanTiming,
+    "fast": FastTiming,
+    "instant": InstantTiming
+}
+
+
+def get_timing(timing: typing.Union[str, TimingModel, None]) -> TimingModel:
+    """get a timing model by name, see :data:`TIMING_MODELS`
+
+    :param timing: ``"human"``, ``"fast"``, ``"instant"`` or a :class:`TimingModel <selenium_driverless.input.keyboard.TimingModel>`.
+        Defaults to ``"human"``
+    """
+    if timing is None:
+        timing = "human"
+    if isinstance(timing, str):
+        try:
+            return TIMING_MODELS[timing]()
+        except KeyError:
+            raise ValueError(f"unknown timing model: {timing}, expected one of {', '.join(TIMING_MODELS)}")
+    return timing
+
+
+class InsertText(str):
+    """a chunk of text to insert with a single ``Input.insertText`` instead of typing it
+
+    .. code-block:: python
+
+        await target.send_keys(["Dear Sir or Madam,\\n", InsertText(long_text), "\\nregards"])
+    """
+
+
+def key_events(letter: str, allow_not_on_mapping: bool = True) -> typing.List[typing.Tuple[str, dict]]:
+    """the ``Input.dispatchKeyEvent`` params to type a letter
+
+    :param letter: the letter
+    :param allow_not_on_mapping: allow keys which aren't in the keyboard mapping
+    :returns: a list of ``(kind, params)``, see :class:`KeyEventKind <selenium_driverless.input.keyboard.KeyEventKind>`
+    """
+    if letter == "\n":
+        letter = "\r"
+    if letter in KEY_MAPPING:
+        key_code, virtual_key_code = KEY_MAPPING[letter]
+    elif allow_not_on_mapping:
+        key_code, virtual_key_code = 0, 0
+    else:
+        raise ValueError(f"letter:{letter} not in keyboard mapping")
+
+    events = []
+    shift_pressed = letter.isupper() or letter in SHIFT_KEY_NEEDED
+    modifiers = Modifiers.SHIFT if shift_pressed else Modifiers.NONE
+    if shift_pressed:
+        events.append((KeyEventKind.SHIFT_DOWN, {"type": "keyDown", "code": "ShiftLeft", "windowsVirtualKeyCode": 16,
+                                                 "key": "Shift", "modifiers": Modifiers.SHIFT}))
+    key_event = {"code": key_code, "windowsVirtualKeyCode": virtual_key_code, "key": letter, "modifiers": modifiers}
+    events.append((KeyEventKind.KEY_DOWN, {"type": "keyDown", **key_event}))
+    events.append((KeyEventKind.CHAR, {"type": "char", "text": letter, **key_event}))
+    events.append((KeyEventKind.KEY_UP, {"type": "keyUp", **key_event}))
+    if shift_pressed:
+        events.append((KeyEventKind.SHIFT_UP, {"type": "keyUp", "code": "ShiftLeft", "windowsVirtualKeyCode": 16,
+                                               "key": "Shift", "modifiers": Modifiers.NONE}))
+    return events
+
+
+class Keyboard:
+    """types text on a target.
+    The whole event schedule is computed upfront, and dispatched at its deadlines with
+    :attr:`Target.input_scheduler <selenium_driverless.types.target.Target.input_scheduler>`, without waiting for each reply.
+
+    .. code-block:: python
+
+        await target.keyboard.send_keys("Hello World!", timing="fast")
+
+    :param target: the target to type on
+    :param timing: the default timing model, see :func:`get_timing <selenium_driverless.input.keyboard.get_timing>`
+    """
+
+    def __init__(self, target: "Target", timing: typing.Union[str, TimingModel, None] = None):
+        self._target = target
+        self.timing = get_timing(timing)
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def schedule(text: typing.Union[str, typing.Iterable[str]], timing: typing.Union[str, TimingModel],
+                 allow_not_on_mapping: bool = True) -> typing.List[typing.Tuple[float, str, dict]]:
+        """the events to send text, with their offset in seconds
+
+        :param text: the text, or a list of segments. Segments of type :class:`InsertText <selenium_driverless.input.keyboard.InsertText>` are inserted at once
+        :param timing: the timing model, see :func:`get_timing <selenium_driverless.input.keyboard.get_timing>`
+        :param allow_not_on_mapping: allow keys which aren't in the keyboard mapping
+        :returns: a list of ``(offset, cmd, cmd_args)``
+        """
+        timing = get_timing(timing)
+        if isinstance(text, str):
+            text = [text]
+        events = []
+        offset = 0
+        for segment in text:
+            if isinstance(segment, InsertText):
+                if events:
+                    offset += timing.delay(KeyEventKind.INSERT_TEXT, None)
+                events.append((offset, "Input.insertText", {"text": str(segment)}))
+                continue
+            for letter in segment:
+                for kind, params in key_events(letter, allow_not_on_mapping=allow_not_on_mapping):
+                    if events:
+                        offset += timing.delay(kind, letter)
+                    events.append((offset, "Input.dispatchKeyEvent", params))
+        return events
+
+    async def send_keys(self, text: typing.Union[str, typing.Iterable[str]],
+                        timing: typing.Union[str, TimingModel, None] = None, allow_not_on_mapping: bool = True):
+        """send text & keys to the target
+
+        :param text: the text, or a list of segments. Segments of type :class:`InsertText <selenium_driverless.input.keyboard.InsertText>` are inserted at once
+        :param timing: the timing model, defaults to :attr:`Keyboard.timing`
+        :param allow_not_on_mapping: allow keys which aren't in the keyboard mapping
+        """
+        if timing is None:
+            timing = self.timing
+        events = self.schedule(text, timing, allow_not_on_mapping=allow_not_on_mapping)
+        async with self._lock:
+            await self._target.input_scheduler.run(events)
+
+    async def insert_text(self, text: str):
+        """insert text at once with ``Input.insertText``, without any key events
+
+        :param text: the text to insert
+        """
+        await self.send_keys([InsertText(text)])
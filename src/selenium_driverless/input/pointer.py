@@ -1,11 +1,10 @@
 import asyncio
-import time
 import inspect
 import typing
 
 import numpy as np
 
-from selenium_driverless.scripts.geometry import gen_combined_path, pos_at_time, bias_0_dot_5
+from selenium_driverless.scripts.geometry import gen_combined_path, bias_0_dot_5, PathTimeline
 
 
 def make_rand_click_timeout():
@@ -224,35 +223,35 @@ class BasePointer:
         """
         move a path
 
+        The events are dispatched at fixed deadlines with :attr:`Target.input_scheduler <selenium_driverless.types.target.Target.input_scheduler>`,
+        without waiting for each reply. Events which wouldn't move the pointer are skipped.
+
         :param total_time: total time the pointer should take to move the path
-        :param freq_assumption: assumption on a mousemove event frequency, required for accuracy
+        :param freq_assumption: the frequency to dispatch mousemove events at
         :param kwargs: kwargs for :class:`PointerEvent <selenium_driverless.input.pointer.PointerEvent>`
         :param pos_from_time_callback: a function which returns coordinates for a specific time
         """
+        scheduler = self._driver.input_scheduler
+        batch = scheduler.batch()
+        n_events = max(int(total_time * freq_assumption), 1)
+        start = scheduler.now()
         x = None
         y = None
-        i = -1
-        start = None
-        while True:
-            if i == -1:
-                _time = 0
-            else:
-                _time = time.perf_counter() - start
-
-            if _time > total_time or _time < 0:
-                return x, y
+        for i in range(n_events + 1):
+            _time = min(i / freq_assumption, total_time)
 
             # get coordinates at time
             res = pos_from_time_callback(_time)
-            if inspect.iscoroutinefunction(pos_from_time_callback):
-                await res
+            if inspect.isawaitable(res):
+                res = await res
+            if (x, y) == tuple(res):
+                continue
             x, y = res
 
-            await self.move_to(x=x, y=y, **kwargs)
-
-            if i == -1:
-                start = time.perf_counter() - (1 / freq_assumption)  # => approximately 0.017, assuming 60 Hz
-            i += 1
+            event = PointerEvent(type_=EventType.MOVE, x=x, y=y, **kwargs)
+            await scheduler.dispatch_at(start + _time, *event.to_json(), batch=batch)
+        await batch.flush()
+        return x, y
 
 
 class Pointer:
@@ -261,6 +260,8 @@ class Pointer:
         self._target = target
         self.base = BasePointer(driver=target, pointer_type=pointer_type)
         self.location = [100, 0]
+        self.path_library = None
+        """optional :class:`PathLibrary <selenium_driverless.scripts.geometry.PathLibrary>` to take the paths from"""
         self._loop = None
 
     async def down(self, **kwargs):
@@ -312,7 +313,7 @@ class Pointer:
         :param total_time: the total time, the pointer should take to move to the location
         :param accel: the acceleration & deceleration, the pointerMove should perform
         :param mid_time: the normalized position, where half of the time should be due (0-1)
-        :param smooth_soft: how "curvy" the line should be
+        :param smooth_soft: how "curvy" the line should be, ignored if :attr:`Pointer.path_library` is set
         :param kwargs: kwargs for :func:`BasePointer.move_path <selenium_driverless.input.pointer.BasePointer.move_path>`
         """
         from selenium_driverless.types.webelement import WebElement
@@ -327,12 +328,12 @@ class Pointer:
             if not mid_time:
                 mid_time = bias_0_dot_5(0.5, max_offset=0.3)
 
-            # noinspection PyShadowingNames
-            def pos_from_time_callback(time: float):
-                return pos_at_time(path, total_time, time, accel, mid_time=mid_time)
-
-            points = np.array([self.location, [x, y]])
-            path = gen_combined_path(points, n_points_soft=5, smooth_soft=smooth_soft, n_points_distort=100,
-                                     smooth_distort=0.4)
-            await self.base.move_path(total_time=total_time, pos_from_time_callback=pos_from_time_callback, **kwargs)
+            if self.path_library is None:
+                points = np.array([self.location, [x, y]])
+                path = gen_combined_path(points, n_points_soft=5, smooth_soft=smooth_soft, n_points_distort=100,
+                                         smooth_distort=0.4)
+            else:
+                path = self.path_library.path(self.location, [x, y])
+            timeline = PathTimeline(path, total_time, accel, mid_time=mid_time)
+            await self.base.move_path(total_time=total_time, pos_from_time_callback=timeline.at, **kwargs)
             self.location = [x, y]
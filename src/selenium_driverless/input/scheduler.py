@@ -0,0 +1,214 @@
+import asyncio
+import collections
+import typing
+
+import numpy as np
+
+from selenium_driverless.utils.utils import safe_wrap_fut
+
+if typing.TYPE_CHECKING:
+    from selenium_driverless.types.target import Target
+
+
+class InputBatch:
+    """the events of a single caller, with the replies waited for and the errors raised independently of other callers.
+    Usually created with :func:`InputScheduler.batch <selenium_driverless.input.scheduler.InputScheduler.batch>`
+
+    :param timeout: the default timeout for :func:`InputBatch.flush <selenium_driverless.input.scheduler.InputBatch.flush>`
+    """
+
+    def __init__(self, timeout: float = 10):
+        self.timeout = timeout
+        self._pending: typing.Set[asyncio.Future] = set()
+        self._errors: typing.List[Exception] = []
+
+    @property
+    def pending(self) -> int:
+        """the number of events the reply hasn't arrived for yet"""
+        return len(self._pending)
+
+    @property
+    def errors(self) -> typing.List[Exception]:
+        """errors collected since the last :func:`InputBatch.flush <selenium_driverless.input.scheduler.InputBatch.flush>`"""
+        return list(self._errors)
+
+    def add(self, fut: asyncio.Future):
+        """track the reply of an event
+
+        :param fut: the future for the reply
+        """
+        self._pending.add(fut)
+        fut.add_done_callback(self._on_reply)
+
+    def _on_reply(self, fut: asyncio.Future):
+        self._pending.discard(fut)
+        if not fut.cancelled():
+            exc = fut.exception()
+            if exc is not None:
+                self._errors.append(exc)
+
+    async def flush(self, timeout: float = None, raise_errors: bool = True):
+        """wait for the replies to all events of this batch.
+        On timeout, the remaining replies and the errors collected are dropped, and ``asyncio.TimeoutError`` is raised.
+
+        :param timeout: timeout in seconds, defaults to :attr:`InputBatch.timeout`
+        :param raise_errors: raise the first of the collected errors, if any
+        """
+        if timeout is None:
+            timeout = self.timeout
+        if self._pending:
+            await asyncio.wait(list(self._pending), timeout=timeout)
+        errors, self._errors = self._errors, []
+        if self._pending:
+            pending, self._pending = self._pending, set()
+            for fut in pending:
+                fut.cancel()
+            raise asyncio.TimeoutError(f"{len(pending)} input events got no reply within {timeout} seconds")
+        if raise_errors and errors:
+            raise errors[0]
+
+
+class InputScheduler:
+    """dispatches input events (``Input.dispatchMouseEvent``, ``Input.dispatchKeyEvent``, ..) at deadlines
+    on the monotonic event loop clock.
+    Events are put on the wire without waiting for their replies, the browser processes them in order anyway.
+    Errors are collected in the background, per :class:`InputBatch <selenium_driverless.input.scheduler.InputBatch>`,
+    and raised when flushing it.
+
+    .. code-block:: python
+
+        scheduler = target.input_scheduler
+        batch = scheduler.batch()
+        start = scheduler.now()
+        for idx, (x, y) in enumerate(points):
+            await scheduler.dispatch_at(start + idx / 60, "Input.dispatchMouseEvent",
+                                        {"type": "mouseMoved", "x": x, "y": y}, batch=batch)
+        await batch.flush()
+        print(scheduler.stats())
+
+    :param target: the target to dispatch the events on
+    :param timeout: timeout in seconds for each reply
+    :param history: the number of events to keep the jitter for
+    """
+
+    def __init__(self, target: "Target", timeout: float = 10, history: int = 4096):
+        self._target = target
+        self.timeout = timeout
+        # events of all batches
+        self._pending: typing.Set[asyncio.Future] = set()
+        # events sent without a batch
+        self._batch = InputBatch(timeout=timeout)
+        # actual - planned, in seconds
+        self._jitter: typing.Deque[float] = collections.deque(maxlen=history)
+        self._sent = 0
+
+    @staticmethod
+    def now() -> float:
+        """the current time of the clock deadlines refer to"""
+        return asyncio.get_event_loop().time()
+
+    @property
+    def pending(self) -> int:
+        """the number of events the reply hasn't arrived for yet, of all batches"""
+        return len(self._pending)
+
+    @property
+    def errors(self) -> typing.List[Exception]:
+        """errors of the events sent without a batch,
+        collected since the last :func:`InputScheduler.flush <selenium_driverless.input.scheduler.InputScheduler.flush>`"""
+        return self._batch.errors
+
+    def batch(self) -> InputBatch:
+        """a new batch to track the replies and errors of a single caller"""
+        return InputBatch(timeout=self.timeout)
+
+    async def send(self, cmd: str, cmd_args: dict = None, batch: InputBatch = None) -> asyncio.Future:
+        """put a command on the wire without waiting for its reply
+
+        :param cmd: the command
+        :param cmd_args: the params for the command
+        :param batch: the batch to track the reply in, see :func:`InputScheduler.batch <selenium_driverless.input.scheduler.InputScheduler.batch>`
+        :returns: a future for the reply
+        """
+        target = self._target
+        if not target.socket:
+            # noinspection PyProtectedMember
+            await target._init()
+        socket = target.socket
+        _id = await socket.send(method=cmd, params=cmd_args)
+        self._sent += 1
+        fut = safe_wrap_fut(socket.wait_reply(_id, method=cmd, params=cmd_args, timeout=self.timeout))
+        self._pending.add(fut)
+        fut.add_done_callback(self._pending.discard)
+        if batch is None:
+            batch = self._batch
+        batch.add(fut)
+        return fut
+
+    async def dispatch_at(self, deadline: float, cmd: str, cmd_args: dict = None,
+                          batch: InputBatch = None) -> asyncio.Future:
+        """sleep until the deadline, and put a command on the wire without waiting for its reply
+
+        :param deadline: the time to dispatch the event at, see :func:`InputScheduler.now <selenium_driverless.input.scheduler.InputScheduler.now>`
+        :param cmd: the command
+        :param cmd_args: the params for the command
+        :param batch: the batch to track the reply in, see :func:`InputScheduler.batch <selenium_driverless.input.scheduler.InputScheduler.batch>`
+        :returns: a future for the reply
+        """
+        loop = asyncio.get_event_loop()
+        delay = deadline - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._jitter.append(loop.time() - deadline)
+        return await self.send(cmd, cmd_args, batch=batch)
+
+    async def run(self, events: typing.Iterable[typing.Tuple[float, str, typing.Optional[dict]]],
+                  start: float = None, flush: bool = True, batch: InputBatch = None) -> float:
+        """dispatch events at ``start + offset``
+
+        :param events: an iterable of ``(offset, cmd, cmd_args)``, ordered by offset
+        :param start: the time offsets refer to, defaults to now
+        :param flush: whether to wait for the replies of these events afterwards
+        :param batch: the batch to track the replies in.
+            Defaults to a new batch if ``flush``, else to the events flushed with :func:`InputScheduler.flush <selenium_driverless.input.scheduler.InputScheduler.flush>`
+        :returns: the start time used
+        """
+        if batch is None and flush:
+            batch = self.batch()
+        if start is None:
+            start = self.now()
+        for offset, cmd, cmd_args in events:
+            await self.dispatch_at(start + offset, cmd, cmd_args, batch=batch)
+        if flush:
+            await batch.flush()
+        return start
+
+    async def flush(self, timeout: float = None, raise_errors: bool = True):
+        """wait for the replies to the events sent without a batch,
+        see :func:`InputBatch.flush <selenium_driverless.input.scheduler.InputBatch.flush>`
+
+        :param timeout: timeout in seconds, defaults to :attr:`InputScheduler.timeout`
+        :param raise_errors: raise the first of the collected errors, if any
+        """
+        if timeout is None:
+            timeout = self.timeout
+        await self._batch.flush(timeout=timeout, raise_errors=raise_errors)
+
+    def stats(self) -> typing.Dict[str, float]:
+        """statistics about the actual - planned dispatch time of the last events, in seconds
+
+        .. code-block:: python
+
+            {"count": 31, "sent": 31, "mean": 0.0012, "p50": 0.0011, "p95": 0.0021, "max": 0.0034}
+        """
+        jitter = np.fromiter(self._jitter, dtype=float, count=len(self._jitter))
+        if not len(jitter):
+            return {"count": 0, "sent": self._sent, "mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+        return {"count": len(jitter), "sent": self._sent, "mean": float(jitter.mean()),
+                "p50": float(np.percentile(jitter, 50)), "p95": float(np.percentile(jitter, 95)),
+                "max": float(jitter.max())}
+
+    def reset_stats(self):
+        """forget the jitter of all events so far"""
+        self._jitter.clear()
+        self._sent = 0
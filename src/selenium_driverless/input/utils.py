@@ -1,5 +1,6 @@
 from selenium_driverless.types.webelement import WebElement
 from selenium_driverless.types import JSEvalException
+from selenium_driverless.types.script_registry import register_script
 import asyncio
 from typing import Type
 try:
@@ -11,6 +12,28 @@ except ImportError:
     KeyboardCodes: Type["KeyboardCodes"] = "KeyboardCodes"
 
 
+register_script("select", """
+    function(obj, value, text, use_js){
+        var idx = Array.from(obj.options).findIndex(option => option.value === value || option.text === text)
+        var currIdx = obj.selectedIndex
+        if (idx === -1){throw ReferenceError("option not found")}
+        if(value === undefined || value === null){
+            value = obj.options[idx].value
+        }
+        if(use_js && obj.options[currIdx].value !== value){
+            obj.value = value
+            const evt = new Event("change")
+            evt.initEvent("change", true, true)
+            obj.dispatchEvent(evt)
+            return [0, 1]
+        }else{
+            const n = Math.abs(idx - currIdx);
+            const direction = idx < currIdx ? 1 : -1
+            return [n, direction]
+        }
+    }""")
+
+
 async def select(elem: WebElement, value: str = None, text: str = None, async_input: AsyncInput = None,
                  timeouts: float = 0.01) -> None:
     """
@@ -34,27 +57,8 @@ async def select(elem: WebElement, value: str = None, text: str = None, async_in
     if value is None and text is None:
         raise ValueError("value or text need to be specified")
     try:
-        n, direction = await elem.execute_script("""
-            let [value, text, use_js] = arguments
-            var idx = Array.from(obj.options).findIndex(option => option.value === value || option.text === text)
-            var currIdx = obj.selectedIndex
-            if (idx === -1){throw ReferenceError("option not found")}
-            if(typeof value == 'undefined'){
-                value = obj.options[idx].value
-            }
-            if(use_js && obj.options[currIdx].value !== value){
-                obj.value = value
-                const evt = new Event("change")
-                evt.initEvent("change", true, true)
-                obj.dispatchEvent(evt)
-                return [0, 1]
-            }else{
-                const n = Math.abs(idx - currIdx);
-                const direction = idx < currIdx ? 1 : -1
-                return [n, direction]
-            }
-
-        """, value, text, use_js)
+        # noinspection PyUnresolvedReferences
+        n, direction = await elem.__target__.scripts.call("select", value, text, use_js, obj=elem)
     except JSEvalException as e:
         if e.class_name == "ReferenceError" and e.description[:33] == 'ReferenceError: option not found\n':
             raise ValueError(f"option not found based on value:{value}, text:{text} for {elem}")
@@ -1,41 +1,54 @@
 import asyncio
+import functools
 import typing
 
 
 async def get_targets(cdp_exec: callable, target_getter: callable, _type: str = None, context_id: str = None,
-                      max_ws_size: int = 2 ** 20):
+                      max_ws_size: int = 2 ** 20, registry=None):
+    """get infos for all targets matching ``_type`` and ``context_id``.
+    ``target_getter`` is called with ``target_id`` and ``max_ws_size`` on first access of ``TargetInfo.Target``,
+    no target gets created or connected to while listing.
+    """
     from selenium_driverless.types.target import TargetInfo
-    res = await cdp_exec("Target.getTargets")
-    _infos = res["targetInfos"]
+    if registry is not None and registry.started:
+        # kept current by events, no round-trip required
+        _infos = list(registry.infos.values())
+    else:
+        res = await cdp_exec("Target.getTargets")
+        _infos = res["targetInfos"]
     infos: typing.Dict[str, TargetInfo] = {}
     for info in _infos:
-        _id = info["targetId"]
-
-        target = await target_getter(target_id=_id[:], max_ws_size=max_ws_size)
-
-        info = await TargetInfo(info, target)
-        if (_type is None or info.type == _type) and (context_id is None or context_id == info.browser_context_id):
-            infos[_id] = info
+        if (_type is None or info["type"] == _type) and (context_id is None or context_id == info.get("browserContextId")):
+            _id = info["targetId"]
+            infos[_id] = TargetInfo(info, functools.partial(target_getter, target_id=_id, max_ws_size=max_ws_size))
     return infos
 
 
 # noinspection PyProtectedMember
-async def get_target(target_id: str, host: str, driver, context, loop: asyncio.AbstractEventLoop or None,
-                     is_remote: bool = False,
-                     timeout: float = 2, max_ws_size: int = 2 ** 20):
+def make_target(target_id: str, host: str, driver, context, loop: asyncio.AbstractEventLoop or None,
+                is_remote: bool = False, timeout: float = 2, max_ws_size: int = 2 ** 20):
+    """create a Target without connecting to it, connects on the first command"""
     from selenium_driverless.types.target import Target
     from selenium_driverless.sync.target import Target as SyncTarget
     if loop:
-        target: Target = await SyncTarget(host=host, target_id=target_id,
-                                          is_remote=is_remote, loop=loop,
-                                          timeout=timeout, max_ws_size=max_ws_size, driver=driver, context=context)
+        target: Target = SyncTarget(host=host, target_id=target_id,
+                                    is_remote=is_remote, loop=loop,
+                                    timeout=timeout, max_ws_size=max_ws_size, driver=driver, context=context)
     else:
-        target: Target = await Target(host=host, target_id=target_id,
-                                      is_remote=is_remote, loop=loop, timeout=timeout, max_ws_size=max_ws_size,
-                                      driver=driver, context=context)
+        target: Target = Target(host=host, target_id=target_id,
+                                is_remote=is_remote, loop=loop, timeout=timeout, max_ws_size=max_ws_size,
+                                driver=driver, context=context)
     return target
 
 
+async def get_target(target_id: str, host: str, driver, context, loop: asyncio.AbstractEventLoop or None,
+                     is_remote: bool = False,
+                     timeout: float = 2, max_ws_size: int = 2 ** 20):
+    target = make_target(target_id=target_id, host=host, driver=driver, context=context, loop=loop,
+                         is_remote=is_remote, timeout=timeout, max_ws_size=max_ws_size)
+    return await target
+
+
 async def get_cookies(target) -> typing.List[dict]:
     """Returns a set of dictionaries, corresponding to cookies visible in
     the current session.
@@ -2,8 +2,6 @@ import numpy as np
 import random
 import typing
 
-from scipy.interpolate import splprep, splev
-
 
 def gaussian_bias_rand(spread, border=0.05, bias=0.5) -> float:
     """Generate random Gaussian distributed values with bias."""
@@ -198,32 +196,154 @@ def bias_0_dot_5(strength: float, max_offset: float) -> float:
 
 
 # Mouse Path
-def pos_at_time(path, total_time, time, accel, mid_time=0.5) -> typing.Tuple[int]:
-    if time > total_time or time < 0:
-        raise ValueError("Time needs to be between 0 and total_time")
+def ease(normalized_time: typing.Union[float, np.ndarray], accel: float,
+         mid_time: float = 0.5) -> typing.Union[float, np.ndarray]:
+    """the normalized progress along a path at a normalized time (0-1), accelerating until ``mid_time``
+    (where half of the path is done) and decelerating afterwards
+    """
+    normalized_time = np.clip(normalized_time, 0, 1)
+    ease_in = (np.minimum(normalized_time, mid_time) / mid_time) ** accel / 2
+    ease_out = 1 - (1 - np.maximum(normalized_time - mid_time, 0) / (1 - mid_time)) ** accel
+    return np.where(normalized_time < mid_time, ease_in, ease_out / 2 + 0.5)
+
+
+def ease_inverse(progress: typing.Union[float, np.ndarray], accel: float,
+                 mid_time: float = 0.5) -> typing.Union[float, np.ndarray]:
+    """the normalized time at which :func:`ease` reaches a normalized progress"""
+    progress = np.clip(progress, 0, 1)
+    first = mid_time * (np.minimum(progress, 0.5) * 2) ** (1 / accel)
+    second = mid_time + (1 - mid_time) * (1 - (1 - np.maximum(progress - 0.5, 0) * 2) ** (1 / accel))
+    return np.where(progress < 0.5, first, second)
+
+
+class PathTimeline:
+    """a path to move along within ``total_time``, with the (eased) time each point is reached precomputed.
 
-    def cubic_ease_in(t):
-        return t ** accel
+    Looking up the position at a time is a binary search, and the whole event schedule can be computed at once.
 
-    def cubic_ease_out(t):
-        return 1.0 - (1.0 - t) ** accel
+    .. code-block:: python
 
-    t_values = np.linspace(0, 1, len(path))
-    normalized_time = time / total_time  # Normalize the input time to the range [0, 1]
+        timeline = PathTimeline(path, total_time=0.5, accel=2)
+        x, y = timeline.at(0.25)
+        times, points = timeline.schedule(freq=60)
 
-    # Apply cubic easing for acceleration and deceleration
-    if normalized_time < mid_time:
-        normalized_time = cubic_ease_in(normalized_time * 2) / 2
-    else:
-        normalized_time = cubic_ease_out((normalized_time - 0.5) * 2) / 2 + 0.5
+    :param path: the points of the path, ``[[x, y], ...]``
+    :param total_time: the time in seconds to move along the whole path
+    :param accel: the acceleration & deceleration
+    :param mid_time: the normalized time (0-1), at which half of the path is done
+    """
+
+    def __init__(self, path: ElemType, total_time: float, accel: float = 2, mid_time: float = 0.5):
+        self.path = np.asarray(path)
+        if not len(self.path):
+            raise ValueError("the path needs at least one point")
+        if total_time <= 0:
+            raise ValueError("total_time needs to be positive")
+        self.total_time = total_time
+        self.accel = accel
+        self.mid_time = min(max(mid_time, 1e-3), 1 - 1e-3)
+        # the point i is the nearest one from the midpoint to the previous point on,
+        # equivalent to the closest point to the eased progress
+        n = len(self.path)
+        if n > 1:
+            progress = (np.arange(n) - 0.5) / (n - 1)
+            progress[0] = 0
+            self.timestamps = ease_inverse(progress, accel, self.mid_time) * total_time
+        else:
+            self.timestamps = np.zeros(1)
+
+    def index_at(self, time: typing.Union[float, np.ndarray]) -> typing.Union[int, np.ndarray]:
+        """the index of the point at a time"""
+        return np.searchsorted(self.timestamps, time, side="right") - 1
+
+    def at(self, time: float) -> typing.Tuple[int, int]:
+        """the point at a time
+
+        :param time: the time in seconds since the start (0 to total_time)
+        """
+        if time > self.total_time or time < 0:
+            raise ValueError("Time needs to be between 0 and total_time")
+        x, y = self.path[self.index_at(time)].tolist()
+        return x, y
+
+    def schedule(self, freq: float = 60, start: float = 0) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """the times and points of all events to dispatch with a frequency, ending at the last point.
+        Events which wouldn't move the pointer are left out.
+
+        :param freq: the events per second
+        :param start: the time of the first event
+        """
+        times = np.arange(start, self.total_time, 1 / freq)
+        times = np.append(times, self.total_time)
+        indices = self.index_at(times)
+        keep = np.ones(len(indices), dtype=bool)
+        keep[1:] = indices[1:] != indices[:-1]
+        return times[keep], self.path[indices[keep]]
+
+    def __len__(self):
+        return len(self.path)
 
-    # Find the index of the closest time value in the path
-    idx = np.argmin(np.abs(t_values - normalized_time))
 
-    return path[idx]
+def pos_at_time(path, total_time, time, accel, mid_time=0.5) -> typing.Tuple[int]:
+    """the position on a path at a time
 
+    .. note::
+        builds a :class:`PathTimeline <selenium_driverless.scripts.geometry.PathTimeline>`,
+        which should be reused for multiple lookups
+    """
+    return PathTimeline(path, total_time, accel, mid_time=mid_time).at(time)
 
-def generate_path(start, end, n: int = 10, smoothness: float = 2):
+
+def catmull_rom(points: np.ndarray, n: int) -> np.ndarray:
+    """an interpolating (centripetal Catmull-Rom) spline through points, evaluated at ``n`` points
+    evenly spread over its chord length
+
+    :param points: the control points, ``[[x, y], ...]``
+    :param n: the number of points to return
+    """
+    points = np.asarray(points, dtype=float)
+    # consecutive duplicates don't have a direction
+    keep = np.ones(len(points), dtype=bool)
+    keep[1:] = np.any(np.diff(points, axis=0) != 0, axis=1)
+    points = points[keep]
+    if len(points) < 2:
+        return np.repeat(points[:1], n, axis=0)
+
+    # reflected end points as phantom control points
+    padded = np.vstack([2 * points[0] - points[1], points, 2 * points[-1] - points[-2]])
+    chords = np.linalg.norm(np.diff(padded, axis=0), axis=1)
+    # centripetal knot spacing avoids cusps and self-intersections
+    knots = np.concatenate([[0], np.cumsum(np.sqrt(np.maximum(chords, 1e-9)))])
+
+    # the samples, evenly spread over the chord length of the inner segments
+    inner = np.concatenate([[0], np.cumsum(chords[1:-1])])
+    u = np.linspace(0, inner[-1], n)
+    seg = np.clip(np.searchsorted(inner, u, side="right") - 1, 0, len(points) - 2)
+    local = (u - inner[seg]) / np.maximum(inner[seg + 1] - inner[seg], 1e-9)
+
+    p0, p1, p2, p3 = padded[seg], padded[seg + 1], padded[seg + 2], padded[seg + 3]
+    t0, t1, t2, t3 = knots[seg], knots[seg + 1], knots[seg + 2], knots[seg + 3]
+    t = (t1 + local * (t2 - t1))[:, None]
+    t0, t1, t2, t3 = t0[:, None], t1[:, None], t2[:, None], t3[:, None]
+
+    # Barry and Goldman's pyramidal formulation
+    a1 = (t1 - t) / (t1 - t0) * p0 + (t - t0) / (t1 - t0) * p1
+    a2 = (t2 - t) / (t2 - t1) * p1 + (t - t1) / (t2 - t1) * p2
+    a3 = (t3 - t) / (t3 - t2) * p2 + (t - t2) / (t3 - t2) * p3
+    b1 = (t2 - t) / (t2 - t0) * a1 + (t - t0) / (t2 - t0) * a2
+    b2 = (t3 - t) / (t3 - t1) * a2 + (t - t1) / (t3 - t1) * a3
+    return (t2 - t) / (t2 - t1) * b1 + (t - t1) / (t2 - t1) * b2
+
+
+def generate_path(start, end, n: int = 10, smoothness: float = 2, samples: int = None) -> np.ndarray:
+    """a smooth path through ``n`` points with normal distributed noise along the line from start to end
+
+    :param start: the start point
+    :param end: the end point
+    :param n: the number of control points
+    :param smoothness: the standard deviation of the noise in pixels
+    :param samples: the number of points to return, defaults to 10 per pixel of distance
+    """
     x_points = np.linspace(start[0], end[0], n)
     y_points = np.linspace(start[1], end[1], n)
     x_points += np.random.normal(0, smoothness, n)
@@ -234,12 +354,25 @@ def generate_path(start, end, n: int = 10, smoothness: float = 2):
     x_points[-1] = end[0]
     y_points[-1] = end[1]
 
-    # noinspection PyTupleAssignmentBalance
-    tck, _ = splprep([x_points, y_points], s=0)
-    t_values = np.linspace(0, 1, int(np.linalg.norm(np.array(end) - np.array(start)) * 10))
-    new_points = np.column_stack(splev(t_values, tck))
+    if samples is None:
+        samples = int(np.linalg.norm(np.array(end) - np.array(start)) * 10)
+    return catmull_rom(np.column_stack([x_points, y_points]), max(samples, 2))
+
+
+def _combine(segment_soft: np.ndarray, segment_distort: np.ndarray) -> np.ndarray:
+    # blend from the distorted into the soft segment
+    t = np.linspace(0, 1, len(segment_soft))
+    soft = segment_soft[(t * (len(segment_soft) - 1)).astype(int)]
+    distort = segment_distort[(t * (len(segment_distort) - 1)).astype(int)]
+    return (1 - t)[:, None] * distort + t[:, None] * soft
+
 
-    return new_points
+def _dedupe(points: np.ndarray) -> typing.List[typing.Tuple[int, int]]:
+    # truncate to pixels, without consecutive duplicates
+    points = points.astype(int)
+    keep = np.ones(len(points), dtype=bool)
+    keep[1:] = np.any(points[1:] != points[:-1], axis=1)
+    return [(x, y) for x, y in points[keep].tolist()]
 
 
 def gen_combined_path(coordinates, n_points_soft: int = 5, smooth_soft: float = 10, n_points_distort: int = 100,
@@ -250,22 +383,64 @@ def gen_combined_path(coordinates, n_points_soft: int = 5, smooth_soft: float =
         start = (coordinates[i][0], coordinates[i][1])
         end = (coordinates[i + 1][0], coordinates[i + 1][1])
 
+        # two samples per pixel are enough once truncated to pixels
+        samples = int(np.linalg.norm(np.array(end) - np.array(start)) * 2)
+
         # Generate human-like segment
-        segment_soft = generate_path(start, end, n_points_soft, smooth_soft)
+        segment_soft = generate_path(start, end, n_points_soft, smooth_soft, samples=samples)
 
         # Generate distorted segment
-        segment_distort = generate_path(start, end, n_points_distort, smooth_distort)
+        segment_distort = generate_path(start, end, n_points_distort, smooth_distort, samples=samples)
 
         # Combine the segments with frequency-based interpolation
-        combined_segment = []
-        for t in np.linspace(0, 1, len(segment_soft)):
-            interp_x = int((1 - t) * segment_distort[int(t * (len(segment_distort) - 1)), 0] + t * segment_soft[
-                int(t * (len(segment_soft) - 1)), 0])
-            interp_y = int((1 - t) * segment_distort[int(t * (len(segment_distort) - 1)), 1] + t * segment_soft[
-                int(t * (len(segment_soft) - 1)), 1])
-            if not combined_segment or (interp_x, interp_y) != combined_segment[-1]:
-                combined_segment.append((interp_x, interp_y))
-
-        combined_path.extend(combined_segment)
+        combined_path.extend(_dedupe(_combine(segment_soft, segment_distort)))
 
     return combined_path
+
+
+class PathLibrary:
+    """pre-generated, normalized path shapes (from ``(0, 0)`` to ``(1, 0)``), scaled and rotated per move.
+    Moving the pointer then doesn't need to generate a path at all.
+
+    .. code-block:: python
+
+        target.pointer.path_library = PathLibrary(size=128)
+
+    .. note::
+        the noise gets scaled along with the shape, a shape generated for ``reference_distance``
+        therefore is more (less) curvy for longer (shorter) moves
+
+    :param size: the number of shapes
+    :param reference_distance: the distance in pixels to generate the shapes for
+    :param n_points_soft: see :func:`gen_combined_path <selenium_driverless.scripts.geometry.gen_combined_path>`
+    :param smooth_soft: see :func:`gen_combined_path <selenium_driverless.scripts.geometry.gen_combined_path>`
+    :param n_points_distort: see :func:`gen_combined_path <selenium_driverless.scripts.geometry.gen_combined_path>`
+    :param smooth_distort: see :func:`gen_combined_path <selenium_driverless.scripts.geometry.gen_combined_path>`
+    :param samples: the number of points per shape
+    """
+
+    def __init__(self, size: int = 64, reference_distance: float = 500, n_points_soft: int = 5,
+                 smooth_soft: float = 20, n_points_distort: int = 100, smooth_distort: float = 0.4,
+                 samples: int = 2000):
+        end = (reference_distance, 0)
+        self.shapes: typing.List[np.ndarray] = []
+        for _ in range(size):
+            segment_soft = generate_path((0, 0), end, n_points_soft, smooth_soft, samples=samples)
+            segment_distort = generate_path((0, 0), end, n_points_distort, smooth_distort, samples=samples)
+            self.shapes.append(_combine(segment_soft, segment_distort) / reference_distance)
+
+    def path(self, start, end) -> typing.List[typing.Tuple[int, int]]:
+        """a path from start to end, using a random shape
+
+        :param start: the start point
+        :param end: the end point
+        """
+        shape = random.choice(self.shapes)
+        start = np.asarray(start, dtype=float)
+        direction = np.asarray(end, dtype=float) - start
+        # along the direction, and perpendicular to it
+        normal = np.array([-direction[1], direction[0]])
+        points = start + shape[:, :1] * direction + shape[:, 1:] * normal
+        path = _dedupe(points)
+        path[-1] = tuple(np.asarray(end).astype(int).tolist())
+        return path
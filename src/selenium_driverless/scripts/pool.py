@@ -0,0 +1,300 @@
+import asyncio
+import os
+import typing
+import warnings
+
+from cdp_socket.exceptions import CDPError
+
+from selenium_driverless import EXC_HANDLER
+from selenium_driverless.types.options import Options as ChromeOptions
+from selenium_driverless.utils.utils import safe_wrap_fut
+from selenium_driverless.webdriver import Chrome
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def process_rss(pid: int) -> typing.Optional[int]:
+    """the resident set size in bytes of a process including its children, ``None`` if it can't be determined
+
+    .. note::
+        uses `psutil <https://github.com/giampaolo/psutil>`_ if installed, ``/proc`` on linux otherwise
+    """
+    if psutil is not None:
+        try:
+            proc = psutil.Process(pid)
+            procs = [proc, *proc.children(recursive=True)]
+        except psutil.Error:
+            return None
+        rss = 0
+        for proc in procs:
+            try:
+                rss += proc.memory_info().rss
+            except psutil.Error:
+                pass
+        return rss
+    if not os.path.isdir("/proc"):
+        return None
+    # chrome is started within its own process group
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    rss = 0
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "rb") as f:
+                stat = f.read()
+            # fields after the executable name in parentheses, which might contain spaces
+            fields = stat[stat.rindex(b")") + 2:].split()
+            if int(fields[2]) != pid:
+                continue
+            with open(f"/proc/{entry}/statm", "rb") as f:
+                rss += int(f.read().split()[1]) * page_size
+        except (OSError, ValueError, IndexError):
+            pass
+    return rss
+
+
+class ChromePool:
+    """a pool of pre-started browsers, handing out leases which reset the browser on return
+
+    .. code-block:: python
+
+        from selenium_driverless.scripts.pool import ChromePool
+
+        async with ChromePool(size=4, max_uses=50) as pool:
+            async with pool.lease() as driver:
+                await driver.get("https://example.com")
+
+    :param size: the number of browsers to keep started
+    :param options: a callable returning new :class:`ChromeOptions <selenium_driverless.types.options.Options>` for each browser, as options can't be reused
+    :param max_uses: recycle a browser after it has been leased this many times
+    :param max_rss: recycle a browser once its memory usage (resident set size) exceeds this amount of bytes
+    :param respawn_retries: how often to retry starting a browser to replace a recycled one.
+        If it still fails, the error is raised to the next :func:`ChromePool.acquire <selenium_driverless.scripts.pool.ChromePool.acquire>` call
+    :param respawn_backoff: the delay in seconds before the first retry, doubled for each further one
+    :param chrome_kwargs: additional keyword-arguments for :class:`Chrome <selenium_driverless.webdriver.Chrome>`
+    """
+
+    def __init__(self, size: int = 2, options: typing.Callable[[], ChromeOptions] = None,
+                 max_uses: typing.Optional[int] = None, max_rss: typing.Optional[int] = None,
+                 respawn_retries: int = 3, respawn_backoff: float = 1, **chrome_kwargs) -> None:
+        if size < 1:
+            raise ValueError("size has to be at least 1")
+        self._size = size
+        self._options_factory = options
+        self._max_uses = max_uses
+        self._max_rss = max_rss
+        self._respawn_retries = respawn_retries
+        self._respawn_backoff = respawn_backoff
+        self._rss_warned = False
+        self._chrome_kwargs = chrome_kwargs
+
+        self._idle: typing.Optional[asyncio.Queue] = None
+        self._drivers: typing.Set[Chrome] = set()
+        self._uses: typing.Dict[Chrome, int] = {}
+        self._started = False
+        self._closed = False
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __await__(self):
+        return self.start().__await__()
+
+    @property
+    def size(self) -> int:
+        """the number of browsers kept started"""
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        """the number of browsers ready to be leased, including slots a browser failed to start for"""
+        if self._idle is None:
+            return 0
+        return self._idle.qsize()
+
+    async def start(self):
+        """start all browsers of the pool"""
+        if not self._started:
+            self._idle = asyncio.Queue()
+            self._started = True
+            await asyncio.gather(*[self._spawn() for _ in range(self._size)])
+        return self
+
+    async def _spawn(self) -> None:
+        options = self._options_factory() if self._options_factory else None
+        driver = Chrome(options=options, **self._chrome_kwargs)
+        try:
+            await driver.start_session()
+        except Exception as e:
+            if self._closed:
+                return
+            raise e
+        if self._closed:
+            await self._quit(driver)
+            return
+        self._drivers.add(driver)
+        self._uses[driver] = 0
+        self._idle.put_nowait(driver)
+
+    async def _respawn(self) -> None:
+        for retry in range(self._respawn_retries + 1):
+            if retry:
+                await asyncio.sleep(self._respawn_backoff * 2 ** (retry - 1))
+            try:
+                await self._spawn()
+                return
+            except Exception as e:
+                if self._closed:
+                    return
+                if retry < self._respawn_retries:
+                    EXC_HANDLER(e)
+                else:
+                    # hand the slot to a waiting acquire(), which raises it and retries
+                    self._idle.put_nowait(e)
+
+    async def acquire(self, timeout: typing.Optional[float] = None) -> Chrome:
+        """get an idle browser, waits for one to be available
+
+        :param timeout: the maximum time in seconds to wait for a browser
+        """
+        if not self._started:
+            await self.start()
+        if self._closed:
+            raise RuntimeError("pool has been closed already")
+        try:
+            driver = await asyncio.wait_for(self._idle.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(f"no browser available within {timeout} seconds")
+        if isinstance(driver, Exception):
+            # starting a browser for this slot failed
+            safe_wrap_fut(self._respawn())
+            raise driver
+        self._uses[driver] += 1
+        return driver
+
+    async def release(self, driver: Chrome, recycle: bool = False) -> None:
+        """return a leased browser to the pool.
+        Closes extra tabs, clears cookies and disposes incognito contexts, or recycles the browser.
+
+        :param driver: the browser to return
+        :param recycle: whether to quit the browser and start a new one instead of reusing it
+        """
+        if driver not in self._drivers:
+            raise ValueError(f"{driver} isn't part of the pool")
+        if self._closed:
+            self._drivers.discard(driver)
+            await self._quit(driver)
+            return
+        if not recycle:
+            recycle = self._needs_recycle(driver)
+        if not recycle:
+            try:
+                await self._reset(driver)
+            except Exception as e:
+                EXC_HANDLER(e)
+                recycle = True
+        if recycle:
+            self._drivers.discard(driver)
+            del self._uses[driver]
+            safe_wrap_fut(self._quit(driver))
+            safe_wrap_fut(self._respawn())
+        else:
+            self._idle.put_nowait(driver)
+
+    def lease(self, timeout: typing.Optional[float] = None) -> "Lease":
+        """lease a browser, returned to the pool on exit
+
+        .. code-block:: python
+
+            async with pool.lease() as driver:
+                await driver.get("https://example.com")
+
+        :param timeout: the maximum time in seconds to wait for a browser
+        """
+        return Lease(self, timeout=timeout)
+
+    def _needs_recycle(self, driver: Chrome) -> bool:
+        if self._max_uses is not None and self._uses[driver] >= self._max_uses:
+            return True
+        if self._max_rss is not None and driver.browser_pid:
+            rss = process_rss(driver.browser_pid)
+            if rss is None:
+                if not self._rss_warned:
+                    self._rss_warned = True
+                    warnings.warn("couldn't determine memory usage, install psutil to recycle on max_rss")
+            elif rss > self._max_rss:
+                return True
+        return False
+
+    @staticmethod
+    async def _quit(driver: Chrome) -> None:
+        # noinspection PyProtectedMember
+        await driver.quit(clean_dirs=driver._options.auto_clean_dirs)
+
+    @staticmethod
+    async def _reset(driver: Chrome) -> None:
+        # dispose incognito contexts
+        for context in list(driver._contexts.values()):
+            # noinspection PyProtectedMember
+            if context._is_incognito:
+                context_id = context.context_id
+                await context.quit()
+                try:
+                    await driver.base_target.execute_cdp_cmd("Target.disposeBrowserContext",
+                                                             {"browserContextId": context_id})
+                except CDPError as e:
+                    # already disposed
+                    if not e.message.startswith("Failed to find context with id"):
+                        raise e
+
+        # close extra tabs
+        base_context = driver.base_context
+        driver._current_context = base_context
+        tabs = await base_context.get_targets(_type="page")
+        tabs = [info.Target for info in tabs.values() if not info.url.startswith("chrome-extension://")]
+        keep = base_context.current_target
+        if keep.id not in [tab.id for tab in tabs]:
+            keep = tabs[0]
+        await asyncio.gather(*[tab.close() for tab in tabs if tab.id != keep.id])
+        await base_context.switch_to.target(keep, focus=False)
+        await keep.get("about:blank")
+        await keep.delete_all_cookies()
+
+    async def close(self) -> None:
+        """quit all browsers of the pool"""
+        self._closed = True
+        drivers = list(self._drivers)
+        self._drivers.clear()
+        self._uses.clear()
+        await asyncio.gather(*[self._quit(driver) for driver in drivers], return_exceptions=True)
+
+
+class Lease:
+    """a browser leased from :class:`ChromePool <selenium_driverless.scripts.pool.ChromePool>`"""
+
+    def __init__(self, pool: ChromePool, timeout: typing.Optional[float] = None):
+        self._pool = pool
+        self._timeout = timeout
+        self._driver: typing.Optional[Chrome] = None
+
+    @property
+    def driver(self) -> typing.Optional[Chrome]:
+        """the leased browser"""
+        return self._driver
+
+    async def __aenter__(self) -> Chrome:
+        self._driver = await self._pool.acquire(timeout=self._timeout)
+        return self._driver
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        driver = self._driver
+        self._driver = None
+        await self._pool.release(driver)
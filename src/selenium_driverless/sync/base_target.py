@@ -8,12 +8,14 @@ class BaseTarget(AsyncBaseTarget):
     # noinspection PyShadowingBuiltins
     def __init__(self, host: str, is_remote: bool = False,
                  loop: asyncio.AbstractEventLoop or None = None, timeout: float = 30,
-                 max_ws_size: int = 2 ** 20) -> None:
+                 max_ws_size: int = 2 ** 20, flatten: bool = False, codec=None,
+                 pipe=None, metrics=None, record=None, replay=None) -> None:
         if not loop:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
         self._loop = loop
-        super().__init__(host=host, is_remote=is_remote, loop=loop, timeout=timeout, max_ws_size=max_ws_size)
+        super().__init__(host=host, is_remote=is_remote, loop=loop, timeout=timeout, max_ws_size=max_ws_size,
+                         flatten=flatten, codec=codec, pipe=pipe, metrics=metrics, record=record, replay=replay)
 
     def __exit__(self, *args, **kwargs):
         return self.__aexit__(*args, **kwargs)
@@ -0,0 +1,28 @@
+import asyncio
+import inspect
+
+from selenium_driverless.types.dom_mirror import DomMirror as AsyncDomMirror
+
+
+class DomMirror(AsyncDomMirror):
+    def __init__(self, target, loop: asyncio.AbstractEventLoop = None):
+        if not loop:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+        self._loop = loop
+        super().__init__(target=target)
+
+    def __getattribute__(self, item):
+        res = super().__getattribute__(item)
+        if res is None or item == "_loop":
+            return res
+        loop = self._loop
+        if loop and (not loop.is_running()):
+            if inspect.iscoroutinefunction(res):
+                def syncified(*args, **kwargs):
+                    return self._loop.run_until_complete(res(*args, **kwargs))
+
+                return syncified
+            if inspect.isawaitable(res):
+                return self._loop.run_until_complete(res)
+        return res
@@ -0,0 +1,55 @@
+import asyncio
+import inspect
+
+from selenium_driverless.input.scheduler import InputScheduler as AsyncInputScheduler, InputBatch as AsyncInputBatch
+
+
+class InputBatch(AsyncInputBatch):
+    def __init__(self, timeout: float = 10, loop: asyncio.AbstractEventLoop = None):
+        if not loop:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+        self._loop = loop
+        super().__init__(timeout=timeout)
+
+    def __getattribute__(self, item):
+        res = super().__getattribute__(item)
+        if res is None or item == "_loop":
+            return res
+        loop = self._loop
+        if loop and (not loop.is_running()):
+            if inspect.iscoroutinefunction(res):
+                def syncified(*args, **kwargs):
+                    return self._loop.run_until_complete(res(*args, **kwargs))
+
+                return syncified
+            if inspect.isawaitable(res):
+                return self._loop.run_until_complete(res)
+        return res
+
+
+class InputScheduler(AsyncInputScheduler):
+    def __init__(self, target, timeout: float = 10, history: int = 4096, loop: asyncio.AbstractEventLoop = None):
+        if not loop:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+        self._loop = loop
+        super().__init__(target=target, timeout=timeout, history=history)
+
+    def __getattribute__(self, item):
+        res = super().__getattribute__(item)
+        if res is None or item == "_loop":
+            return res
+        loop = self._loop
+        if loop and (not loop.is_running()):
+            if inspect.iscoroutinefunction(res):
+                def syncified(*args, **kwargs):
+                    return self._loop.run_until_complete(res(*args, **kwargs))
+
+                return syncified
+            if inspect.isawaitable(res):
+                return self._loop.run_until_complete(res)
+        return res
+
+    def batch(self) -> InputBatch:
+        return InputBatch(timeout=self.timeout, loop=self._loop)
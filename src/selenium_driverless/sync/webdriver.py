@@ -7,8 +7,10 @@ from selenium_driverless.webdriver import Chrome as AsyncDriver
 
 class Chrome(AsyncDriver):
     def __init__(self, options: ChromeOptions = None, loop: asyncio.AbstractEventLoop = None,
-                 debug=False, max_ws_size: int = 2 ** 20):
-        super().__init__(options=options, debug=debug, max_ws_size=max_ws_size)
+                 debug=False, max_ws_size: int = 2 ** 20, flatten: bool = False, codec=None,
+                 metrics=None, record: str = None, replay: str = None):
+        super().__init__(options=options, debug=debug, max_ws_size=max_ws_size, flatten=flatten, codec=codec,
+                         metrics=metrics, record=record, replay=replay)
         if not loop:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
@@ -21,8 +23,8 @@ class Chrome(AsyncDriver):
     def __exit__(self, *args, **kwargs):
         self.__aexit__(*args, **kwargs)
 
-    async def quit(self, timeout: float = 30, clean_dirs: bool = True):
-        await super().quit(timeout=timeout, clean_dirs=clean_dirs)
+    async def quit(self, timeout: float = 30, clean_dirs: bool = True, fast: bool = None):
+        await super().quit(timeout=timeout, clean_dirs=clean_dirs, fast=fast)
 
     def __getattribute__(self, item):
         res = super().__getattribute__(item)
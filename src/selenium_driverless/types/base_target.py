@@ -5,13 +5,23 @@ import typing
 import aiohttp
 import websockets
 from cdp_socket.exceptions import CDPError
-from cdp_socket.socket import SingleCDPSocket
+
+from selenium_driverless.types.connection import Connection, Session, PipeConnection
+from selenium_driverless.types.replay import CDPRecorder, ReplayConnection
+from selenium_driverless.types.target_registry import TargetRegistry
+from selenium_driverless.utils.codec import Codec, get_codec
+from selenium_driverless.utils.metrics import CDPMetrics
 
 
 class BaseTarget:
     """the baseTarget for the ChromeInstance
     represents a connection to the whole browser.
 
+    :param pipe: ``(read_fd, write_fd)`` to connect over ``--remote-debugging-pipe`` instead of a websocket at ``host``
+    :param metrics: record metrics for all CDP traffic, ``True`` or an instance of :class:`CDPMetrics <selenium_driverless.utils.metrics.CDPMetrics>`
+    :param record: a file to record all CDP frames to, see :class:`CDPRecorder <selenium_driverless.types.replay.CDPRecorder>`
+    :param replay: a recording to play back instead of connecting to chrome, see :class:`ReplayConnection <selenium_driverless.types.replay.ReplayConnection>`
+
     .. note::
         commands executed on BaseTarget usually are on a global scope over the whole Chrome instance.
         unfortunately, not all are supported
@@ -21,8 +31,22 @@ class BaseTarget:
     # noinspection PyMissingConstructor
     def __init__(self, host: str, is_remote: bool = False,
                  loop: asyncio.AbstractEventLoop or None = None, timeout: float = 30,
-                 max_ws_size: int = 2 ** 20) -> None:
+                 max_ws_size: int = 2 ** 20, flatten: bool = False,
+                 codec: typing.Union[str, Codec, None] = None,
+                 pipe: typing.Optional[typing.Tuple[int, int]] = None,
+                 metrics: typing.Union[bool, CDPMetrics, None] = None,
+                 record: typing.Optional[str] = None, replay: typing.Optional[str] = None) -> None:
         self._socket = None
+        self._record = record
+        self._replay = replay
+        if metrics is True:
+            metrics = CDPMetrics()
+        self._metrics: typing.Optional[CDPMetrics] = metrics or None
+        self._pipe = pipe
+        # targets can only be reached over flattened sessions with --remote-debugging-pipe,
+        # recordings only cover a single connection
+        self._flatten = flatten or (pipe is not None) or bool(record) or bool(replay)
+        self._codec = get_codec(codec)
 
         self._is_remote = is_remote
         self._host = host
@@ -33,6 +57,7 @@ class BaseTarget:
         self._timeout = timeout
         self._max_ws_size = max_ws_size
         self._downloads_paths = {}
+        self._registry = TargetRegistry(self)
 
     def __repr__(self):
         return f'<{type(self).__module__}.{type(self).__name__} (target_id="{self.id}", host="{self._host}")>'
@@ -46,10 +71,49 @@ class BaseTarget:
         return "BaseTarget"
 
     @property
-    def socket(self) -> SingleCDPSocket:
+    def socket(self) -> Connection:
         """the cdp-socket for the connection"""
         return self._socket
 
+    @property
+    def codec(self) -> Codec:
+        """the JSON codec used for CDP frames,
+        see :func:`get_codec <selenium_driverless.utils.codec.get_codec>`
+        """
+        return self._codec
+
+    @property
+    def metrics(self) -> typing.Optional[CDPMetrics]:
+        """metrics for all CDP traffic of the browser, ``None`` if not enabled,
+        see :class:`CDPMetrics <selenium_driverless.utils.metrics.CDPMetrics>`
+        """
+        return self._metrics
+
+    @property
+    def recorder(self) -> typing.Optional[CDPRecorder]:
+        """the recorder if recording, see :class:`CDPRecorder <selenium_driverless.types.replay.CDPRecorder>`"""
+        if self._socket is not None:
+            # noinspection PyProtectedMember
+            return self._socket._recorder
+
+    @property
+    def flatten(self) -> bool:
+        """whether targets attach over this connection using flattened sessions,
+        see :func:`BaseTarget.attach <selenium_driverless.types.base_target.BaseTarget.attach>`
+        """
+        return self._flatten
+
+    @property
+    def registry(self) -> TargetRegistry:
+        """the infos of all targets, kept current by events once started,
+        see :class:`TargetRegistry <selenium_driverless.types.target_registry.TargetRegistry>`
+
+        .. code-block:: python
+
+            registry = await driver.base_target.registry.start()
+        """
+        return self._registry
+
     async def __aenter__(self):
         await self._init()
         return self
@@ -67,7 +131,19 @@ class BaseTarget:
         return self._init().__await__()
 
     async def _init(self):
-        if not self._started:
+        recorder = CDPRecorder(self._record) if (self._record and not (self._started or self._replay)) else None
+        if not self._started and self._replay:
+            self._socket = await ReplayConnection(path=self._replay, timeout=self._timeout, loop=self._loop,
+                                                  max_size=self._max_ws_size, codec=self._codec,
+                                                  metrics=self._metrics)
+            self._started = True
+        elif not self._started and self._pipe:
+            read_fd, write_fd = self._pipe
+            self._socket = await PipeConnection(read_fd=read_fd, write_fd=write_fd, timeout=self._timeout,
+                                                loop=self._loop, max_size=self._max_ws_size, codec=self._codec,
+                                                metrics=self._metrics, recorder=recorder)
+            self._started = True
+        elif not self._started:
             start = time.perf_counter()
             url = f"http://{self._host}/json/version"
             while True:
@@ -80,8 +156,9 @@ class BaseTarget:
                     if (time.perf_counter() - start) > self._timeout:
                         raise asyncio.TimeoutError(
                             f"Couldn't connect to chrome within {self._timeout} seconds")
-            self._socket = await SingleCDPSocket(websock_url=_json["webSocketDebuggerUrl"], timeout=self._timeout,
-                                                 loop=self._loop, max_size=self._max_ws_size)
+            self._socket = await Connection(websock_url=_json["webSocketDebuggerUrl"], timeout=self._timeout,
+                                            loop=self._loop, max_size=self._max_ws_size, codec=self._codec,
+                                            metrics=self._metrics, recorder=recorder)
             self._started = True
         return self
 
@@ -96,6 +173,18 @@ class BaseTarget:
             else:
                 raise e
 
+    async def attach(self, target_id: str, timeout: float = 10) -> Session:
+        """attach to a target with ``Target.attachToTarget(flatten=True)``.
+        The returned session sends and receives over the browser-connection, routed by its ``sessionId``,
+        which avoids opening a websocket per target.
+
+        :param target_id: the ``Target.TargetID`` to attach to
+        :param timeout: timeout in seconds for attaching
+        """
+        if not self.socket:
+            await self._init()
+        return await self.socket.attach(target_id=target_id, timeout=timeout)
+
     async def wait_for_cdp(self, event: str, timeout: float or None = None):
         """wait for an event
         see :func:`Target.wait_for_cdp <selenium_driverless.types.target.Target.wait_for_cdp>` for reference
@@ -145,6 +234,21 @@ class BaseTarget:
         result = await self.socket.exec(method=cmd, params=cmd_args, timeout=timeout)
         return result
 
+    async def execute_cdp_batch(self, cmds: typing.Iterable[typing.Tuple[str, typing.Optional[dict]]],
+                                timeout: float or None = 10) -> typing.List[typing.Union[dict, Exception]]:
+        """Execute multiple independent Chrome Devtools Protocol commands within one round-trip
+        see :func:`Target.execute_cdp_batch <selenium_driverless.types.target.Target.execute_cdp_batch>` for reference
+        """
+        if not self.socket:
+            await self._init()
+        cmds = list(cmds)
+        for cmd, cmd_args in cmds:
+            if cmd == "Browser.setDownloadBehavior":
+                path = cmd_args.get("downloadPath")
+                if path:
+                    self._downloads_paths[cmd_args.get("browserContextId", "DEFAULT")] = path
+        return await self.socket.exec_batch(cmds, timeout=timeout)
+
     def downloads_dir_for_context(self, context_id: str = "DEFAULT") -> str:
         """get the default download directory for a specific context
 
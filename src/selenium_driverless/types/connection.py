@@ -0,0 +1,456 @@
+import asyncio
+import os
+import typing
+
+import websockets
+from cdp_socket.exceptions import CDPError, SocketExcitedError
+from cdp_socket.socket import SingleCDPSocket
+
+from selenium_driverless import EXC_HANDLER
+from selenium_driverless.utils.codec import Codec, get_codec
+from selenium_driverless.utils.metrics import CDPMetrics
+
+if typing.TYPE_CHECKING:
+    from selenium_driverless.types.replay import CDPRecorder
+
+
+class Connection(SingleCDPSocket):
+    """a connection to a devtools endpoint.
+
+    Behaves like :class:`cdp_socket.socket.SingleCDPSocket`, but additionally routes frames
+    of flattened sessions (see :func:`Connection.attach <selenium_driverless.types.connection.Connection.attach>`)
+    by their ``sessionId``.
+    """
+
+    def __init__(self, websock_url: str, timeout: float = 10, loop: asyncio.AbstractEventLoop = None,
+                 max_size: int = 2 ** 20, codec: typing.Union[str, Codec, None] = None,
+                 metrics: typing.Optional[CDPMetrics] = None, recorder=None):
+        super().__init__(websock_url=websock_url, timeout=timeout, loop=loop, max_size=max_size)
+        self._codec = get_codec(codec)
+        self._metrics = metrics
+        self._recorder: typing.Optional["CDPRecorder"] = recorder
+        self._sessions: typing.Dict[str, Session] = {}
+        self.add_listener("Target.detachedFromTarget", self._on_detached)
+
+    @property
+    def codec(self) -> Codec:
+        """the codec used for encoding and decoding frames"""
+        return self._codec
+
+    @property
+    def metrics(self) -> typing.Optional[CDPMetrics]:
+        """records metrics for all frames over this connection if set,
+        see :class:`CDPMetrics <selenium_driverless.utils.metrics.CDPMetrics>`
+        """
+        return self._metrics
+
+    @metrics.setter
+    def metrics(self, metrics: typing.Optional[CDPMetrics]):
+        self._metrics = metrics
+
+    @property
+    def sessions(self) -> typing.Dict[str, "Session"]:
+        """the currently attached sessions, by ``sessionId``"""
+        return self._sessions
+
+    async def attach(self, target_id: str, timeout: float = 10) -> "Session":
+        """attach to a target using ``Target.attachToTarget`` with ``flatten=True``.
+        The returned session sends and receives over this connection.
+
+        :param target_id: the ``Target.TargetID`` to attach to
+        :param timeout: timeout in seconds for attaching
+        """
+        session = Session(connection=self, target_id=target_id, timeout=timeout, loop=self._loop)
+        return await session.start_session(timeout=timeout)
+
+    async def send(self, method: str, params: dict = None):
+        return await self._send(method=method, params=params)
+
+    # noinspection PyTypeChecker
+    async def exec(self, method: str, params: dict = None, timeout: float = 2):
+        _id = await self.send(method=method, params=params)
+        return await self.wait_reply(_id, method=method, params=params, timeout=timeout)
+
+    # noinspection PyTypeChecker
+    async def wait_reply(self, _id: int, method: str = None, params: dict = None, timeout: float = 2):
+        """wait for the response to a command put on the wire with
+        :func:`Connection.send <selenium_driverless.types.connection.Connection.send>`
+
+        :param _id: the id returned by ``send``
+        :param method: the method, for the error message only
+        :param params: the params, for the error message only
+        :param timeout: timeout in seconds for the response to arrive
+        """
+        try:
+            return await asyncio.wait_for(self._responses[_id], timeout=timeout)
+        except asyncio.TimeoutError:
+            self._on_timeout(_id)
+            if self._task.done():
+                # task has excited
+                if self._exc:
+                    raise self._exc
+                # noinspection PyProtectedMember
+                elif self._task._exception:
+                    # noinspection PyProtectedMember
+                    raise self._task._exception
+                else:
+                    raise SocketExcitedError("socket coroutine excited without exception")
+            raise asyncio.TimeoutError(f'got no response for method: "{method}", params: {params}'
+                                       f"\nwithin {timeout} seconds")
+        finally:
+            try:
+                del self._responses[_id]
+            except KeyError:
+                pass
+
+    async def exec_batch(self, cmds: typing.Iterable[typing.Tuple[str, typing.Optional[dict]]],
+                         timeout: float = 10) -> typing.List[typing.Union[dict, Exception]]:
+        """send all commands at once and gather their responses afterwards.
+        Frames are written in order without waiting for any response in between.
+
+        :param cmds: an iterable of ``(method, params)``
+        :param timeout: timeout in seconds for all responses to arrive
+        :return: a result or exception (:class:`cdp_socket.exceptions.CDPError`, :class:`asyncio.TimeoutError`) for each command
+        """
+        cmds = list(cmds)
+        ids = []
+        for method, params in cmds:
+            ids.append(await self.send(method=method, params=params))
+        futs = [self._responses[_id] for _id in ids]
+        if futs:
+            await asyncio.wait(futs, timeout=timeout)
+        results = []
+        for (method, params), _id, fut in zip(cmds, ids, futs):
+            if fut.done():
+                results.append(fut.exception() or fut.result())
+            else:
+                fut.cancel()
+                self._on_timeout(_id)
+                results.append(asyncio.TimeoutError(f'got no response for method: "{method}", params: {params}'
+                                                    f"\nwithin {timeout} seconds"))
+            try:
+                del self._responses[_id]
+            except KeyError:
+                pass
+        return results
+
+    async def _send(self, method: str, params: dict = None, session_id: str = None) -> int:
+        _id = self._req_count
+        # increment before awaiting, concurrent sends would reuse the id otherwise
+        self._req_count += 1
+        _dict = {'id': _id, 'method': method}
+        if params:
+            _dict['params'] = params
+        if session_id:
+            _dict['sessionId'] = session_id
+        data = self._codec.dumps(_dict)
+        if self._recorder is not None:
+            self._recorder.record(">", data)
+        metrics = self._metrics
+        if metrics is not None:
+            metrics.command_start(id(self), _id, self._target_label(session_id), method, params, len(data))
+        await self._send_raw(data)
+        return _id
+
+    def _target_label(self, session_id: typing.Optional[str]) -> str:
+        if session_id is not None:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                return session._id
+            return session_id
+        return self._id
+
+    def _on_timeout(self, _id: int):
+        metrics = self._metrics
+        if metrics is not None:
+            metrics.command_end(id(self), _id, timeout=True)
+
+    async def _send_raw(self, data: str):
+        await self._ws.send(data)
+
+    async def load_json(self, data: typing.Union[str, bytes]) -> dict:
+        # decoded inline, an executor doesn't help as the GIL is held while decoding anyways
+        return self._codec.loads_frame(data)
+
+    async def _rec_coro(self):
+        try:
+            async for data in self._ws:
+                await self._on_frame(data)
+        except websockets.exceptions.ConnectionClosedError as e:
+            self._exc = e
+            for callback in self.on_closed:
+                await self._handle_callback(callback, code=e.code, reason=e.reason)
+            await self._close_sessions(code=e.code, reason=e.reason)
+        else:
+            await self._close_sessions(code=1000, reason="connection closed")
+        finally:
+            if self._recorder is not None:
+                self._recorder.close()
+
+    async def _on_frame(self, data: typing.Union[str, bytes]):
+        if self._recorder is not None:
+            self._recorder.record("<", data)
+        size = len(data)
+        try:
+            data = await self.load_json(data)
+        except Exception as e:
+            EXC_HANDLER(e)
+            data = {"method": "DecodeError", "params": {"e": e}}
+        session_id = data.get("sessionId")
+        metrics = self._metrics
+        if metrics is not None:
+            try:
+                _id = data.get("id")
+                if _id is None:
+                    metrics.event(self._target_label(session_id), data.get("method"), size)
+                else:
+                    err = data.get("error")
+                    metrics.command_end(id(self), _id, size, error=None if err is None else CDPError(error=err))
+            except Exception as e:
+                # never stop receiving
+                EXC_HANDLER(e)
+        if session_id is None:
+            await self._dispatch(data)
+        else:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                await session._dispatch(data)
+
+    async def _dispatch(self, data: dict):
+        err = data.get('error')
+        _id = data.get("id")
+        if err is None:
+            if _id is None:
+                method = data.get("method")
+                if not (self._events.get(method) or self._iter_callbacks.get(method)):
+                    # nobody listens, don't decode the params at all
+                    return
+                params = self._codec.decode_payload(data.get("params"))
+                for callback in list(self._events[method]):
+                    await self._handle_callback(callback, params)
+                for _iter_id, fut_result_setter in list(self._iter_callbacks[method].items()):
+                    try:
+                        fut_result_setter(params)
+                    except asyncio.InvalidStateError:
+                        pass  # callback got cancelled
+                    try:
+                        del self._iter_callbacks[method][_iter_id]
+                    except KeyError:
+                        pass
+            else:
+                try:
+                    self._responses[_id].set_result(self._codec.decode_payload(data["result"]))
+                except asyncio.InvalidStateError:
+                    try:
+                        del self._responses[_id]
+                    except KeyError:
+                        pass
+        else:
+            try:
+                self._responses[_id].set_exception(CDPError(error=err))
+            except asyncio.InvalidStateError:
+                try:
+                    del self._responses[_id]
+                except KeyError:
+                    pass
+
+    async def _on_detached(self, params: dict):
+        session = self._sessions.pop(params["sessionId"], None)
+        if session is not None:
+            await session._on_disconnected(code=1000, reason="detached")
+
+    async def _close_sessions(self, code: int, reason: str):
+        for session_id in list(self._sessions.keys()):
+            session = self._sessions.pop(session_id, None)
+            if session is not None:
+                await session._on_disconnected(code=code, reason=reason)
+
+    def __eq__(self, other):
+        if isinstance(other, SingleCDPSocket):
+            if self is other:
+                return True
+            if self._ws is None or other._ws is None:
+                return False
+            return self._ws.id == other._ws.id
+        return False
+
+    def __hash__(self):
+        return id(self)
+
+
+class Session(Connection):
+    """a flattened CDP session to a target, multiplexed over a :class:`Connection`
+
+    .. note::
+        usually created with :func:`BaseTarget.attach <selenium_driverless.types.base_target.BaseTarget.attach>`
+    """
+
+    def __init__(self, connection: Connection, target_id: str, timeout: float = 10,
+                 loop: asyncio.AbstractEventLoop = None):
+        super().__init__(websock_url=connection.ws_url, timeout=timeout, loop=loop, max_size=connection._max_size,
+                         codec=connection.codec)
+        self._connection = connection
+        self._id = target_id
+        self._session_id = None
+        self._detached = False
+
+    @property
+    def session_id(self) -> str:
+        """the ``Target.SessionID``"""
+        return self._session_id
+
+    @property
+    def connection(self) -> Connection:
+        """the connection this session is multiplexed over"""
+        return self._connection
+
+    async def start_session(self, timeout: float = 10):
+        res = await self._connection.exec("Target.attachToTarget", {"targetId": self._id, "flatten": True},
+                                          timeout=timeout)
+        self._session_id = res["sessionId"]
+        # noinspection PyProtectedMember
+        self._connection._sessions[self._session_id] = self
+        # noinspection PyProtectedMember
+        self._task = self._connection._task
+        return self
+
+    async def attach(self, target_id: str, timeout: float = 10) -> "Session":
+        return await self._connection.attach(target_id=target_id, timeout=timeout)
+
+    async def _send(self, method: str, params: dict = None, session_id: str = None) -> int:
+        # noinspection PyProtectedMember
+        return await self._connection._send(method=method, params=params, session_id=self._session_id)
+
+    @property
+    def metrics(self) -> typing.Optional[CDPMetrics]:
+        return self._connection.metrics
+
+    @metrics.setter
+    def metrics(self, metrics: typing.Optional[CDPMetrics]):
+        self._connection.metrics = metrics
+
+    def _on_timeout(self, _id: int):
+        # noinspection PyProtectedMember
+        self._connection._on_timeout(_id)
+
+    async def _on_detached(self, params: dict):
+        # nested sessions are registered at the root connection as well
+        # noinspection PyProtectedMember
+        await self._connection._on_detached(params)
+
+    async def _on_disconnected(self, code: int, reason: str):
+        if not self._detached:
+            self._detached = True
+            for callback in self.on_closed:
+                await self._handle_callback(callback, code=code, reason=reason)
+
+    async def close(self, code: int = 1000, reason: str = ''):
+        if not self.closed:
+            try:
+                await self._connection.exec("Target.detachFromTarget", {"sessionId": self._session_id},
+                                            timeout=self._timeout)
+            except CDPError as e:
+                if not (e.code == -32602 and e.message.startswith("No session with given id")):
+                    raise e
+            except websockets.ConnectionClosedError:
+                pass
+            # noinspection PyProtectedMember
+            self._connection._sessions.pop(self._session_id, None)
+            await self._on_disconnected(code=code, reason=reason)
+
+    @property
+    def closed(self):
+        return self._detached or self._connection.closed
+
+    def __eq__(self, other):
+        if isinstance(other, Session):
+            return self._session_id == other._session_id
+        return False
+
+    def __hash__(self):
+        return id(self)
+
+
+def dup_pipe_fds(read_fd: int, write_fd: int):
+    """make ``read_fd`` and ``write_fd`` available as fd 3 and 4 in the child process,
+    as expected by ``--remote-debugging-pipe``. Call within ``preexec_fn`` of :class:`subprocess.Popen`,
+    with ``pass_fds=(3, 4)`` and ``close_fds=True``
+    """
+    import fcntl
+    # move out of the way first, read_fd or write_fd might be 3 or 4 already.
+    # The copies are close-on-exec, dup2 clears the flag for 3 and 4 only
+    read_fd = fcntl.fcntl(read_fd, fcntl.F_DUPFD_CLOEXEC, 5)
+    write_fd = fcntl.fcntl(write_fd, fcntl.F_DUPFD_CLOEXEC, 5)
+    os.dup2(read_fd, 3)
+    os.dup2(write_fd, 4)
+
+
+class PipeConnection(Connection):
+    """a connection to chrome launched with ``--remote-debugging-pipe``,
+    speaking null-delimited CDP over pipes.
+
+    .. note::
+        only the browser-target is exposed, targets have to be attached using flattened sessions
+    """
+
+    def __init__(self, read_fd: int, write_fd: int, timeout: float = 10, loop: asyncio.AbstractEventLoop = None,
+                 max_size: int = 2 ** 20, codec: typing.Union[str, Codec, None] = None,
+                 metrics: typing.Optional[CDPMetrics] = None, recorder=None):
+        super().__init__(websock_url="pipe://browser", timeout=timeout, loop=loop, max_size=max_size, codec=codec,
+                         metrics=metrics, recorder=recorder)
+        self._read_fd = read_fd
+        self._write_fd = write_fd
+        self._reader: typing.Optional[asyncio.StreamReader] = None
+        self._writer: typing.Optional[asyncio.StreamWriter] = None
+        self._read_transport = None
+        self._closed = False
+
+    async def start_session(self, timeout: float = 10):
+        self._reader = asyncio.StreamReader(limit=self._max_size)
+        self._read_transport, _ = await self._loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(self._reader), os.fdopen(self._read_fd, "rb", buffering=0))
+        # noinspection PyUnresolvedReferences
+        transport, protocol = await self._loop.connect_write_pipe(asyncio.streams.FlowControlMixin,
+                                                                  os.fdopen(self._write_fd, "wb", buffering=0))
+        self._writer = asyncio.StreamWriter(transport, protocol, None, self._loop)
+        self._task = self._loop.create_task(self._rec_coro())
+        self._task.add_done_callback(self._exc_handler)
+        return self
+
+    async def _send_raw(self, data: str):
+        if self._closed:
+            raise ConnectionResetError("pipe has been closed")
+        self._writer.write(data.encode("utf-8") + b"\0")
+        await self._writer.drain()
+
+    async def _rec_coro(self):
+        while True:
+            try:
+                data = await self._reader.readuntil(b"\0")
+            except asyncio.IncompleteReadError:
+                break
+            await self._on_frame(data[:-1])
+        if not self._closed:
+            # the browser closed the pipe
+            self._closed = True
+            for callback in self.on_closed:
+                await self._handle_callback(callback, code=1006, reason="pipe closed")
+        await self._close_sessions(code=1000, reason="connection closed")
+        if self._recorder is not None:
+            self._recorder.close()
+
+    async def close(self, code: int = 1000, reason: str = ''):
+        if not self._closed:
+            self._closed = True
+            self._writer.close()
+            self._read_transport.close()
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def __eq__(self, other):
+        return self is other
+
+    def __hash__(self):
+        return id(self)
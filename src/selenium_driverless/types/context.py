@@ -41,7 +41,7 @@ from selenium_driverless.sync.switch_to import SwitchTo as SyncSwitchTo
 # targets
 from selenium_driverless.types.base_target import BaseTarget
 from selenium_driverless.types.target import Target, TargetInfo
-from selenium_driverless.scripts.driver_utils import get_targets, get_target
+from selenium_driverless.scripts.driver_utils import get_targets, make_target
 
 # other
 from selenium_driverless.input.pointer import Pointer
@@ -131,8 +131,15 @@ class Context:
     async def get_targets(self, _type: str = None, context_id="self") -> typing.Dict[str, TargetInfo]:
         if context_id == "self":
             context_id = self.context_id
-        return await get_targets(cdp_exec=self.base_target.execute_cdp_cmd, target_getter=self.get_target, _type=_type,
-                                 context_id=context_id, max_ws_size=self._max_ws_size)
+        registry = self.base_target.registry
+        if registry.started:
+            # targets which got destroyed before ever being connected to
+            for _id, target in list(self._targets.items()):
+                if target.socket is None and registry.get(_id) is None:
+                    del self._targets[_id]
+        return await get_targets(cdp_exec=self.base_target.execute_cdp_cmd, target_getter=self._get_target, _type=_type,
+                                 context_id=context_id, max_ws_size=self._max_ws_size,
+                                 registry=self.base_target.registry)
 
     @property
     def current_target(self) -> Target:
@@ -148,15 +155,19 @@ class Context:
         return await self.current_target._isolated_context_id
 
     async def get_target(self, target_id: str = None, timeout: float = 2, max_ws_size: int = None) -> Target:
-        if not max_ws_size:
-            max_ws_size = self._max_ws_size
         if not target_id:
             return self._current_target
+        return await self._get_target(target_id=target_id, timeout=timeout, max_ws_size=max_ws_size)
+
+    def _get_target(self, target_id: str, timeout: float = 2, max_ws_size: int = None) -> Target:
+        # creates the Target without connecting to it
+        if not max_ws_size:
+            max_ws_size = self._max_ws_size
         target: Target = self._targets.get(target_id)
         if not target:
-            target: Target = await get_target(target_id=target_id, host=self._host,
-                                              loop=self._loop, is_remote=self._is_remote, timeout=timeout,
-                                              max_ws_size=max_ws_size, driver=self._driver, context=self)
+            target: Target = make_target(target_id=target_id, host=self._host,
+                                         loop=self._loop, is_remote=self._is_remote, timeout=timeout,
+                                         max_ws_size=max_ws_size, driver=self._driver, context=self)
             self._targets[target_id] = target
 
             # noinspection PyUnusedLocal
@@ -253,17 +264,18 @@ class Context:
         target = self.current_target
         return target.pointer
 
-    async def send_keys(self, text: str):
+    async def send_keys(self, text: typing.Union[str, typing.Iterable[str]], timing=None):
         """
         send text & keys to the current target
 
-        :param text: the text to send
+        :param text: the text to send, see :func:`Target.send_keys <selenium_driverless.types.target.Target.send_keys>`
+        :param timing: the timing model, see :func:`Target.send_keys <selenium_driverless.types.target.Target.send_keys>`
         """
-        await self.current_target.send_keys(text)
+        await self.current_target.send_keys(text, timing=timing)
 
     async def execute_raw_script(self, script: str, *args, await_res: bool = False, serialization: str = None,
                                  max_depth: int = None, timeout: float = 2,
-                                 execution_context_id: str = None, unique_context: bool = True):
+                                 execution_context_id: str = None, unique_context: bool = True, plain: bool = False):
         """
         example:
         script= "function(...arguments){obj.click()}"
@@ -272,11 +284,11 @@ class Context:
         return await self.current_target.execute_raw_script(script, *args, await_res=await_res,
                                                serialization=serialization, max_depth=max_depth,
                                                timeout=timeout, execution_context_id=execution_context_id,
-                                               unique_context=unique_context)
+                                               unique_context=unique_context, plain=plain)
 
     async def execute_script(self, script: str, *args, max_depth: int = 2, serialization: str = None,
                              timeout: float = 2, execution_context_id: str = None,
-                             unique_context: bool = True):
+                             unique_context: bool = True, plain: bool = False):
         """executes JavaScript synchronously on ``GlobalThis`` such as
 
         .. code-block:: js
@@ -287,12 +299,23 @@ class Context:
         """
         return await self.current_target.execute_script(script, *args, max_depth=max_depth, serialization=serialization,
                                                         timeout=timeout, execution_context_id=execution_context_id,
-                                                        unique_context=unique_context)
+                                                        unique_context=unique_context, plain=plain)
+
+    async def execute_script_many(self, script: str, elements: typing.Iterable[WebElement], *args,
+                                  max_depth: int = 2, serialization: str = None, timeout: float = 10,
+                                  plain: bool = False) -> list:
+        """executes JavaScript synchronously for multiple elements, with a single call per frame
+
+        see :func:`Target.execute_script_many <selenium_driverless.types.target.Target.execute_script_many>`
+        """
+        return await self.current_target.execute_script_many(script, elements, *args, max_depth=max_depth,
+                                                             serialization=serialization, timeout=timeout,
+                                                             plain=plain)
 
     async def execute_async_script(self, script: str, *args, max_depth: int = 2,
                                    serialization: str = None, timeout: float = 2,
                                    execution_context_id: str = None,
-                                   unique_context: bool = True):
+                                   unique_context: bool = True, plain: bool = False):
         """executes JavaScript asynchronously on ``GlobalThis`` such as
 
         .. warning::
@@ -309,12 +332,12 @@ class Context:
                                                               serialization=serialization,
                                                               timeout=timeout,
                                                               execution_context_id=execution_context_id,
-                                                              unique_context=unique_context)
+                                                              unique_context=unique_context, plain=plain)
 
     async def eval_async(self, script: str, *args, max_depth: int = 2,
                          serialization: str = None, timeout: float = 2,
                          execution_context_id: str = None,
-                         unique_context: bool = True):
+                         unique_context: bool = True, plain: bool = False):
         """executes JavaScript asynchronously on ``GlobalThis`` such as
 
         .. code-block:: js
@@ -329,7 +352,7 @@ class Context:
         return await self.current_target.eval_async(script, *args, max_depth=max_depth, serialization=serialization,
                                                     timeout=timeout,
                                                     execution_context_id=execution_context_id,
-                                                    unique_context=unique_context)
+                                                    unique_context=unique_context, plain=plain)
 
     @property
     async def current_url(self) -> str:
@@ -393,17 +416,41 @@ class Context:
                     EXC_HANDLER(e)
             else:
                 targets = await self.targets
-                for target in list(targets.values()):
+
+                async def close(info: TargetInfo):
                     # noinspection PyUnresolvedReferences
                     try:
-                        target = target.Target
-                        await target.close(timeout=7)
-                        check_timeout(start_monotonic, timeout)
+                        await info.Target.close(timeout=7)
                     except websockets.exceptions.InvalidStatusCode:
                         # already closed
                         pass
                     except ConnectionAbortedError:
                         pass
+
+                async def close_unconnected(infos: typing.List[TargetInfo]):
+                    # no need to connect just to close them
+                    results = await self.base_target.execute_cdp_batch(
+                        [("Target.closeTarget", {"targetId": info.id}) for info in infos], timeout=7)
+                    for result in results:
+                        if isinstance(result, Exception) and not isinstance(result, asyncio.TimeoutError):
+                            EXC_HANDLER(result)
+
+                connected = []
+                unconnected = []
+                for info in list(targets.values()):
+                    # noinspection PyProtectedMember
+                    target = info._target
+                    if isinstance(target, Target) and target.socket:
+                        connected.append(info)
+                    else:
+                        unconnected.append(info)
+
+                # independent of each other
+                coros = [close(info) for info in connected]
+                if unconnected:
+                    coros.append(close_unconnected(unconnected))
+                await asyncio.gather(*coros)
+                check_timeout(start_monotonic, timeout)
             for callback in self._closed_callbacks:
                 res = callback()
                 if inspect.isawaitable(res):
@@ -603,6 +650,15 @@ class Context:
         target = await self.get_target()
         return await target.find_element(by=by, value=value, timeout=timeout)
 
+    async def wait_for_element(self, by: str, value: str, timeout: float or None = 10,
+                               state: typing.Literal["attached", "visible"] = "attached") -> WebElement:
+        """wait for an element in the current target, without polling
+
+        see :func:`Target.wait_for_element <selenium_driverless.types.target.Target.wait_for_element>`
+        """
+        target = await self.get_target()
+        return await target.wait_for_element(by=by, value=value, timeout=timeout, state=state)
+
     async def find_elements(self, by: str, value: str, timeout: float = 3) -> typing.List[WebElement]:
         """find multiple elements in the current target
 
@@ -864,6 +920,22 @@ class Context:
             if e.code == -32000 and e.message == 'Not allowed':
                 return await self.base_target.execute_cdp_cmd(cmd=cmd, cmd_args=cmd_args, timeout=timeout)
 
+    async def execute_cdp_batch(self, cmds: typing.Iterable[typing.Tuple[str, typing.Optional[dict]]],
+                                timeout: float or None = 10) -> typing.List[typing.Union[dict, Exception]]:
+        """Execute multiple independent Chrome Devtools Protocol commands on the current target within one round-trip.
+        Commands which failed with ``message:'Not allowed'`` are re-executed on :class:`BaseTarget <selenium_driverless.types.base_target.BaseTarget>`
+        see :func:`Target.execute_cdp_batch <selenium_driverless.types.target.Target.execute_cdp_batch>` for reference
+        """
+        cmds = list(cmds)
+        results = await self.current_target.execute_cdp_batch(cmds, timeout=timeout)
+        not_allowed = [idx for idx, result in enumerate(results)
+                       if isinstance(result, CDPError) and result.code == -32000 and result.message == 'Not allowed']
+        if not_allowed:
+            retried = await self.base_target.execute_cdp_batch([cmds[idx] for idx in not_allowed], timeout=timeout)
+            for idx, result in zip(not_allowed, retried):
+                results[idx] = result
+        return results
+
     async def fetch(self, *args, **kwargs) -> dict:
         """
         executes a JS ``fetch`` request within the current target
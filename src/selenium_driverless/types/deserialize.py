@@ -1,4 +1,5 @@
 import asyncio
+import typing
 import warnings
 from cdp_socket.exceptions import CDPError
 
@@ -64,20 +65,16 @@ class JSRemoteObj:
     async def __isolated_exec_id__(self) -> int:
         # noinspection PyUnresolvedReferences
         if not self.___isolated_exec_id__:
-            # noinspection SpellCheckingInspection
-            res = await self.__target__.execute_cdp_cmd(
-                "Page.createIsolatedWorld",
-                # yes the following typo is actually not a typo:) see
-                # https://source.chromium.org/chromium/chromium/src/+/main:out/android-Debug/gen/third_party/blink/renderer/core/inspector/protocol/page.cc;l=1284-1288;drc=d9d30d5b272205375f655202e169d681c3bed0c7
-                {"frameId": await self.__frame_id__, "grantUniveralAccess": True,
-                 "worldName": "Isolated execution context with DOM-access, You got here hehe:)"})
-            super().__setattr__("___isolated_exec_id__", res["executionContextId"])
+            # shared with all other objects of the frame
+            # noinspection PyProtectedMember
+            context_id = await self.__target__._isolated_world(await self.__frame_id__)
+            super().__setattr__("___isolated_exec_id__", context_id)
         # noinspection PyUnresolvedReferences
         return self.___isolated_exec_id__
 
     async def __exec_raw__(self, script: str, *args, await_res: bool = False, serialization: str = None,
                            max_depth: int = None, timeout: float = 10, execution_context_id: str = None,
-                           unique_context: bool = True):
+                           unique_context: bool = True, plain: bool = False):
         """
         example:
         script= "function(...arguments){obj.click()}"
@@ -113,7 +110,6 @@ class JSRemoteObj:
             obj_id = None
             if isinstance(arg, JSRemoteObj):
                 if isinstance(arg, WebElement):
-                    await arg.obj_id  # resolve webelement
                     obj_id = await arg.__obj_id_for_context__(exec_context)
                 else:
                     if arg.__context_id__ == exec_context:
@@ -139,12 +135,18 @@ class JSRemoteObj:
             args["objectId"] = base_obj_id
         else:
             args["executionContextId"] = exec_context
+        # noinspection PyProtectedMember
+        args["objectGroup"] = self.__target__._object_group_name
         try:
             res = await self.__target__.execute_cdp_cmd("Runtime.callFunctionOn", args, timeout=timeout)
         except CDPError as e:
             if e.code == -32000 and e.message in ['Cannot find context with specified id',
+                                                  'Execution context was destroyed.',
                                                   'Argument should belong to the same JavaScript world '
                                                   'as target object']:
+                if e.message != 'Argument should belong to the same JavaScript world as target object':
+                    # noinspection PyProtectedMember
+                    self.__target__._discard_isolated_world(exec_context)
                 raise StaleJSRemoteObjReference(_object=self)
             else:
                 raise e
@@ -154,16 +156,21 @@ class JSRemoteObj:
             raise JSEvalException(res["exceptionDetails"])
         res = res["result"]
         # noinspection PyProtectedMember,PyUnresolvedReferences
+        obj_id = res.get("objectId")
         res = await parse_deep(deep=res.get('deepSerializedValue'), subtype=res.get('subtype'),
                                class_name=res.get('className'), value=res.get("value"),
                                description=res.get("description"), target=target,
-                               obj_id=res.get("objectId"), context_id=exec_context, loop=self.__target__._loop,
-                               isolated_exec_id=self.___isolated_exec_id__, frame_id=await self.__frame_id__)
+                               obj_id=obj_id, context_id=exec_context, loop=self.__target__._loop,
+                               isolated_exec_id=self.___isolated_exec_id__, frame_id=await self.__frame_id__,
+                               plain=plain)
+        if obj_id:
+            # noinspection PyProtectedMember
+            self.__target__._own_object(res, obj_id)
         return res
 
     async def __exec__(self, script: str, *args, max_depth: int = 2, serialization: str = None,
                        timeout: float = 10, execution_context_id: str = None,
-                       unique_context: bool = True):
+                       unique_context: bool = True, plain: bool = False):
         """
         example: script = "return elem.click()"
         """
@@ -199,13 +206,14 @@ class JSRemoteObj:
                             """ + script + "})"
         res = await self.__exec_raw__(script, *args, max_depth=max_depth,
                                       serialization=serialization, timeout=timeout,
-                                      await_res=False, execution_context_id=exec_context, unique_context=False)
+                                      await_res=False, execution_context_id=exec_context, unique_context=False,
+                                      plain=plain)
         return res
 
     async def __exec_async__(self, script: str, *args, max_depth: int = 2,
                              serialization: str = None, timeout: float = 10,
                              obj_id=None, execution_context_id: str = None,
-                             unique_context: bool = True):
+                             unique_context: bool = True, plain: bool = False):
         from selenium_driverless.types.webelement import WebElement
 
         exec_context = self.__context_id__
@@ -238,13 +246,13 @@ class JSRemoteObj:
         res = await self.__exec_raw__(script, *args, max_depth=max_depth,
                                       serialization=serialization, timeout=timeout,
                                       await_res=True,
-                                      execution_context_id=exec_context, unique_context=False)
+                                      execution_context_id=exec_context, unique_context=False, plain=plain)
         return res
 
     async def __eval_async__(self, script: str, *args, max_depth: int = 2,
                              serialization: str = None, timeout: float = 10,
                              obj_id=None, execution_context_id: str = None,
-                             unique_context: bool = True):
+                             unique_context: bool = True, plain: bool = False):
         from selenium_driverless.types.webelement import WebElement
 
         exec_context = self.__context_id__
@@ -271,7 +279,7 @@ class JSRemoteObj:
         res = await self.__exec_raw__(script, *args, max_depth=max_depth,
                                       serialization=serialization, timeout=timeout,
                                       await_res=True,
-                                      execution_context_id=exec_context, unique_context=False)
+                                      execution_context_id=exec_context, unique_context=False, plain=plain)
         return res
 
 
@@ -560,12 +568,88 @@ class JSUnserializable(JSRemoteObj):
                 f'obj_id={self.__obj_id__}, context_id={self.__context_id__})')
 
 
-async def parse_deep(deep: dict, target, isolated_exec_id: int, frame_id: int, subtype: str = None,
-                     class_name: str = None, description: str = None,
-                     value=None, obj_id: str = None, loop: asyncio.AbstractEventLoop = None, context_id: str = None):
+# values of these can be taken directly from the deep serialization
+_PRIMITIVE_TYPES = frozenset(("number", "string", "boolean", "undefined", "null"))
+
+
+_NODE_LIST_ITEMS = """
+function(){
+    if(this.snapshotItem !== undefined){
+        // XPathResult, only snapshots can be read without side effects
+        if(this.resultType !== 6 && this.resultType !== 7){return null}
+        const items = new Array(this.snapshotLength)
+        for(let i = 0; i < items.length; i++){items[i] = this.snapshotItem(i)}
+        return items
+    }
+    return Array.from(this)
+}
+"""
+
+
+async def _node_list_items(target, obj_id: str) -> typing.Optional[typing.List[dict]]:
+    # all items within a single round-trip, the nodes only by their backendNodeId
+    try:
+        res = await target.execute_cdp_cmd("Runtime.callFunctionOn", {
+            "functionDeclaration": _NODE_LIST_ITEMS, "objectId": obj_id, "objectGroup": target._object_group_name,
+            "serializationOptions": {"serialization": "deep", "maxDepth": 1,
+                                     "additionalParameters": {"includeShadowTree": "none", "maxNodeDepth": 0}}})
+    except CDPError as e:
+        if e.code == -32000 and e.message == 'Cannot find context with specified id':
+            raise StaleJSRemoteObjReference(_object=obj_id)
+        raise e
+    if "exceptionDetails" in res.keys():
+        from selenium_driverless.types import JSEvalException
+        raise JSEvalException(res["exceptionDetails"])
+    # the array itself isn't needed
+    target._own_object(None, res["result"].get("objectId"))
+    deep = res["result"].get("deepSerializedValue", {})
+    if deep.get("type") != "array":
+        return None
+    return deep.get("value") or []
+
+
+async def _build_element(deep: dict, target, isolated_exec_id: int, frame_id: int,
+                         loop: asyncio.AbstractEventLoop = None, context_id: str = None, obj_id: str = None,
+                         class_name: str = None):
     from selenium_driverless.types.webelement import WebElement
     from selenium_driverless.sync.webelement import WebElement as SyncWebElement
+    value = deep.get("value") or {}
+    cls = SyncWebElement if loop else WebElement
+    # built locally, the object id and class name get resolved on first use if missing
+    return await cls(backend_node_id=value.get("backendNodeId"), obj_id=obj_id, target=target, loop=loop,
+                     class_name=class_name, context_id=context_id,
+                     isolated_exec_id=isolated_exec_id, frame_id=frame_id)
+
+
+def _iter_nodes(deep: dict) -> typing.Iterator[dict]:
+    # all entries of type "node", without recursion
+    stack = [deep]
+    while stack:
+        _deep = stack.pop()
+        _type = _deep.get("type")
+        if _type == "node":
+            yield _deep
+            continue
+        _value = _deep.get("value")
+        if not isinstance(_value, list) or _type in _PRIMITIVE_TYPES:
+            continue
+        for item in _value:
+            if isinstance(item, dict):
+                stack.append(item)
+            elif isinstance(item, list):
+                # [key, value] of objects and maps
+                stack.extend(_item for _item in item if isinstance(_item, dict))
+
 
+async def parse_deep(deep: dict, target, isolated_exec_id: int, frame_id: int, subtype: str = None,
+                     class_name: str = None, description: str = None,
+                     value=None, obj_id: str = None, loop: asyncio.AbstractEventLoop = None, context_id: str = None,
+                     plain: bool = False):
+    """parses a `Runtime.DeepSerializedValue <https://chromedevtools.github.io/devtools-protocol/tot/Runtime/#type-DeepSerializedValue>`__.
+    Nodes get constructed asynchronously, everything else by :func:`parse_deep_sync <selenium_driverless.types.deserialize.parse_deep_sync>`
+
+    :param plain: return ``dict`` and ``list`` instead of ``JSObject`` and ``JSArray``
+    """
     if not deep:
         if value is not None:
             return value
@@ -574,56 +658,124 @@ async def parse_deep(deep: dict, target, isolated_exec_id: int, frame_id: int, s
                                     isolated_exec_id=isolated_exec_id, frame_id=frame_id)
 
     _type = deep.get("type")
-    _value = deep.get("value")
+    if _type in _PRIMITIVE_TYPES:
+        return deep.get("value")
 
     # special types
-    if class_name == 'XPathResult':
-        elems = JSNodeList(obj_id=obj_id, target=target, class_name=class_name,
-                           isolated_exec_id=isolated_exec_id, frame_id=frame_id)
-        obj = JSRemoteObj(target=target, obj_id=obj_id, isolated_exec_id=isolated_exec_id, frame_id=frame_id)
-        res = await obj.__exec__("return obj.resultType == 7", serialization="json")
-        if res:
-            _len = await obj.__exec__("return obj.snapshotLength", serialization="json")
-            for idx in range(_len):
-                elems.append(await obj.__exec__("return obj.snapshotItem(arguments[0])", idx,
-                                                serialization="deep"))
+    if class_name == 'XPathResult' or class_name == 'NodeList' or _type == 'htmlcollection':
+        items = await _node_list_items(target, obj_id)
+        if items is not None:
+            elems = JSNodeList(obj_id=obj_id, target=target, class_name=class_name,
+                               isolated_exec_id=isolated_exec_id, frame_id=frame_id)
+            for item in items:
+                if item.get("type") == "node":
+                    item = await _build_element(item, target, isolated_exec_id=isolated_exec_id,
+                                                frame_id=frame_id, loop=loop, context_id=context_id)
+                else:
+                    item = await parse_deep(item, target, isolated_exec_id=isolated_exec_id, frame_id=frame_id,
+                                            loop=loop, context_id=context_id, plain=plain)
+                elems.append(item)
             return elems
-    if class_name == 'NodeList' or _type == 'htmlcollection':
-        elems = JSNodeList(obj_id=obj_id, target=target, class_name=class_name, isolated_exec_id=isolated_exec_id,
-                           frame_id=frame_id)
-        _len = int(description[len(class_name)+1:-1])
-        for idx in range(_len):
-            elems.append(await elems.__exec__("return obj[arguments[0]]", idx, serialization="deep",
-                                              execution_context_id=context_id))
-        return elems
-
-    backend_node_id = None
-    if isinstance(_value, dict):
-        backend_node_id = _value.get('backendNodeId')
-
-    # structures
-    if _type == "array":
-        if _value is None:
-            return JSUnserializable(_type, _value, target=target, obj_id=obj_id, description=description,
-                                    sub_type=subtype,
-                                    class_name=class_name, isolated_exec_id=isolated_exec_id, frame_id=frame_id)
-        _res = JSArray(obj_id=obj_id, target=target,
-                       isolated_exec_id=isolated_exec_id, frame_id=frame_id)
-        for idx, _deep in enumerate(_value):
-            _res.append(await parse_deep(_deep, target,
-                                         isolated_exec_id=isolated_exec_id, frame_id=frame_id))
-        return _res
-    elif _type == "object":
-        if _value is None:
-            return JSUnserializable(_type, _value, target=target, obj_id=obj_id, description=description,
-                                    sub_type=subtype,
-                                    class_name=class_name, isolated_exec_id=isolated_exec_id, frame_id=frame_id)
-        _res = JSObject(obj_id=obj_id, target=target, description=description, sub_type=subtype, class_name=class_name,
-                        isolated_exec_id=isolated_exec_id, frame_id=frame_id)
-        for key, value in _value:
-            _res.__setattr__(key, await parse_deep(value, target,
-                                                   isolated_exec_id=isolated_exec_id, frame_id=frame_id))
-        return _res
+
+    nodes = {}
+    for node in _iter_nodes(deep):
+        if node is deep:
+            nodes[id(node)] = await _build_element(node, target, isolated_exec_id=isolated_exec_id,
+                                                   frame_id=frame_id, loop=loop, context_id=context_id,
+                                                   obj_id=obj_id, class_name=class_name)
+        else:
+            nodes[id(node)] = await _build_element(node, target, isolated_exec_id=isolated_exec_id,
+                                                   frame_id=frame_id, loop=loop, context_id=context_id)
+    return parse_deep_sync(deep, target, isolated_exec_id=isolated_exec_id, frame_id=frame_id, subtype=subtype,
+                           class_name=class_name, description=description, obj_id=obj_id, plain=plain,
+                           nodes=nodes)
+
+
+def parse_deep_sync(deep: dict, target=None, isolated_exec_id: int = None, frame_id: int = None, subtype: str = None,
+                    class_name: str = None, description: str = None, obj_id: str = None, plain: bool = False,
+                    nodes: typing.Dict[int, typing.Any] = None):
+    """parses a `Runtime.DeepSerializedValue <https://chromedevtools.github.io/devtools-protocol/tot/Runtime/#type-DeepSerializedValue>`__
+    synchronously and without recursion for arrays and objects, fast for large JSON-like results.
+
+    :param plain: return ``dict`` and ``list`` instead of ``JSObject`` and ``JSArray``.
+        Maps and sets become ``dict`` and ``set``, or a list of ``[key, value]`` pairs and a list of members
+        if a key or member isn't hashable
+    :param nodes: the elements for entries of type ``node`` by ``id(entry)``, constructed by :func:`parse_deep <selenium_driverless.types.deserialize.parse_deep>`
+
+    .. note::
+        raises ``ValueError`` for nodes, if not passed within ``nodes``
+    """
+    if nodes is None:
+        nodes = {}
+    root = [None]
+    # (entry, container, key, whether it is the root)
+    stack = [(deep, root, 0, True)]
+    while stack:
+        _deep, container, key, is_root = stack.pop()
+        _type = _deep.get("type")
+        _value = _deep.get("value")
+        if is_root:
+            _obj_id, _description, _sub_type, _class_name = obj_id, description, subtype, class_name
+        else:
+            _obj_id = _description = _sub_type = _class_name = None
+
+        if _type in _PRIMITIVE_TYPES:
+            res = _value
+        elif _type in ("array", "nodelist", "htmlcollection") and _value is not None:
+            if plain:
+                res = [None] * len(_value)
+            else:
+                if _type == "array":
+                    res = JSArray(obj_id=_obj_id, target=target, isolated_exec_id=isolated_exec_id, frame_id=frame_id)
+                else:
+                    res = JSNodeList(obj_id=_obj_id, target=target, class_name=_class_name,
+                                     isolated_exec_id=isolated_exec_id, frame_id=frame_id)
+                res.extend([None] * len(_value))
+            for idx, item in enumerate(_value):
+                if item.get("type") in _PRIMITIVE_TYPES:
+                    # fast path, no stack entry for each primitive
+                    res[idx] = item.get("value")
+                else:
+                    stack.append((item, res, idx, False))
+        elif _type == "object" and _value is not None:
+            if plain:
+                res = {}
+            else:
+                res = JSObject(obj_id=_obj_id, target=target, description=_description, sub_type=_sub_type,
+                               class_name=_class_name, isolated_exec_id=isolated_exec_id, frame_id=frame_id)
+            for _key, item in _value:
+                if not isinstance(_key, str):
+                    _key = parse_deep_sync(_key, target, isolated_exec_id=isolated_exec_id, frame_id=frame_id,
+                                           plain=plain, nodes=nodes)
+                # keeps the order of the keys
+                res[_key] = None
+                if item.get("type") in _PRIMITIVE_TYPES:
+                    res[_key] = item.get("value")
+                else:
+                    stack.append((item, res, _key, False))
+        elif _type == "node":
+            res = nodes.get(id(_deep))
+            if res is None:
+                raise ValueError("nodes have to be constructed asynchronously, use parse_deep instead")
+        else:
+            res = _parse_value(_deep, target, isolated_exec_id=isolated_exec_id, frame_id=frame_id,
+                               subtype=_sub_type, class_name=_class_name, description=_description,
+                               obj_id=_obj_id, plain=plain, nodes=nodes)
+        container[key] = res
+    return root[0]
+
+
+def _parse_value(deep: dict, target, isolated_exec_id: int, frame_id: int, subtype: str = None,
+                 class_name: str = None, description: str = None, obj_id: str = None, plain: bool = False,
+                 nodes: typing.Dict[int, typing.Any] = None):
+    _type = deep.get("type")
+    _value = deep.get("value")
+
+    if _type in ("array", "object"):
+        # _value is None
+        return JSUnserializable(_type, _value, target=target, obj_id=obj_id, description=description,
+                                sub_type=subtype,
+                                class_name=class_name, isolated_exec_id=isolated_exec_id, frame_id=frame_id)
 
     # non-json types
     elif _type == "bigint":
@@ -639,21 +791,35 @@ async def parse_deep(deep: dict, target, isolated_exec_id: int, frame_id: int, s
         return JSFunction(obj_id=obj_id, target=target, description=description,
                           isolated_exec_id=isolated_exec_id, frame_id=frame_id)
     elif _type == "map":
-        _map = JSMap(obj_id=obj_id, target=target,
-                     isolated_exec_id=isolated_exec_id, frame_id=frame_id)
+        pairs = []
         for key, value in _value:
-            key = await parse_deep(key, target,
-                                   isolated_exec_id=isolated_exec_id, frame_id=frame_id)
-            _map.set(key, await parse_deep(value, target,
-                                           isolated_exec_id=isolated_exec_id, frame_id=frame_id))
+            if not isinstance(key, str):
+                key = parse_deep_sync(key, target, isolated_exec_id=isolated_exec_id, frame_id=frame_id,
+                                      plain=plain, nodes=nodes)
+            value = parse_deep_sync(value, target, isolated_exec_id=isolated_exec_id, frame_id=frame_id,
+                                    plain=plain, nodes=nodes)
+            pairs.append((key, value))
+        if plain:
+            try:
+                return dict(pairs)
+            except TypeError:
+                # unhashable keys, for example objects or arrays
+                return [[key, value] for key, value in pairs]
+        _map = JSMap(obj_id=obj_id, target=target, isolated_exec_id=isolated_exec_id, frame_id=frame_id)
+        for key, value in pairs:
+            _map.set(key, value)
         return _map
     elif _type == "set":
-        _set = JSSet(obj_id=obj_id, target=target,
-                     isolated_exec_id=isolated_exec_id, frame_id=frame_id)
-        for value in _value:
-            value = await parse_deep(value, target,
-                                     isolated_exec_id=isolated_exec_id, frame_id=frame_id)
-            _set.add(value)
+        members = [parse_deep_sync(value, target, isolated_exec_id=isolated_exec_id, frame_id=frame_id,
+                                   plain=plain, nodes=nodes) for value in _value]
+        if plain:
+            try:
+                return set(members)
+            except TypeError:
+                # unhashable members, for example objects or arrays
+                return members
+        _set = JSSet(obj_id=obj_id, target=target, isolated_exec_id=isolated_exec_id, frame_id=frame_id)
+        _set.update(members)
         return _set
     elif _type == "weakmap":
         return JSWeakMap(obj_id=obj_id, target=target,
@@ -673,18 +839,6 @@ async def parse_deep(deep: dict, target, isolated_exec_id: int, frame_id: int, s
     elif _type == "arraybuffer":
         return JSArrayBuffer(obj_id, target=target,
                              isolated_exec_id=isolated_exec_id, frame_id=frame_id)
-    elif _type == "node":
-
-        if loop:
-            return await SyncWebElement(backend_node_id=backend_node_id, obj_id=obj_id, target=target,
-                                        loop=loop,
-                                        class_name=class_name, context_id=context_id,
-                                        isolated_exec_id=isolated_exec_id, frame_id=frame_id)
-        else:
-            return await WebElement(backend_node_id=backend_node_id, obj_id=obj_id, target=target,
-                                    loop=loop,
-                                    class_name=class_name, context_id=context_id,
-                                    isolated_exec_id=isolated_exec_id, frame_id=frame_id)
     elif _type == "window":
         context = None
         if _value is not None:
@@ -695,12 +849,6 @@ async def parse_deep(deep: dict, target, isolated_exec_id: int, frame_id: int, s
         return JSUnserializable(_type, _value, target=target, obj_id=obj_id,
                                 description=description, isolated_exec_id=isolated_exec_id, frame_id=frame_id)
 
-    # low-level types
-    elif _type in ["number", "string", "boolean"]:
-        return _value
-    elif _type in ["undefined", "null"]:
-        return None
-
     # non-serializable
     else:
         return JSUnserializable(_type, _value, target=target, obj_id=obj_id, description=description, sub_type=subtype,
@@ -0,0 +1,385 @@
+import asyncio
+import typing
+import warnings
+
+from cdp_socket.exceptions import CDPError
+
+from selenium_driverless.types.by import By
+from selenium_driverless.utils import dom_query
+from selenium_driverless.utils.utils import safe_wrap_fut
+
+
+class DomNode:
+    """a node of :class:`DomMirror <selenium_driverless.types.dom_mirror.DomMirror>`,
+    built from `DOM.Node <https://chromedevtools.github.io/devtools-protocol/tot/DOM/#type-Node>`_
+
+    .. note::
+        only valid while the mirror is current, use
+        :func:`DomMirror.to_element <selenium_driverless.types.dom_mirror.DomMirror.to_element>` to interact with it
+    """
+    __slots__ = ("node_id", "backend_node_id", "node_type", "node_name", "local_name", "node_value", "attributes",
+                 "parent", "children", "child_node_count", "shadow_roots", "content_document", "frame_id",
+                 "__weakref__")
+
+    def __init__(self, node: dict, parent: typing.Optional["DomNode"], frame_id: typing.Optional[str]):
+        self.node_id: int = node["nodeId"]
+        self.backend_node_id: int = node["backendNodeId"]
+        self.node_type: int = node["nodeType"]
+        self.node_name: str = node["nodeName"]
+        self.local_name: str = node.get("localName", "")
+        self.node_value: str = node.get("nodeValue", "")
+        attributes = node.get("attributes", [])
+        self.attributes: typing.Dict[str, str] = dict(zip(attributes[::2], attributes[1::2]))
+        self.parent = parent
+        # None if not known (yet)
+        self.children: typing.Optional[typing.List[DomNode]] = None
+        self.child_node_count: int = node.get("childNodeCount", 0)
+        self.shadow_roots: typing.List[DomNode] = []
+        self.content_document: typing.Optional[DomNode] = None
+        self.frame_id = frame_id
+
+    @property
+    def text(self) -> str:
+        """``node.textContent``"""
+        if self.node_type in (dom_query.ELEMENT_NODE, dom_query.DOCUMENT_FRAGMENT_NODE, dom_query.DOCUMENT_NODE):
+            return dom_query.string_value(self)
+        return self.node_value
+
+    def get_attribute(self, name: str) -> typing.Optional[str]:
+        """the value of an attribute, ``None`` if missing"""
+        return self.attributes.get(name)
+
+    def query_selector_all(self, selector: str, pierce: bool = False) -> typing.List["DomNode"]:
+        """``node.querySelectorAll(selector)``, see :mod:`selenium_driverless.utils.dom_query` for the supported subset
+
+        :param selector: the CSS selector
+        :param pierce: whether to search within shadow roots and iframes as well
+        """
+        return dom_query.select(self, selector, pierce=pierce)
+
+    def query_selector(self, selector: str, pierce: bool = False) -> typing.Optional["DomNode"]:
+        """``node.querySelector(selector)``"""
+        for node in dom_query.iter_descendants(self, pierce):
+            if node.node_type == dom_query.ELEMENT_NODE and dom_query.matches(node, selector):
+                return node
+
+    def xpath(self, expr: str, pierce: bool = False) -> typing.List["DomNode"]:
+        """evaluate an XPath with this node as context node,
+        see :mod:`selenium_driverless.utils.dom_query` for the supported subset
+
+        :param expr: the XPath expression
+        :param pierce: whether to search within shadow roots and iframes as well
+        """
+        return dom_query.xpath(self, expr, pierce=pierce)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}("{self.node_name}", node_id={self.node_id}, ' \
+               f'backend_node_id={self.backend_node_id})'
+
+
+class DomMirror:
+    """a copy of the DOM of a target in memory, loaded once with ``DOM.getDocument(depth=-1, pierce=True)``
+    and kept current by ``DOM.childNodeInserted``, ``DOM.childNodeRemoved``, ``DOM.attributeModified``,
+    ``DOM.characterDataModified`` and related events.
+
+    Queries (CSS, XPath, text, attributes) are answered without any CDP traffic.
+
+    .. code-block:: python
+
+        mirror = await target.mirror_dom()
+        links = mirror.find_nodes(By.CSS_SELECTOR, "a[href]")
+        hrefs = [link.get_attribute("href") for link in links]
+        elem = await mirror.find_element(By.XPATH, "//button[text()='Submit']")
+        await elem.click()
+
+    .. warning::
+        out-of-process iframes aren't included, and only a subset of CSS and XPath is supported,
+        see :mod:`selenium_driverless.utils.dom_query`.
+        Only DOM changes are tracked, the computed style or layout isn't.
+
+    .. note::
+        usually started with :func:`Target.mirror_dom <selenium_driverless.types.target.Target.mirror_dom>`
+    """
+
+    def __init__(self, target):
+        from selenium_driverless.types.target import Target
+        self._target: Target = target
+        self._root: typing.Optional[DomNode] = None
+        self._nodes: typing.Dict[int, DomNode] = {}
+        self._started: typing.Optional[asyncio.Future] = None
+        self._loading: typing.Optional[asyncio.Future] = None
+        self._handlers = {
+            "DOM.documentUpdated": self._on_document_updated,
+            "DOM.setChildNodes": self._on_set_child_nodes,
+            "DOM.childNodeInserted": self._on_child_node_inserted,
+            "DOM.childNodeRemoved": self._on_child_node_removed,
+            "DOM.childNodeCountUpdated": self._on_child_node_count_updated,
+            "DOM.attributeModified": self._on_attribute_modified,
+            "DOM.attributeRemoved": self._on_attribute_removed,
+            "DOM.characterDataModified": self._on_character_data_modified,
+            "DOM.shadowRootPushed": self._on_shadow_root_pushed,
+            "DOM.shadowRootPopped": self._on_shadow_root_popped,
+        }
+
+    @property
+    def started(self) -> bool:
+        """whether the mirror receives events"""
+        return self._started is not None and self._started.done() and not self._started.exception()
+
+    @property
+    def root(self) -> typing.Optional[DomNode]:
+        """the document node"""
+        return self._root
+
+    @property
+    def nodes(self) -> typing.Dict[int, DomNode]:
+        """all nodes by ``DOM.NodeId``"""
+        return self._nodes
+
+    async def start(self, timeout: float = 10):
+        """load the document and start listening for changes"""
+        if self._started is None:
+            self._started = asyncio.get_running_loop().create_future()
+            target = self._target
+            for event, handler in self._handlers.items():
+                await target.add_cdp_listener(event, handler)
+            try:
+                if not target._dom_enabled:
+                    await target.execute_cdp_cmd("DOM.enable", timeout=timeout)
+                await self.reload(timeout=timeout)
+            except Exception as e:
+                for event, handler in self._handlers.items():
+                    await target.remove_cdp_listener(event, handler)
+                self._started.set_exception(e)
+                self._started = None
+                raise e
+            self._started.set_result(None)
+        await asyncio.shield(self._started)
+        return self
+
+    def __await__(self):
+        return self.start().__await__()
+
+    async def stop(self):
+        """stop listening for changes and drop the mirror"""
+        if self._started is not None:
+            for event, handler in self._handlers.items():
+                await self._target.remove_cdp_listener(event, handler)
+            self._started = None
+        self._root = None
+        self._nodes = {}
+
+    async def reload(self, timeout: float = 10):
+        """load the whole document again"""
+        if self._loading is None or self._loading.done():
+            self._loading = asyncio.ensure_future(self._load(timeout))
+        await asyncio.shield(self._loading)
+
+    async def _load(self, timeout: float):
+        target = self._target
+        frame = await target.base_frame
+        res = await target.execute_cdp_cmd("DOM.getDocument", {"depth": -1, "pierce": True}, timeout=timeout)
+        self._nodes = {}
+        self._root = self._build(res["root"], None, frame["id"] if frame else None)
+        # DOM.getDocument invalidates all previous node ids
+        target._document_elem_ = None
+
+    async def synced(self):
+        """wait for a pending reload of the document, for example after ``DOM.documentUpdated``"""
+        if self._loading is not None and not self._loading.done():
+            await asyncio.shield(self._loading)
+
+    def _build(self, node: dict, parent: typing.Optional[DomNode], frame_id: typing.Optional[str]) -> DomNode:
+        # iterative, documents can be deeply nested
+        top = DomNode(node, parent, frame_id)
+        stack = [(top, node)]
+        while stack:
+            mirrored, raw = stack.pop()
+            self._nodes[mirrored.node_id] = mirrored
+            children = raw.get("children")
+            if children is not None:
+                mirrored.children = []
+                for child in children:
+                    _child = DomNode(child, mirrored, mirrored.frame_id)
+                    mirrored.children.append(_child)
+                    stack.append((_child, child))
+            elif mirrored.child_node_count:
+                self._request_children(mirrored.node_id)
+            for shadow_root in raw.get("shadowRoots", []):
+                _shadow_root = DomNode(shadow_root, mirrored, mirrored.frame_id)
+                mirrored.shadow_roots.append(_shadow_root)
+                stack.append((_shadow_root, shadow_root))
+            content_document = raw.get("contentDocument")
+            if content_document is not None:
+                _document = DomNode(content_document, mirrored, raw.get("frameId", mirrored.frame_id))
+                mirrored.content_document = _document
+                stack.append((_document, content_document))
+        return top
+
+    def _forget(self, node: DomNode):
+        self._nodes.pop(node.node_id, None)
+        for child in dom_query.iter_descendants(node, pierce=True):
+            self._nodes.pop(child.node_id, None)
+
+    def _request_children(self, node_id: int):
+        async def request():
+            try:
+                await self._target.execute_cdp_cmd("DOM.requestChildNodes",
+                                                   {"nodeId": node_id, "depth": -1, "pierce": True})
+            except CDPError as e:
+                # the node got removed meanwhile
+                if not (e.code == -32000 and "Could not find node" in e.message):
+                    raise e
+
+        safe_wrap_fut(request())
+
+    def _on_document_updated(self, params: dict = None):
+        # all node ids are invalid
+        self._root = None
+        self._nodes = {}
+        self._loading = safe_wrap_fut(self._load(timeout=10))
+
+    def _on_set_child_nodes(self, params: dict):
+        parent = self._nodes.get(params["parentId"])
+        if parent is None:
+            return
+        for child in parent.children or []:
+            self._forget(child)
+        parent.children = [self._build(node, parent, parent.frame_id) for node in params["nodes"]]
+        parent.child_node_count = len(parent.children)
+
+    def _on_child_node_inserted(self, params: dict):
+        parent = self._nodes.get(params["parentNodeId"])
+        if parent is None:
+            return
+        if parent.children is None:
+            self._request_children(parent.node_id)
+            return
+        node = self._build(params["node"], parent, parent.frame_id)
+        previous = self._nodes.get(params["previousNodeId"])
+        idx = 0
+        if previous is not None and previous in parent.children:
+            idx = parent.children.index(previous) + 1
+        parent.children.insert(idx, node)
+        parent.child_node_count = len(parent.children)
+
+    def _on_child_node_removed(self, params: dict):
+        node = self._nodes.get(params["nodeId"])
+        parent = self._nodes.get(params["parentNodeId"])
+        if node is None:
+            return
+        self._forget(node)
+        if parent is not None and parent.children is not None and node in parent.children:
+            parent.children.remove(node)
+            parent.child_node_count = len(parent.children)
+        node.parent = None
+
+    def _on_child_node_count_updated(self, params: dict):
+        node = self._nodes.get(params["nodeId"])
+        if node is not None:
+            node.child_node_count = params["childNodeCount"]
+            if node.children is None or len(node.children) != node.child_node_count:
+                self._request_children(node.node_id)
+
+    def _on_attribute_modified(self, params: dict):
+        node = self._nodes.get(params["nodeId"])
+        if node is not None:
+            node.attributes[params["name"]] = params["value"]
+
+    def _on_attribute_removed(self, params: dict):
+        node = self._nodes.get(params["nodeId"])
+        if node is not None:
+            node.attributes.pop(params["name"], None)
+
+    def _on_character_data_modified(self, params: dict):
+        node = self._nodes.get(params["nodeId"])
+        if node is not None:
+            node.node_value = params["characterData"]
+
+    def _on_shadow_root_pushed(self, params: dict):
+        host = self._nodes.get(params["hostId"])
+        if host is not None:
+            host.shadow_roots.append(self._build(params["root"], host, host.frame_id))
+
+    def _on_shadow_root_popped(self, params: dict):
+        host = self._nodes.get(params["hostId"])
+        root = self._nodes.get(params["rootId"])
+        if host is not None and root is not None:
+            self._forget(root)
+            if root in host.shadow_roots:
+                host.shadow_roots.remove(root)
+
+    def find_nodes(self, by: str, value: str, root: DomNode = None, pierce: bool = False) -> typing.List[DomNode]:
+        """find nodes in the mirror, without CDP traffic
+
+        :param by: one of the locators at :func:`By <selenium_driverless.types.by.By>`
+        :param value: the actual query to find the nodes by
+        :param root: the node to search within, defaults to the document
+        :param pierce: whether to search within shadow roots and iframes as well
+        """
+        if root is None:
+            root = self._root
+        if root is None:
+            warnings.warn("the DomMirror isn't loaded, returning no nodes")
+            return []
+        if by == By.ID:
+            return [node for node in dom_query.iter_descendants(root, pierce)
+                    if node.node_type == dom_query.ELEMENT_NODE and node.attributes.get("id") == value]
+        elif by == By.CLASS_NAME:
+            return [node for node in dom_query.iter_descendants(root, pierce)
+                    if node.node_type == dom_query.ELEMENT_NODE and node.attributes.get("class") == value]
+        elif by == By.NAME:
+            return [node for node in dom_query.iter_descendants(root, pierce)
+                    if node.node_type == dom_query.ELEMENT_NODE and node.attributes.get("name") == value]
+        elif by == By.TAG_NAME:
+            value = value.lower()
+            return [node for node in dom_query.iter_descendants(root, pierce)
+                    if node.node_type == dom_query.ELEMENT_NODE and (node.local_name or "").lower() == value]
+        elif by == By.CSS_SELECTOR:
+            return root.query_selector_all(value, pierce=pierce)
+        elif by == By.XPATH:
+            return root.xpath(value, pierce=pierce)
+        raise ValueError("unexpected by")
+
+    def find_node(self, by: str, value: str, root: DomNode = None, pierce: bool = False) -> DomNode:
+        """find a node in the mirror, see
+        :func:`DomMirror.find_nodes <selenium_driverless.types.dom_mirror.DomMirror.find_nodes>`
+        """
+        from selenium_driverless.types.webelement import NoSuchElementException
+        nodes = self.find_nodes(by, value, root=root, pierce=pierce)
+        if not nodes:
+            raise NoSuchElementException()
+        return nodes[0]
+
+    async def to_element(self, node: DomNode):
+        """the :class:`WebElement <selenium_driverless.types.webelement.WebElement>` for a node,
+        built from its ``backendNodeId``
+        """
+        from selenium_driverless.types.webelement import WebElement
+        from selenium_driverless.sync.webelement import WebElement as SyncWebElement
+        loop = self._target._loop
+        cls = SyncWebElement if loop else WebElement
+        return await cls(target=self._target, backend_node_id=node.backend_node_id, loop=loop,
+                         isolated_exec_id=None, frame_id=node.frame_id)
+
+    async def find_elements(self, by: str, value: str, root: DomNode = None, pierce: bool = False):
+        """find elements using the mirror, see
+        :func:`DomMirror.find_nodes <selenium_driverless.types.dom_mirror.DomMirror.find_nodes>`
+
+        :returns: :class:`ElementList <selenium_driverless.types.element_list.ElementList>`
+        """
+        from selenium_driverless.types.element_list import ElementList
+        await self.synced()
+        elems = [await self.to_element(node) for node in self.find_nodes(by, value, root=root, pierce=pierce)]
+        loop = self._target._loop
+        if loop:
+            from selenium_driverless.sync.element_list import ElementList as SyncElementList
+            return SyncElementList(elems, target=self._target, loop=loop)
+        return ElementList(elems, target=self._target)
+
+    async def find_element(self, by: str, value: str, root: DomNode = None, pierce: bool = False):
+        """find an element using the mirror, see
+        :func:`DomMirror.find_nodes <selenium_driverless.types.dom_mirror.DomMirror.find_nodes>`
+        """
+        await self.synced()
+        return await self.to_element(self.find_node(by, value, root=root, pierce=pierce))
@@ -0,0 +1,68 @@
+import typing
+
+if typing.TYPE_CHECKING:
+    from selenium_driverless.types.target import Target
+    from selenium_driverless.types.webelement import WebElement
+
+
+class ElementList(list):
+    """a list of :class:`WebElement <selenium_driverless.types.webelement.WebElement>`,
+    as returned by ``find_elements``.
+    The methods get their data for all elements at once, with a single ``Runtime.callFunctionOn`` per frame.
+
+    .. code-block:: python
+
+        rows = await driver.find_elements(By.CSS_SELECTOR, "tr")
+        texts = await rows.texts()
+        columns = await rows.properties(["id", "className"])
+
+    :param elements: the elements
+    :param target: the target the elements belong to
+    """
+
+    def __init__(self, elements: typing.Iterable["WebElement"] = (), target: "Target" = None):
+        super().__init__(elements)
+        self._target = target
+
+    @property
+    def target(self) -> "Target":
+        return self._target
+
+    async def execute_script(self, script: str, *args, max_depth: int = 2, serialization: str = None,
+                             timeout: float = 10, plain: bool = False) -> list:
+        """executes JavaScript for each element, ``obj`` and ``this`` refer to the element.
+        see :func:`Target.execute_script_many <selenium_driverless.types.target.Target.execute_script_many>`
+        """
+        return await self._target.execute_script_many(script, self, *args, max_depth=max_depth,
+                                                      serialization=serialization, timeout=timeout, plain=plain)
+
+    async def texts(self) -> typing.List[str]:
+        """the ``textContent`` of each element"""
+        return await self.execute_script("return obj.textContent", serialization="json", plain=True)
+
+    async def attributes(self, name: str) -> typing.List[typing.Optional[str]]:
+        """an attribute of each element, ``None`` if missing
+
+        :param name: the name of the attribute
+        """
+        return await self.execute_script("return obj.getAttribute(arguments[0])", name,
+                                         serialization="json", plain=True)
+
+    async def rects(self) -> typing.List[typing.Optional[dict]]:
+        """the first client rect of each element, ``None`` if it isn't rendered"""
+        return await self.execute_script("const rect = obj.getClientRects()[0]; return rect ? rect.toJSON() : null",
+                                         serialization="json", plain=True)
+
+    async def properties(self, names: typing.List[str], max_depth: int = 2) -> typing.Dict[str, list]:
+        """properties of each element, by column
+
+        .. code-block:: python
+
+            {"id": ["a", "b"], "className": ["x", "y"]}
+
+        :param names: the names of the properties
+        :param max_depth: The maximum depth objects get serialized.
+        """
+        rows = await self.execute_script("return arguments[0].map(name => obj[name])", list(names),
+                                         max_depth=max_depth + 1, plain=True)
+        return {name: [row[idx] for row in rows] for idx, name in enumerate(names)}
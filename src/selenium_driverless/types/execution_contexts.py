@@ -0,0 +1,158 @@
+import asyncio
+import typing
+import warnings
+
+MAIN_WORLD = "main"
+
+
+class ExecutionContextTracker:
+    """keeps the ``Runtime.ExecutionContextId`` of the main and isolated worlds of each frame of a target in memory,
+    kept current by ``Runtime.executionContextCreated``, ``Runtime.executionContextDestroyed``,
+    ``Runtime.executionContextsCleared`` and ``Page.frameNavigated``.
+
+    Script execution then waits for the new context after a reload or navigation, instead of retrying until it exists.
+
+    .. warning::
+        requires ``Runtime.enable``, which is detectable by the website. Therefore opt-in only.
+
+    .. note::
+        usually started with :func:`Target.track_execution_contexts <selenium_driverless.types.target.Target.track_execution_contexts>`
+    """
+
+    def __init__(self, target):
+        from selenium_driverless.types.target import Target
+        self._target: Target = target
+        self._contexts: typing.Dict[int, dict] = {}
+        # frame_id => {world name or "main": context_id}
+        self._frames: typing.Dict[str, typing.Dict[str, int]] = {}
+        self._waiters: typing.List[typing.Tuple[str, str, typing.Optional[int], asyncio.Future]] = []
+        self._started: typing.Optional[asyncio.Future] = None
+        self._main_frame_id: typing.Optional[str] = None
+
+    @property
+    def started(self) -> bool:
+        """whether the tracker receives events"""
+        return self._started is not None and self._started.done() and not self._started.exception()
+
+    @property
+    def contexts(self) -> typing.Dict[int, dict]:
+        """the raw ``Runtime.ExecutionContextDescription`` dicts of all existing contexts by id"""
+        return self._contexts
+
+    async def start(self, timeout: float = 10):
+        """start tracking, sends ``Runtime.enable``"""
+        if self._started is None:
+            warnings.warn("tracking execution contexts requires Runtime.enable, which is detectable")
+            self._started = asyncio.get_running_loop().create_future()
+            target = self._target
+            await target.add_cdp_listener("Runtime.executionContextCreated", self._on_created)
+            await target.add_cdp_listener("Runtime.executionContextDestroyed", self._on_destroyed)
+            await target.add_cdp_listener("Runtime.executionContextsCleared", self._on_cleared)
+            await target.add_cdp_listener("Page.frameNavigated", self._on_frame_navigated)
+            try:
+                base_frame = await target.base_frame
+                if base_frame:
+                    self._main_frame_id = base_frame["id"]
+                # existing contexts are reported right away
+                await target.execute_cdp_cmd("Runtime.enable", timeout=timeout)
+            except Exception as e:
+                await target.remove_cdp_listener("Runtime.executionContextCreated", self._on_created)
+                await target.remove_cdp_listener("Runtime.executionContextDestroyed", self._on_destroyed)
+                await target.remove_cdp_listener("Runtime.executionContextsCleared", self._on_cleared)
+                await target.remove_cdp_listener("Page.frameNavigated", self._on_frame_navigated)
+                self._started.set_exception(e)
+                self._started = None
+                raise e
+            self._started.set_result(None)
+        await asyncio.shield(self._started)
+        return self
+
+    def __await__(self):
+        return self.start().__await__()
+
+    @property
+    def main_frame_id(self) -> typing.Optional[str]:
+        """the ``Page.FrameId`` of the main frame"""
+        return self._main_frame_id
+
+    def get(self, frame_id: str = None, world: str = MAIN_WORLD) -> typing.Optional[int]:
+        """the context id of a world in a frame, ``None`` if it doesn't exist (yet)
+
+        :param frame_id: the ``Page.FrameId``, defaults to the main frame
+        :param world: the name of the isolated world, ``"main"`` for the main world
+        """
+        if frame_id is None:
+            frame_id = self._main_frame_id
+        return self._frames.get(frame_id, {}).get(world)
+
+    async def wait_for(self, frame_id: str = None, world: str = MAIN_WORLD, timeout: float or None = 10,
+                       exclude: int = None) -> int:
+        """wait for a world to exist in a frame, without polling
+
+        .. code-block:: python
+
+            tracker = await target.track_execution_contexts()
+            context_id = await tracker.wait_for()
+
+        :param frame_id: the ``Page.FrameId``, defaults to the main frame
+        :param world: the name of the isolated world, ``"main"`` for the main world
+        :param timeout: timeout in seconds
+        :param exclude: a context id known to be destroyed, which is therefore ignored
+        """
+        await self.start()
+        if frame_id is None:
+            frame_id = self._main_frame_id
+        context_id = self.get(frame_id, world)
+        if context_id is not None and context_id != exclude:
+            return context_id
+        fut = asyncio.get_running_loop().create_future()
+        waiter = (frame_id, world, exclude, fut)
+        self._waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(f"no execution context for {world} in frame {frame_id} "
+                                       f"got created within {timeout} seconds")
+        finally:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+
+    def _on_created(self, params: dict):
+        context = params["context"]
+        context_id = context["id"]
+        self._contexts[context_id] = context
+        aux_data = context.get("auxData", {})
+        frame_id = aux_data.get("frameId")
+        if not frame_id:
+            return
+        world = MAIN_WORLD if aux_data.get("isDefault") else context.get("name")
+        self._frames.setdefault(frame_id, {})[world] = context_id
+        for _frame_id, _world, exclude, fut in list(self._waiters):
+            if _frame_id == frame_id and _world == world and exclude != context_id and not fut.done():
+                fut.set_result(context_id)
+
+    def _forget(self, context_id: int):
+        context = self._contexts.pop(context_id, None)
+        if context:
+            frame_id = context.get("auxData", {}).get("frameId")
+            worlds = self._frames.get(frame_id, {})
+            for world, _id in list(worlds.items()):
+                if _id == context_id:
+                    del worlds[world]
+        # noinspection PyProtectedMember
+        self._target._forget_context(context_id)
+
+    def _on_destroyed(self, params: dict):
+        self._forget(params["executionContextId"])
+
+    def _on_cleared(self, params: dict = None):
+        for context_id in list(self._contexts.keys()):
+            self._forget(context_id)
+        self._frames = {}
+
+    def _on_frame_navigated(self, params: dict):
+        frame = params["frame"]
+        if not frame.get("parentId"):
+            self._main_frame_id = frame["id"]
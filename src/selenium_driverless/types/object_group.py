@@ -0,0 +1,95 @@
+import contextvars
+import typing
+import uuid
+import weakref
+
+from cdp_socket.exceptions import CDPError
+
+# the innermost group entered within the current task
+_current_group = contextvars.ContextVar("selenium_driverless_object_group", default=None)
+
+
+def new_group_name() -> str:
+    return f"selenium-driverless-{uuid.uuid4().hex}"
+
+
+class ObjectGroup:
+    """a group of remote objects (``Runtime.RemoteObjectId``), released together with ``Runtime.releaseObjectGroup``
+    once the scope ends.
+    All objects returned by scripts or resolved for elements of the target within the scope are part of the group.
+
+    .. code-block:: python
+
+        async with target.object_group():
+            rows = await target.execute_script("return document.querySelectorAll('tr')")
+            texts = [await row.text for row in rows]
+        # the objects have been released in the renderer
+
+    Elements used after the scope get resolved again, other objects raise an error once used.
+
+    .. note::
+        the group is scoped to the current ``asyncio.Task``, and usually created with
+        :func:`Target.object_group <selenium_driverless.types.target.Target.object_group>`
+
+    :param target: the target to create the objects on
+    :param name: the name of the group, a random one by default
+    """
+
+    def __init__(self, target, name: str = None):
+        from selenium_driverless.types.target import Target
+        self._target: Target = target
+        self._name = name or new_group_name()
+        self._elements: typing.List[weakref.ref] = []
+        self._token: typing.Optional[contextvars.Token] = None
+        self._released = False
+
+    @property
+    def name(self) -> str:
+        """the ``objectGroup`` passed to the commands"""
+        return self._name
+
+    @property
+    def target(self):
+        return self._target
+
+    @property
+    def released(self) -> bool:
+        return self._released
+
+    def _add_element(self, elem):
+        self._elements.append(weakref.ref(elem))
+
+    async def release(self):
+        """release all objects of the group"""
+        self._released = True
+        for ref in self._elements:
+            elem = ref()
+            if elem is not None:
+                # noinspection PyProtectedMember
+                elem._forget_obj_ids()
+        self._elements = []
+        try:
+            await self._target.execute_cdp_cmd("Runtime.releaseObjectGroup", {"objectGroup": self._name})
+        except CDPError as e:
+            # the objects are gone already
+            if not (e.code == -32000 and e.message == 'Cannot find context with specified id'):
+                raise e
+
+    async def __aenter__(self):
+        self._token = _current_group.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        _current_group.reset(self._token)
+        self._token = None
+        await self.release()
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}("{self._name}", target={self._target.id})'
+
+
+def current_group(target) -> typing.Optional[ObjectGroup]:
+    """the group entered within the current task for the target, if any"""
+    group = _current_group.get()
+    if group is not None and group.target is target and not group.released:
+        return group
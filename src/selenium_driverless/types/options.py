@@ -94,7 +94,9 @@ class Options(metaclass=ABCMeta):
         }
         self._ignore_local_proxy = False
         self._auto_clean_dirs = True
+        self._fast_quit = False
         self._headless = False
+        self._remote_debugging_pipe = False
         self._startup_url = "about:blank"
 
         self.add_arguments(
@@ -147,6 +149,9 @@ class Options(metaclass=ABCMeta):
                 if not self._debugger_address:
                     self._debugger_address = f"127.0.0.1:{port}"
                 self._is_remote = False
+            elif argument == "--remote-debugging-pipe":
+                self._remote_debugging_pipe = True
+                self._is_remote = False
             elif argument[:17] == "--load-extension=":
                 extensions = argument[17:].split(",")
                 self._extension_paths.extend(extensions)
@@ -245,6 +250,25 @@ class Options(metaclass=ABCMeta):
         if value is True:
             self.add_argument("--headless=new")
 
+    @property
+    def remote_debugging_pipe(self) -> bool:
+        """
+        Whether to connect to chrome over ``--remote-debugging-pipe`` (null-delimited CDP on fd 3 and 4)
+        instead of a TCP port. Avoids polling for the port at startup and port races when launching many browsers.
+        defaults to ``False``
+
+        .. note::
+            only supported on posix. All targets are attached using flattened sessions over the pipe.
+        """
+        return self._remote_debugging_pipe
+
+    @remote_debugging_pipe.setter
+    def remote_debugging_pipe(self, value: bool) -> None:
+        if (value is False) and self._remote_debugging_pipe:
+            raise NotImplementedError("setting remote_debugging_pipe=True can't be undone in options atm")
+        if value is True and not self._remote_debugging_pipe:
+            self.add_argument("--remote-debugging-pipe")
+
     @property
     def startup_url(self) -> str:
         """
@@ -341,6 +365,21 @@ class Options(metaclass=ABCMeta):
     def auto_clean_dirs(self, enabled: bool = True) -> None:
         self._auto_clean_dirs = enabled
 
+    @property
+    def fast_quit(self) -> bool:
+        """whether :func:`Chrome.quit <selenium_driverless.webdriver.Chrome.quit>` should kill chrome right away
+        instead of closing it gracefully, and delete the user-data-dir in the background.
+        defaults to False
+
+        .. warning::
+            the profile might not be written to disk completely
+        """
+        return self._fast_quit
+
+    @fast_quit.setter
+    def fast_quit(self, enabled: bool = True) -> None:
+        self._fast_quit = enabled
+
     def enable_mobile(
             self,
             android_package: str = "com.android.chrome",
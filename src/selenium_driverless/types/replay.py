@@ -0,0 +1,244 @@
+import asyncio
+import gzip
+import json
+import time
+import typing
+
+import websockets
+
+from selenium_driverless.types.connection import Connection
+from selenium_driverless.utils.codec import Codec
+from selenium_driverless.utils.metrics import CDPMetrics
+
+FORMAT_VERSION = 1
+
+SEND = ">"
+RECEIVE = "<"
+_END = object()
+
+
+class CDPRecorder:
+    """writes every CDP frame of a connection with a timestamp to a gzip-compressed JSON-lines file,
+    to be played back with :class:`ReplayConnection <selenium_driverless.types.replay.ReplayConnection>`
+
+    Each line is ``[seconds_since_start, ">" or "<", frame]``, ``>`` for frames sent, ``<`` for frames received.
+
+    .. note::
+        usually used with ``Chrome(record="session.cdp.gz")``
+
+    :param path: the file to write to
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._file.write(json.dumps({"version": FORMAT_VERSION}) + "\n")
+        self._start = time.monotonic()
+
+    @property
+    def path(self) -> str:
+        """the file recorded to"""
+        return self._path
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def record(self, direction: str, data: typing.Union[str, bytes]):
+        """record a frame
+
+        :param direction: ``">"`` for a frame sent, ``"<"`` for a frame received
+        :param data: the raw frame
+        """
+        if self._file.closed:
+            return
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data).decode("utf-8")
+        self._file.write(json.dumps([round(time.monotonic() - self._start, 6), direction, data]) + "\n")
+
+    def close(self):
+        """flush and close the file"""
+        if not self._file.closed:
+            self._file.close()
+
+
+def load_recording(path: str) -> typing.List[typing.Tuple[float, str, str]]:
+    """load the frames of a recording written by :class:`CDPRecorder <selenium_driverless.types.replay.CDPRecorder>`
+
+    :param path: the file to load
+    :return: a list of ``(seconds_since_start, direction, frame)``
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("version") != FORMAT_VERSION:
+            raise ValueError(f"unsupported recording version: {header.get('version')}")
+        return [tuple(json.loads(line)) for line in f if line.strip()]
+
+
+class ReplayConnection(Connection):
+    """plays back a recording as a fake browser, no chrome required.
+
+    Commands sent are matched against the recorded ones by ``sessionId`` and ``method``, in order.
+    The recorded response is released for each matched command, recorded events are released
+    in order as soon as all commands recorded before them have been sent.
+    Commands not found in the recording get an error response.
+    Once the whole recording has been played back, the connection closes like the browser would.
+
+    Frames are received with the latency recorded relative to the last matched command, divided by ``speed``.
+    With ``speed=None``, frames are received right away, which might break code awaiting events triggered by a command.
+
+    .. note::
+        usually used with ``Chrome(replay="session.cdp.gz")``. Flattened sessions are required,
+        recordings are therefore made with ``flatten=True``
+
+    :param path: the recording to play back
+    :param speed: factor to play back the recorded latencies faster
+    """
+
+    def __init__(self, path: str, timeout: float = 10, loop: asyncio.AbstractEventLoop = None,
+                 max_size: int = 2 ** 20, codec: typing.Union[str, Codec, None] = None,
+                 metrics: typing.Optional[CDPMetrics] = None, speed: typing.Optional[float] = 1.0):
+        super().__init__(websock_url="replay://browser", timeout=timeout, loop=loop, max_size=max_size, codec=codec,
+                         metrics=metrics)
+        self._path = path
+        self._speed = speed
+        self._frames: typing.List[typing.Tuple[float, str, str, dict]] = []
+        # recorded command id => index in frames
+        self._commands: typing.Dict[int, int] = {}
+        # (sessionId, method) => indexes of recorded commands not matched yet
+        self._unmatched: typing.Dict[typing.Tuple[typing.Optional[str], str], typing.List[int]] = {}
+        # index => live id, or None if skipped by the client
+        self._matched: typing.Dict[int, typing.Optional[int]] = {}
+        # responses for skipped commands, by recorded id
+        self._parked: typing.Dict[int, typing.Tuple[float, str]] = {}
+        self._pos = 0
+        # (recorded time, monotonic time) of the last matched command
+        self._anchor = (0.0, time.monotonic())
+        self._ended = False
+        self._queue: typing.Optional[asyncio.Queue] = None
+        self._closed = False
+
+    @property
+    def path(self) -> str:
+        """the recording played back"""
+        return self._path
+
+    async def start_session(self, timeout: float = 10):
+        for t, direction, data in await self._loop.run_in_executor(None, load_recording, self._path):
+            frame = json.loads(data)
+            index = len(self._frames)
+            self._frames.append((t, direction, data, frame))
+            if direction == SEND:
+                self._commands[frame["id"]] = index
+                key = (frame.get("sessionId"), frame["method"])
+                self._unmatched.setdefault(key, []).append(index)
+        self._queue = asyncio.Queue()
+        self._anchor = (0.0, time.monotonic())
+        self._task = self._loop.create_task(self._rec_coro())
+        self._task.add_done_callback(self._exc_handler)
+        self._pump()
+        return self
+
+    async def _send_raw(self, data: str):
+        if self._closed:
+            raise ConnectionResetError("replay has been closed")
+        frame = json.loads(data)
+        _id = frame["id"]
+        indexes = self._unmatched.get((frame.get("sessionId"), frame["method"]))
+        if not indexes:
+            response = {"id": _id, "error": {"code": -32601,
+                                             "message": f"'{frame['method']}' wasn't found in the recording"}}
+            if "sessionId" in frame:
+                response["sessionId"] = frame["sessionId"]
+            self._queue.put_nowait((0, json.dumps(response)))
+            return
+        index = indexes.pop(0)
+        was_skipped = index in self._matched
+        self._matched[index] = _id
+        self._anchor = (self._frames[index][0], time.monotonic())
+        if was_skipped:
+            recorded_id = self._frames[index][3]["id"]
+            parked = self._parked.pop(recorded_id, None)
+            if parked is not None:
+                self._emit(parked[1], recorded_id, _id, due=0)
+        else:
+            # commands recorded earlier but not sent (yet) don't block the recording
+            for i in range(self._pos, index):
+                if self._frames[i][1] == SEND and i not in self._matched:
+                    self._matched[i] = None
+        self._pump()
+
+    def _pump(self):
+        frames = self._frames
+        while self._pos < len(frames):
+            t, direction, data, frame = frames[self._pos]
+            if direction == SEND:
+                if self._pos not in self._matched:
+                    # waiting for the client to send it
+                    return
+            else:
+                due = 0
+                if self._speed:
+                    anchor_t, anchor_monotonic = self._anchor
+                    due = anchor_monotonic + max(0.0, t - anchor_t) / self._speed
+                if "id" not in frame:
+                    self._queue.put_nowait((due, data))
+                else:
+                    recorded_id = frame["id"]
+                    live_id = self._matched.get(self._commands.get(recorded_id))
+                    if live_id is None:
+                        # the client might still send it
+                        self._parked[recorded_id] = (due, data)
+                    else:
+                        self._emit(data, recorded_id, live_id, due=due)
+            self._pos += 1
+        if not self._ended:
+            self._ended = True
+            self._queue.put_nowait((0, _END))
+
+    def _emit(self, data: str, recorded_id: int, live_id: int, due: float):
+        if recorded_id != live_id:
+            frame = json.loads(data)
+            frame["id"] = live_id
+            data = json.dumps(frame)
+        self._queue.put_nowait((due, data))
+
+    async def _rec_coro(self):
+        while True:
+            due, data = await self._queue.get()
+            delay = due - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if data is _END and not self._queue.empty():
+                # responses for commands sent out of order meanwhile
+                self._queue.put_nowait((0, _END))
+                continue
+            if data is _END:
+                # the browser closed the connection within the recording
+                self._closed = True
+                for conn in [self, *self._sessions.values()]:
+                    # noinspection PyProtectedMember
+                    for fut in conn._responses.values():
+                        if not fut.done():
+                            fut.set_exception(websockets.ConnectionClosedError(None, None))
+                break
+            if data is None:
+                break
+            await self._on_frame(data)
+        await self._close_sessions(code=1000, reason="connection closed")
+
+    async def close(self, code: int = 1000, reason: str = ''):
+        if not self._closed:
+            self._closed = True
+            if self._queue is not None:
+                self._queue.put_nowait((0, None))
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def __eq__(self, other):
+        return self is other
+
+    def __hash__(self):
+        return id(self)
@@ -0,0 +1,125 @@
+import json
+import typing
+import uuid
+
+from cdp_socket.exceptions import CDPError
+
+from selenium_driverless.types import JSEvalException
+from selenium_driverless.types.deserialize import StaleJSRemoteObjReference
+
+# random per process, the isolated world isn't accessible to the website anyway
+_KEY = f"_{uuid.uuid4().hex}"
+_MISSING = "selenium-driverless script missing"
+
+_SCRIPTS: typing.Dict[str, str] = {}
+_generation = 0
+
+
+def register_script(name: str, source: str):
+    """register a helper function, installed once per execution context
+    by :class:`ScriptRegistry <selenium_driverless.types.script_registry.ScriptRegistry>`
+
+    .. code-block:: python
+
+        register_script("sum", "function(a, b){return a + b}")
+        assert await target.scripts.call("sum", 1, 2) == 3
+
+    :param name: the name to call the function by
+    :param source: a JavaScript function expression
+    """
+    global _generation
+    if _SCRIPTS.get(name) != source:
+        _SCRIPTS[name] = source
+        _generation += 1
+
+
+class ScriptRegistry:
+    """calls the helper functions registered with
+    :func:`register_script <selenium_driverless.types.script_registry.register_script>` on a target.
+    All helpers get installed on a hidden global once per (isolated) execution context,
+    each call then only sends a short stub and the arguments.
+
+    .. note::
+        usually accessed with :func:`Target.scripts <selenium_driverless.types.target.Target.scripts>`
+
+    .. note::
+        helpers sent within :func:`Target.execute_cdp_batch <selenium_driverless.types.target.Target.execute_cdp_batch>`
+        (like the visibility check of :func:`WebElement.geometry <selenium_driverless.types.webelement.WebElement.geometry>`)
+        stay plain ``Runtime.callFunctionOn`` declarations, as the batch can't install the helpers first
+    """
+
+    def __init__(self, target):
+        from selenium_driverless.types.target import Target
+        self._target: Target = target
+        # context_id => generation installed
+        self._installed: typing.Dict[int, int] = {}
+
+    @staticmethod
+    def _stub(name: str) -> str:
+        return ("function(...args){const h = globalThis[%s]; if(h === undefined || h[%s] === undefined)"
+                "{throw new ReferenceError(%s)} return h[%s].apply(this, args)}"
+                % (json.dumps(_KEY), json.dumps(name), json.dumps(_MISSING), json.dumps(name)))
+
+    async def _install(self, context_id: int):
+        generation = _generation
+        helpers = ",".join(f"{json.dumps(name)}: ({source})" for name, source in _SCRIPTS.items())
+        expression = ("Object.defineProperty(globalThis, %s, {value: {%s}, enumerable: false, configurable: true});"
+                      "true" % (json.dumps(_KEY), helpers))
+        try:
+            res = await self._target.execute_cdp_cmd("Runtime.evaluate", {"expression": expression,
+                                                                           "contextId": context_id,
+                                                                           "returnByValue": True})
+        except CDPError as e:
+            if e.code == -32000 and e.message == 'Cannot find context with specified id':
+                raise StaleJSRemoteObjReference(_object=f"context {context_id}")
+            raise e
+        if "exceptionDetails" in res.keys():
+            raise JSEvalException(res["exceptionDetails"])
+        self._installed[context_id] = generation
+
+    async def call(self, name: str, *args, obj=None, await_res: bool = False, serialization: str = None,
+                   max_depth: int = None, timeout: float = 10, plain: bool = False):
+        """call a registered helper in the isolated execution context
+
+        :param name: the name of the helper
+        :param args: the arguments passed to the helper
+        :param obj: a :class:`JSRemoteObj <selenium_driverless.types.deserialize.JSRemoteObj>` (for example
+            :class:`WebElement <selenium_driverless.types.webelement.WebElement>`) to pass as the first argument,
+            within its frame
+        :param await_res: whether to await the returned promise
+        :param serialization: can be one of ``deep``, ``json``, ``idOnly``
+        :param max_depth: The maximum depth objects get serialized.
+        :param timeout: the maximum time to wait for the execution to complete
+        :param plain: return ``dict`` and ``list`` instead of ``JSObject`` and ``JSArray``
+        """
+        if name not in _SCRIPTS:
+            raise KeyError(f"no script registered as {name}")
+        target = self._target
+        for _ in range(2):
+            if obj is None:
+                # noinspection PyProtectedMember
+                context_id = await target._isolated_context_id
+                # noinspection PyProtectedMember
+                remote = await target._global_this(context_id)
+                _args = args
+            else:
+                context_id = await obj.__isolated_exec_id__
+                remote = obj
+                _args = (obj, *args)
+            if self._installed.get(context_id) != _generation:
+                await self._install(context_id)
+            try:
+                return await remote.__exec_raw__(self._stub(name), *_args, await_res=await_res,
+                                                 serialization=serialization, max_depth=max_depth, timeout=timeout,
+                                                 execution_context_id=context_id, unique_context=False, plain=plain)
+            except JSEvalException as e:
+                # context got replaced, and its id re-used
+                if e.class_name == "ReferenceError" and _MISSING in e.description:
+                    self._installed.pop(context_id, None)
+                    continue
+                raise e
+        raise StaleJSRemoteObjReference(_object=f"context {context_id}",
+                                        message=f"couldn't install scripts in context {context_id}")
+
+    def _forget(self, context_id: int):
+        self._installed.pop(context_id, None)
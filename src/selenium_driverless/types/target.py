@@ -5,26 +5,39 @@ import json
 import os.path
 import time
 import typing
+import weakref
 from typing_extensions import TypedDict
 import warnings
 from base64 import b64decode
 import aiofiles
 from typing import List
 import pathlib
-import random
 
 import websockets
 from cdp_socket.exceptions import CDPError
-from cdp_socket.socket import SingleCDPSocket
+from selenium_driverless.types.connection import Connection
+from selenium_driverless.utils.codec import Codec
 
 # pointer
 from selenium_driverless.sync.pointer import Pointer as SyncPointer
 from selenium_driverless.input.pointer import Pointer
+from selenium_driverless.sync.scheduler import InputScheduler as SyncInputScheduler
+from selenium_driverless.input.scheduler import InputScheduler
+# keyboard
+from selenium_driverless.sync.keyboard import Keyboard as SyncKeyboard
+from selenium_driverless.input.keyboard import Keyboard, TimingModel
+# noinspection PyUnresolvedReferences
+from selenium_driverless.input.keyboard import KEY_MAPPING, SHIFT_KEY_NEEDED  # used to live here
 # other
-from selenium_driverless.scripts.driver_utils import get_targets, get_target, get_cookies, get_cookie, delete_cookie, \
+from selenium_driverless.scripts.driver_utils import get_targets, get_target, make_target, get_cookies, get_cookie, delete_cookie, \
     delete_all_cookies, add_cookie
 from selenium_driverless.utils.utils import safe_wrap_fut
-from selenium_driverless.types.deserialize import StaleJSRemoteObjReference
+from selenium_driverless.types.deserialize import StaleJSRemoteObjReference, JSRemoteObj
+from selenium_driverless.types.execution_contexts import ExecutionContextTracker
+from selenium_driverless.types.dom_mirror import DomMirror
+from selenium_driverless.sync.dom_mirror import DomMirror as SyncDomMirror
+from selenium_driverless.types.object_group import ObjectGroup, current_group, new_group_name
+from selenium_driverless.types.script_registry import ScriptRegistry, register_script
 from selenium_driverless.types.webelement import StaleElementReferenceException, NoSuchElementException
 from selenium_driverless.sync.alert import Alert as SyncAlert
 # Alert
@@ -32,33 +45,56 @@ from selenium_driverless.types.alert import Alert
 from selenium_driverless.types.webelement import WebElement
 from selenium_driverless.sync.webelement import WebElement as SyncWebElement
 
-KEY_MAPPING = {
-    'a': ('KeyA', 65), 'b': ('KeyB', 66), 'c': ('KeyC', 67), 'd': ('KeyD', 68), 'e': ('KeyE', 69),
-    'f': ('KeyF', 70), 'g': ('KeyG', 71), 'h': ('KeyH', 72), 'i': ('KeyI', 73), 'j': ('KeyJ', 74),
-    'k': ('KeyK', 75), 'l': ('KeyL', 76), 'm': ('KeyM', 77), 'n': ('KeyN', 78), 'o': ('KeyO', 79),
-    'p': ('KeyP', 80), 'q': ('KeyQ', 81), 'r': ('KeyR', 82), 's': ('KeyS', 83), 't': ('KeyT', 84),
-    'u': ('KeyU', 85), 'v': ('KeyV', 86), 'w': ('KeyW', 87), 'x': ('KeyX', 88), 'y': ('KeyY', 89),
-    'z': ('KeyZ', 90), 'A': ('KeyA', 65), 'B': ('KeyB', 66), 'C': ('KeyC', 67), 'D': ('KeyD', 68),
-    'E': ('KeyE', 69), 'F': ('KeyF', 70), 'G': ('KeyG', 71), 'H': ('KeyH', 72), 'I': ('KeyI', 73),
-    'J': ('KeyJ', 74), 'K': ('KeyK', 75), 'L': ('KeyL', 76), 'M': ('KeyM', 77), 'N': ('KeyN', 78),
-    'O': ('KeyO', 79), 'P': ('KeyP', 80), 'Q': ('KeyQ', 81), 'R': ('KeyR', 82), 'S': ('KeyS', 83),
-    'T': ('KeyT', 84), 'U': ('KeyU', 85), 'V': ('KeyV', 86), 'W': ('KeyW', 87), 'X': ('KeyX', 88),
-    'Y': ('KeyY', 89), 'Z': ('KeyZ', 90), '0': ('Digit0', 48), '1': ('Digit1', 49), '2': ('Digit2', 50),
-    '3': ('Digit3', 51), '4': ('Digit4', 52), '5': ('Digit5', 53), '6': ('Digit6', 54), '7': ('Digit7', 55),
-    '8': ('Digit8', 56), '9': ('Digit9', 57), '!': ('Digit1', 49), '"': ('Quote', 222), '#': ('Digit3', 51),
-    '$': ('Digit4', 52), '%': ('Digit5', 53), '&': ('Digit7', 55), "'": ('Quote', 222), '(': ('Digit9', 57),
-    ')': ('Digit0', 48), '*': ('Digit8', 56), '+': ('Equal', 187), ',': ('Comma', 188), '-': ('Minus', 189),
-    '.': ('Period', 190), '/': ('Slash', 191), ':': ('Semicolon', 186), ';': ('Semicolon', 186),
-    '<': ('Comma', 188),
-    '=': ('Equal', 187), '>': ('Period', 190), '?': ('Slash', 191), '@': ('Digit2', 50),
-    '[': ('BracketLeft', 219),
-    '\\': ('Backslash', 220), ']': ('BracketRight', 221), '^': ('Digit6', 54), '_': ('Minus', 189),
-    '`': ('Backquote', 192),
-    '{': ('BracketLeft', 219), '|': ('Backslash', 220), '}': ('BracketRight', 221), '~': ('Backquote', 192),
-    ' ': ('Space', 32), '\r': ('Enter', 13)
-}
-
-SHIFT_KEY_NEEDED = '~!@#$%^&*()_+{}|:"<>?'
+
+register_script("fetch", """
+    async function(url, options){
+        async function bufferTobase64(array) {
+          return new Promise((resolve) => {
+            const blob = new Blob([array]);
+            const reader = new FileReader();
+
+            reader.onload = (event) => {
+              const dataUrl = event.target.result;
+              const [_, base64] = dataUrl.split(',');
+
+              resolve(base64);
+            };
+
+            reader.readAsDataURL(blob);
+          });
+        };
+        async function base64ToBuffer(base64) {
+          const dataUrl = "data:application/octet-binary;base64," + base64;
+
+          const res = await fetch(dataUrl)
+          return await res.arrayBuffer()
+        };
+
+        function headers2dict(headers){
+            var my_dict = {};
+            for (var pair of headers.entries()) {
+                    my_dict[pair[0]] = pair[1]};
+            return my_dict}
+
+        async function get(url, options){
+            if(options.body){options.body = await base64ToBuffer(options.body)}
+            var response = await fetch(url, options);
+            var buffer = await response.arrayBuffer()
+            var b64 = await bufferTobase64(buffer)
+            var res = {
+                    "b64":b64,
+                    "headers":headers2dict(response.headers),
+                    "ok":response.ok,
+                    "status_code":response.status,
+                    "redirected":response.redirected,
+                    "status_text":response.statusText,
+                    "type":response.type,
+                    "url":response.url
+                    };
+            return res;
+        }
+        return await get(url, options)
+    }""")
 
 
 class NoSuchIframe(Exception):
@@ -78,15 +114,19 @@ class Target:
     # noinspection PyShadowingBuiltins
     def __init__(self, host: str, target_id: str, driver, context, is_remote: bool = False,
                  loop: asyncio.AbstractEventLoop or None = None, timeout: float = 30,
-                 type: str = None, start_socket: bool = False, max_ws_size: int = 2 ** 20) -> None:
+                 type: str = None, start_socket: bool = False, max_ws_size: int = 2 ** 20,
+                 codec: typing.Union[str, Codec, None] = None) -> None:
         from selenium_driverless.types.context import Context
         self._parent_target = None
         self._context: Context = context
         self._window_id = None
         self._pointer = None
+        self._input_scheduler = None
+        self._keyboard = None
         self._page_enabled = None
         self._dom_enabled = None
         self._max_ws_size = max_ws_size
+        self._codec = codec
 
         self._global_this_ = {}
         self._document_elem_ = None
@@ -94,7 +134,16 @@ class Target:
 
         self._targets: list = []
         self._socket = None
+        self._connecting: typing.Optional[asyncio.Future] = None
         self._isolated_context_id_ = None
+        # frame_id => future of the isolated world's Runtime.ExecutionContextId
+        self._isolated_worlds: typing.Dict[str, asyncio.Future] = {}
+        self._base_frame_id = None
+        self._execution_contexts = ExecutionContextTracker(self)
+        self._dom_mirror: typing.Optional[DomMirror] = None
+        self._default_object_group = new_group_name()
+        self._scripts = ScriptRegistry(self)
+        self._pending_releases: typing.List[str] = []
         self._exec_context_id_ = ""
         self._targets: typing.Dict[str, Target] = {}
 
@@ -110,7 +159,6 @@ class Target:
         self._on_closed_ = []
 
         self._driver = driver
-        self._send_key_lock = asyncio.Lock()
 
     def __repr__(self):
         return f'<{type(self).__module__}.{type(self).__name__} (target_id="{self.id}", host="{self._host}")>'
@@ -131,12 +179,15 @@ class Target:
         return self._driver.base_target
 
     @property
-    def socket(self) -> SingleCDPSocket:
+    def socket(self) -> Connection:
         """the cdp-socket for the connection"""
         return self._socket
 
     def __eq__(self, other):
         if isinstance(other, Target):
+            if self.socket is None or other.socket is None:
+                # not connected yet
+                return self.id == other.id
             return other.socket == self.socket
         return False
 
@@ -162,12 +213,29 @@ class Target:
 
     async def _init(self):
         if not self._socket:
-            self._socket = await SingleCDPSocket(websock_url=f'ws://{self._host}/devtools/page/{self._id}',
-                                                 timeout=self._timeout, loop=self._loop, max_size=self._max_ws_size)
-            if self._loop:
-                self._pointer = SyncPointer(target=self, loop=self._loop)
+            # concurrent commands on a lazily connected target
+            if self._connecting is None:
+                self._connecting = asyncio.ensure_future(self._connect())
+            try:
+                await asyncio.shield(self._connecting)
+            finally:
+                if self._connecting is not None and self._connecting.done():
+                    self._connecting = None
+        return self
+
+    async def _connect(self):
+        if not self._socket:
+            base_target = self.base_target
+            if base_target is not None and base_target.flatten:
+                self._socket = await base_target.attach(self._id, timeout=self._timeout)
             else:
-                self._pointer = Pointer(target=self)
+                codec = self._codec
+                if codec is None and base_target is not None:
+                    codec = base_target.codec
+                self._socket = await Connection(websock_url=f'ws://{self._host}/devtools/page/{self._id}',
+                                                timeout=self._timeout, loop=self._loop,
+                                                max_size=self._max_ws_size, codec=codec,
+                                                metrics=base_target.metrics if base_target is not None else None)
 
             def set_alert(alert):
                 self._alert = alert
@@ -180,8 +248,8 @@ class Target:
             await self.add_cdp_listener("Page.javascriptDialogClosed", remove_alert)
             await self.add_cdp_listener("Page.loadEventFired", self._on_loaded)
             await self.add_cdp_listener("Page.windowOpen", self._on_loaded)
-            self.socket.on_closed.extend(self._on_closed)
-        return self
+            await self.add_cdp_listener("Page.frameNavigated", self._on_frame_navigated)
+            self.socket.on_closed.extend(self._on_closed_)
 
     @property
     def _on_closed(self):
@@ -195,8 +263,90 @@ class Target:
         self._global_this_ = {}
         self._document_elem_ = None
         self._isolated_context_id_ = None
+        self._isolated_worlds = {}
         self._exec_context_id_ = None
 
+    def _on_frame_navigated(self, params: dict):
+        frame = params["frame"]
+        if frame.get("parentId"):
+            self._isolated_worlds.pop(frame["id"], None)
+        else:
+            # child frames are gone as well
+            self._isolated_worlds = {}
+            # a new default object group per navigation
+            group = self._default_object_group
+            self._default_object_group = new_group_name()
+            safe_wrap_fut(self._release_object_group(group))
+
+    def object_group(self, name: str = None) -> ObjectGroup:
+        """an object group for the current task, released when the scope ends.
+        See :class:`ObjectGroup <selenium_driverless.types.object_group.ObjectGroup>`
+
+        .. code-block:: python
+
+            async with target.object_group():
+                elems = await target.find_elements(By.TAG_NAME, "a")
+                links = [await elem.get_attribute("href") for elem in elems]
+
+        :param name: the name of the group, a random one by default
+        """
+        return ObjectGroup(self, name=name)
+
+    @property
+    def default_object_group(self) -> str:
+        """the object group used outside of :func:`Target.object_group <selenium_driverless.types.target.Target.object_group>`,
+        a new one is used and the previous one released on each navigation"""
+        return self._default_object_group
+
+    @property
+    def _object_group_name(self) -> str:
+        group = current_group(self)
+        if group is not None:
+            return group.name
+        return self._default_object_group
+
+    def _own_object(self, wrapper, obj_id: str):
+        # release obj_id once it can't be used anymore
+        if not obj_id:
+            return
+        group = current_group(self)
+        if group is not None:
+            if isinstance(wrapper, WebElement):
+                # noinspection PyProtectedMember
+                group._add_element(wrapper)
+        elif isinstance(wrapper, JSRemoteObj):
+            weakref.finalize(wrapper, self._release_later, obj_id, asyncio.get_running_loop())
+        else:
+            self._release_later(obj_id, asyncio.get_running_loop())
+
+    def _release_later(self, obj_id: str, loop: asyncio.AbstractEventLoop):
+        # might be called by the garbage collector from any thread
+        if not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._queue_release, obj_id)
+            except RuntimeError:
+                # loop closed meanwhile
+                pass
+
+    def _queue_release(self, obj_id: str):
+        self._pending_releases.append(obj_id)
+        if len(self._pending_releases) == 1:
+            # all collected within this iteration at once
+            asyncio.get_running_loop().call_soon(self._flush_releases)
+
+    def _flush_releases(self):
+        obj_ids = self._pending_releases
+        self._pending_releases = []
+        if obj_ids and self._socket and not self._socket.closed:
+            safe_wrap_fut(self.execute_cdp_batch([("Runtime.releaseObject", {"objectId": obj_id})
+                                                  for obj_id in obj_ids]))
+
+    async def _release_object_group(self, name: str):
+        try:
+            await self.execute_cdp_cmd("Runtime.releaseObjectGroup", {"objectGroup": name})
+        except (CDPError, websockets.ConnectionClosedError, ConnectionResetError):
+            pass
+
     async def get_alert(self, timeout: float = 5):
         if not self._page_enabled:
             await self.execute_cdp_cmd("Page.enable", timeout=timeout)
@@ -222,13 +372,14 @@ class Target:
         if not iframes:
             raise ValueError(f"Expected WebElements, but got{iframes}")
 
-        async def target_getter(target_id: str, timeout: float = 2, max_ws_size: int = 2 ** 20):
-            return await get_target(target_id=target_id, host=self._host, loop=self._loop, is_remote=self._is_remote,
-                                    timeout=timeout, max_ws_size=max_ws_size, driver=self._driver,
-                                    context=self._context)
+        def target_getter(target_id: str, timeout: float = 2, max_ws_size: int = 2 ** 20):
+            return make_target(target_id=target_id, host=self._host, loop=self._loop, is_remote=self._is_remote,
+                               timeout=timeout, max_ws_size=max_ws_size, driver=self._driver,
+                               context=self._context)
 
         _targets = await get_targets(cdp_exec=self.execute_cdp_cmd, target_getter=target_getter,
-                                     _type="iframe", context_id=self._context_id, max_ws_size=self._max_ws_size)
+                                     _type="iframe", context_id=self._context_id, max_ws_size=self._max_ws_size,
+                                     registry=self.base_target.registry)
         targets = {}
 
         for targetinfo in list(_targets.values()):
@@ -384,7 +535,9 @@ class Target:
             from selenium_driverless.types import JSEvalException
             args = {"expression": "globalThis",
                     "serializationOptions": {
-                        "serialization": "idOnly"}}
+                        "serialization": "idOnly"},
+                    # cached until the next navigation
+                    "objectGroup": self._default_object_group}
             if context_id:
                 args["contextId"] = context_id
             try:
@@ -416,83 +569,184 @@ class Target:
 
     @property
     async def _isolated_context_id(self) -> int:
-        doc = await self._document_elem
-        return await doc.__isolated_exec_id__
+        return await self._isolated_world()
+
+    async def _isolated_world(self, frame_id: str = None) -> int:
+        """the ``Runtime.ExecutionContextId`` of the isolated world for a frame,
+        created once per document and shared by all remote objects of the frame
+
+        :param frame_id: the ``Page.FrameId``, defaults to the main frame
+        """
+        if frame_id is None:
+            if self._base_frame_id is None:
+                base_frame = await self.base_frame
+                if base_frame:
+                    self._base_frame_id = base_frame["id"]
+            frame_id = self._base_frame_id
+        fut = self._isolated_worlds.get(frame_id)
+        if fut is None:
+            fut = asyncio.get_running_loop().create_future()
+            self._isolated_worlds[frame_id] = fut
+            try:
+                # noinspection SpellCheckingInspection
+                res = await self.execute_cdp_cmd(
+                    "Page.createIsolatedWorld",
+                    # yes the following typo is actually not a typo:) see
+                    # https://source.chromium.org/chromium/chromium/src/+/main:out/android-Debug/gen/third_party/blink/renderer/core/inspector/protocol/page.cc;l=1284-1288;drc=d9d30d5b272205375f655202e169d681c3bed0c7
+                    {"frameId": frame_id, "grantUniveralAccess": True,
+                     "worldName": "Isolated execution context with DOM-access, You got here hehe:)"})
+            except Exception as e:
+                if self._isolated_worlds.get(frame_id) is fut:
+                    del self._isolated_worlds[frame_id]
+                fut.set_exception(e)
+                # retrieved by concurrent callers only
+                fut.exception()
+                raise e
+            fut.set_result(res["executionContextId"])
+        return await asyncio.shield(fut)
+
+    def _forget_context(self, context_id: int):
+        # called by ExecutionContextTracker on Runtime.executionContextDestroyed
+        self._global_this_.pop(context_id, None)
+        if self._exec_context_id_ == context_id:
+            self._exec_context_id_ = None
+        self._discard_isolated_world(context_id)
+        self._scripts._forget(context_id)
+
+    @property
+    def scripts(self) -> ScriptRegistry:
+        """calls helper functions installed once per execution context,
+        see :class:`ScriptRegistry <selenium_driverless.types.script_registry.ScriptRegistry>`
+        """
+        return self._scripts
+
+    @property
+    def execution_contexts(self) -> ExecutionContextTracker:
+        """the execution contexts of all frames, kept current by events once started,
+        see :class:`ExecutionContextTracker <selenium_driverless.types.execution_contexts.ExecutionContextTracker>`
+        """
+        return self._execution_contexts
+
+    async def track_execution_contexts(self, timeout: float = 10) -> ExecutionContextTracker:
+        """start tracking execution contexts by events.
+        Scripts executed then wait for the new document after a reload or navigation, instead of retrying.
+
+        .. warning::
+            sends ``Runtime.enable``, which is detectable by the website
+
+        :param timeout: timeout in seconds
+        """
+        return await self._execution_contexts.start(timeout=timeout)
+
+    @property
+    def dom_mirror(self) -> DomMirror:
+        """the in-memory copy of the DOM, kept current by events once started,
+        see :class:`DomMirror <selenium_driverless.types.dom_mirror.DomMirror>`
+        """
+        if self._dom_mirror is None:
+            if self._loop:
+                self._dom_mirror = SyncDomMirror(self, loop=self._loop)
+            else:
+                self._dom_mirror = DomMirror(self)
+        return self._dom_mirror
+
+    async def mirror_dom(self, timeout: float = 10) -> DomMirror:
+        """load the DOM into memory and keep it current by ``DOM`` events.
+        Queries on the mirror then don't need any CDP traffic.
+
+        .. code-block:: python
+
+            mirror = await target.mirror_dom()
+            texts = [node.text for node in mirror.find_nodes(By.CSS_SELECTOR, "li")]
+
+        :param timeout: timeout in seconds
+        """
+        return await self.dom_mirror.start(timeout=timeout)
+
+    def _discard_isolated_world(self, context_id: int):
+        # the world got destroyed without the frame navigating, for example by document.open()
+        for frame_id, fut in list(self._isolated_worlds.items()):
+            if fut.done() and not fut.exception() and fut.result() == context_id:
+                del self._isolated_worlds[frame_id]
 
     @property
     def pointer(self) -> Pointer:
         """the :class:`Pointer <selenium_driverless.input.pointer.Pointer>` for this target"""
+        if self._pointer is None:
+            if self._loop:
+                self._pointer = SyncPointer(target=self, loop=self._loop)
+            else:
+                self._pointer = Pointer(target=self)
         return self._pointer
 
-    async def send_keys(self, text: str, allow_not_on_mapping: bool = True):
+    @property
+    def input_scheduler(self) -> InputScheduler:
+        """dispatches the input events of this target at deadlines,
+        see :class:`InputScheduler <selenium_driverless.input.scheduler.InputScheduler>`
+        """
+        if self._input_scheduler is None:
+            if self._loop:
+                self._input_scheduler = SyncInputScheduler(self, loop=self._loop)
+            else:
+                self._input_scheduler = InputScheduler(self)
+        return self._input_scheduler
+
+    @property
+    def keyboard(self) -> Keyboard:
+        """the :class:`Keyboard <selenium_driverless.input.keyboard.Keyboard>` for this target"""
+        if self._keyboard is None:
+            if self._loop:
+                self._keyboard = SyncKeyboard(target=self, loop=self._loop)
+            else:
+                self._keyboard = Keyboard(target=self)
+        return self._keyboard
+
+    async def send_keys(self, text: typing.Union[str, typing.Iterable[str]], allow_not_on_mapping: bool = True,
+                        timing: typing.Union[str, TimingModel, None] = None):
         """
         send text & keys to the target
 
-        :param text: the text to send to the target
+        :param text: the text to send to the target, or a list of segments.
+            Segments of type :class:`InsertText <selenium_driverless.input.keyboard.InsertText>` are inserted at once with ``Input.insertText``
         :param allow_not_on_mapping: allow keys which aren't int the keyboard mapping
+        :param timing: ``"human"``, ``"fast"``, ``"instant"`` or a :class:`TimingModel <selenium_driverless.input.keyboard.TimingModel>`,
+            defaults to :attr:`Keyboard.timing <selenium_driverless.input.keyboard.Keyboard.timing>`
         """
-        async with self._send_key_lock:
-            for letter in text:
-                if letter in KEY_MAPPING:
-                    if letter == "\n":
-                        letter = "\r"
-                    key_code, virtual_key_code = KEY_MAPPING[letter]
-                elif allow_not_on_mapping:
-                    key_code, virtual_key_code = 0, 0
-                else:
-                    raise ValueError(f"letter:{letter} not in keyboard mapping")
-
-                # Determine if a shift key is needed
-                shift_pressed = False
-                if letter.isupper() or letter in SHIFT_KEY_NEEDED:
-                    shift_pressed = True
-                    await self.execute_cdp_cmd("Input.dispatchKeyEvent", {
-                        "type": "keyDown",
-                        "code": "ShiftLeft",
-                        "windowsVirtualKeyCode": 16,
-                        "key": "Shift",
-                        "modifiers": 8 if shift_pressed else 0
-                    })
-                await asyncio.sleep(random.uniform(0.01, 0.05))  # Simulate human typing speed
-
-                key_event = {
-                    "type": "keyDown",
-                    "code": key_code,
-                    "windowsVirtualKeyCode": virtual_key_code,
-                    "key": letter,
-                    "modifiers": 8 if shift_pressed else 0
-                }
-
-                # Send keydown event
-                await self.execute_cdp_cmd("Input.dispatchKeyEvent", key_event)
-                await asyncio.sleep(random.uniform(0.01, 0.05))
-
-                # Simulate key press for the actual character
-                key_event["type"] = "char"
-                key_event["text"] = letter
-                await self.execute_cdp_cmd("Input.dispatchKeyEvent", key_event)
-                await asyncio.sleep(random.uniform(0.01, 0.05))
-                del key_event['text']
-
-                # Simulate key release
-                key_event["type"] = "keyUp"
-                await self.execute_cdp_cmd("Input.dispatchKeyEvent", key_event)
-                await asyncio.sleep(random.uniform(0.01, 0.05))
-
-                # Release the shift key if it was pressed
-                if shift_pressed:
-                    await self.execute_cdp_cmd("Input.dispatchKeyEvent", {
-                        "type": "keyUp",
-                        "code": "ShiftLeft",
-                        "windowsVirtualKeyCode": 16,
-                        "key": "Shift",
-                        "modifiers": 0
-                    })
-                    await asyncio.sleep(random.uniform(0.01, 0.05))  # Simulate human typing speed
+        await self.keyboard.send_keys(text, timing=timing, allow_not_on_mapping=allow_not_on_mapping)
+
+    async def _exec_retrying(self, method: str, script: str, *args, timeout: float = 2,
+                             execution_context_id: str = None, unique_context: bool = True, **kwargs):
+        if timeout is None:
+            timeout = 2
+        start = time.perf_counter()
+        exc = None
+        while (time.perf_counter() - start) < timeout:
+            context_id = execution_context_id
+            if not context_id and unique_context:
+                context_id = await self._isolated_context_id
+            try:
+                global_this = await self._global_this(context_id)
+                # each attempt only gets the time left
+                remaining = max(timeout - (time.perf_counter() - start), 0.001)
+                return await getattr(global_this, method)(script, *args, timeout=remaining,
+                                                          execution_context_id=context_id,
+                                                          unique_context=False, **kwargs)
+            except StaleJSRemoteObjReference as e:
+                exc = e
+            if self._execution_contexts.started:
+                # wait for the new document instead of retrying until it exists
+                try:
+                    await self._execution_contexts.wait_for(timeout=timeout - (time.perf_counter() - start))
+                except asyncio.TimeoutError:
+                    break
+            else:
+                await asyncio.sleep(0)
+        raise asyncio.TimeoutError(f"Couldn't execute script due to stale reference within {timeout} s, "
+                                   f"possibly due to a reload loop") from exc
 
     async def execute_raw_script(self, script: str, *args, await_res: bool = False, serialization: str = None,
                                  max_depth: int = None, timeout: float = 2, execution_context_id: str = None,
-                                 unique_context: bool = True):
+                                 unique_context: bool = True, plain: bool = False):
         """executes a JavaScript on ``GlobalThis`` such as
 
         .. code-block:: js
@@ -507,39 +761,21 @@ class Target:
         :param timeout: the maximum time to wait for the execution to complete
         :param execution_context_id: the execution context id to run the JavaScript in. Exclusive with unique_context
         :param unique_context: whether to use a isolated context to run the Script in.
+        :param plain: return ``dict`` and ``list`` instead of ``JSObject`` and ``JSArray``, decoded faster
 
         see `Runtime.callFunctionOn <https://chromedevtools.github.io/devtools-protocol/tot/Runtime/#method-callFunctionOn>`_
         """
 
         if execution_context_id and unique_context:
             warnings.warn("got execution_context_id and unique_context=True, defaulting to execution_context_id")
-        if unique_context:
-            execution_context_id = await self._isolated_context_id
-
-        if timeout is None:
-            timeout = 2
-
-        start = time.perf_counter()
-        exc = None
-        while (time.perf_counter() - start) > timeout:
-            try:
-                global_this = await self._global_this(execution_context_id)
-                res = await global_this.__exec_raw__(script, *args, await_res=await_res, serialization=serialization,
-                                                     max_depth=max_depth, timeout=timeout,
-                                                     execution_context_id=execution_context_id, unique_context=False)
-            except StaleJSRemoteObjReference as e:
-                exc = e
-            else:
-                return res
-        if exc:
-            raise exc
-        else:
-            raise asyncio.TimeoutError(f"Couldn't execute script due to stale reference within {timeout} s, "
-                                       f"possibly due to a reload loop")
+        return await self._exec_retrying("__exec_raw__", script, *args, await_res=await_res, max_depth=max_depth,
+                                         serialization=serialization, timeout=timeout,
+                                         execution_context_id=execution_context_id, unique_context=unique_context,
+                                         plain=plain)
 
     async def execute_script(self, script: str, *args, max_depth: int = 2, serialization: str = None,
                              timeout: float = 2, execution_context_id: str = None,
-                             unique_context: bool = True):
+                             unique_context: bool = True, plain: bool = False):
         """executes JavaScript synchronously on ``GlobalThis`` such as
 
         .. code-block:: js
@@ -550,27 +786,14 @@ class Target:
         """
         if execution_context_id and unique_context:
             warnings.warn("got execution_context_id and unique_context=True, defaulting to execution_context_id")
-        if unique_context:
-            execution_context_id = await self._isolated_context_id
-        if timeout is None:
-            timeout = 2
-
-        start = time.perf_counter()
-        while (time.perf_counter() - start) < timeout:
-            global_this = await self._global_this(execution_context_id)
-            try:
-                res = await global_this.__exec__(script, *args, serialization=serialization,
-                                                 max_depth=max_depth, timeout=timeout,
-                                                 execution_context_id=execution_context_id,
-                                                 unique_context=False)
-                return res
-            except StaleJSRemoteObjReference:
-                pass
-        raise asyncio.TimeoutError("Couldn't execute script, possibly due to a reload loop")
+        return await self._exec_retrying("__exec__", script, *args, max_depth=max_depth,
+                                         serialization=serialization, timeout=timeout,
+                                         execution_context_id=execution_context_id, unique_context=unique_context,
+                                         plain=plain)
 
     async def execute_async_script(self, script: str, *args, max_depth: int = 2, serialization: str = None,
                                    timeout: float = 2, execution_context_id: str = None,
-                                   unique_context: bool = None):
+                                   unique_context: bool = None, plain: bool = False):
         """executes JavaScript asynchronously on ``GlobalThis``
 
         .. code-block:: js
@@ -581,27 +804,14 @@ class Target:
         """
         if execution_context_id and unique_context:
             warnings.warn("got execution_context_id and unique_context=True, defaulting to execution_context_id")
-        if unique_context:
-            execution_context_id = await self._isolated_context_id
-        if timeout is None:
-            timeout = 2
-
-        start = time.perf_counter()
-        while (time.perf_counter() - start) < timeout:
-            global_this = await self._global_this(execution_context_id)
-            try:
-                res = await global_this.__exec_async__(script, *args, serialization=serialization,
-                                                       max_depth=max_depth, timeout=timeout,
-                                                       execution_context_id=execution_context_id,
-                                                       unique_context=False)
-                return res
-            except StaleJSRemoteObjReference:
-                await asyncio.sleep(0)
-        raise asyncio.TimeoutError("Couldn't execute script, possibly due to a reload loop")
+        return await self._exec_retrying("__exec_async__", script, *args, max_depth=max_depth,
+                                         serialization=serialization, timeout=timeout,
+                                         execution_context_id=execution_context_id, unique_context=unique_context,
+                                         plain=plain)
 
     async def eval_async(self, script: str, *args, max_depth: int = 2, serialization: str = None,
                          timeout: float = 2, execution_context_id: str = None,
-                         unique_context: bool = True):
+                         unique_context: bool = True, plain: bool = False):
         """executes JavaScript asynchronously on ``GlobalThis`` such as
 
         .. code-block:: js
@@ -615,23 +825,75 @@ class Target:
         """
         if execution_context_id and unique_context:
             warnings.warn("got execution_context_id and unique_context=True, defaulting to execution_context_id")
-        if unique_context:
-            execution_context_id = await self._isolated_context_id
-        if timeout is None:
-            timeout = 2
+        return await self._exec_retrying("__eval_async__", script, *args, max_depth=max_depth,
+                                         serialization=serialization, timeout=timeout,
+                                         execution_context_id=execution_context_id, unique_context=unique_context,
+                                         plain=plain)
 
-        start = time.perf_counter()
-        while (time.perf_counter() - start) < timeout:
-            global_this = await self._global_this(execution_context_id)
-            try:
-                res = await global_this.__eval_async__(script, *args, serialization=serialization,
-                                                       max_depth=max_depth, timeout=timeout,
-                                                       execution_context_id=execution_context_id,
-                                                       unique_context=False)
-                return res
-            except StaleJSRemoteObjReference:
-                await asyncio.sleep(0)
-        raise asyncio.TimeoutError("Couldn't execute script, possibly due to a reload loop")
+    async def execute_script_many(self, script: str, elements: typing.Iterable[WebElement], *args,
+                                  max_depth: int = 2, serialization: str = None, timeout: float = 10,
+                                  plain: bool = False) -> list:
+        """executes JavaScript synchronously for multiple elements, with a single call per frame.
+        ``obj`` and ``this`` refer to the current element.
+
+        .. code-block:: python
+
+            elems = await target.find_elements(By.CSS_SELECTOR, "a")
+            hrefs = await target.execute_script_many("return obj.href", elems)
+
+        :param script: the script as a string
+        :param elements: the elements to execute the script for
+        :param args: the arguments passed to each call
+        :param max_depth: The maximum depth objects get serialized.
+        :param serialization: can be one of ``deep``, ``json``, ``idOnly``
+        :param timeout: the maximum time to wait for the execution to complete
+        :param plain: return ``dict`` and ``list`` instead of ``JSObject`` and ``JSArray``, decoded faster
+
+        :Returns:
+            a list with the result for each element, in order
+        """
+        elements = list(elements)
+        # context_id => [(index, element)]
+        groups: typing.Dict[int, typing.List[typing.Tuple[int, WebElement]]] = {}
+        for idx, elem in enumerate(elements):
+            context_id = await elem.__isolated_exec_id__
+            groups.setdefault(context_id, []).append((idx, elem))
+
+        script = """
+            (function(n, ...all){
+                const args = all.slice(n);
+                const fn = function(...arguments){
+                    const obj = this;
+                    """ + script + """
+                };
+                return all.slice(0, n).map(elem => fn.apply(elem, args))
+            })"""
+        results = [None] * len(elements)
+        for context_id, group in groups.items():
+            # resolve all missing object ids within one round-trip
+            # noinspection PyProtectedMember
+            missing = [elem for _, elem in group if not elem._obj_ids.get(context_id)]
+            if missing:
+                # noinspection PyProtectedMember
+                resolved = await self.execute_cdp_batch([("DOM.resolveNode", elem._resolve_node_args(context_id))
+                                                         for elem in missing], timeout=timeout)
+                for elem, res in zip(missing, resolved):
+                    if isinstance(res, CDPError):
+                        if res.code == -32000 and 'No node with given id found' in res.message:
+                            raise StaleElementReferenceException(elem)
+                        raise res
+                    elif isinstance(res, Exception):
+                        raise res
+                    # noinspection PyProtectedMember
+                    elem._on_resolved(context_id, res)
+            global_this = await self._global_this(context_id)
+            res = await global_this.__exec_raw__(script, len(group), *(elem for _, elem in group), *args,
+                                                 max_depth=max_depth + 1, serialization=serialization,
+                                                 timeout=timeout, execution_context_id=context_id,
+                                                 unique_context=False, plain=plain)
+            for (idx, _), value in zip(group, res):
+                results[idx] = value
+        return results
 
     @property
     async def current_url(self) -> str:
@@ -714,6 +976,13 @@ class Target:
 
     @property
     async def info(self):
+        """**async** the :class:`TargetInfo <selenium_driverless.types.target.TargetInfo>` for this target.
+        Doesn't require a round-trip if tracked by :class:`TargetRegistry <selenium_driverless.types.target_registry.TargetRegistry>`
+        """
+        registry = self.base_target.registry
+        info = registry.get(self.id) if registry.started else None
+        if info is not None:
+            return await TargetInfo(info, self)
         res = await self.execute_cdp_cmd("Target.getTargetInfo", {"targetId": self.id})
         return await TargetInfo(res["targetInfo"], self)
 
@@ -828,19 +1097,29 @@ class Target:
 
         :param cookie_dict: see `Network.CookieParam <https://chromedevtools.github.io/devtools-protocol/tot/Network/#type-CookieParam>`__
         """
-        if not (cookie_dict.get("url") or cookie_dict.get("domain") or cookie_dict.get("path")):
-            cookie_dict["url"] = await self.current_url
+        needs_url = not (cookie_dict.get("url") or cookie_dict.get("domain") or cookie_dict.get("path"))
         context_id = None
         # noinspection PyProtectedMember
-        if self._context._is_incognito:
-            context_id = self.browser_context_id
+        is_incognito = self._context._is_incognito
+        if needs_url or is_incognito:
+            # one Target.getTargetInfo for both
+            info = await self.info
+            if needs_url:
+                cookie_dict["url"] = info.url
+            if is_incognito:
+                context_id = info.browser_context_id
         return await add_cookie(target=self, cookie_dict=cookie_dict, context_id=context_id)
 
     @property
     async def _document_elem(self) -> WebElement:
         if not self._document_elem_:
-            res = await self.execute_cdp_cmd("DOM.getDocument", {"pierce": True})
-            node_id = res["root"]["nodeId"]
+            mirror = self._dom_mirror
+            if mirror is not None and mirror.started and mirror.root is not None:
+                # DOM.getDocument would invalidate the node ids of the mirror
+                node_id = mirror.root.node_id
+            else:
+                res = await self.execute_cdp_cmd("DOM.getDocument", {"pierce": True})
+                node_id = res["root"]["nodeId"]
             frame = await self.base_frame
             frame_id = frame["id"]
             if self._loop:
@@ -859,20 +1138,49 @@ class Target:
         :param value: the actual query to find the element by
         :param timeout: how long to wait for the element to exist
         """
+        if timeout:
+            try:
+                return await self.wait_for_element(by=by, value=value, timeout=timeout)
+            except asyncio.TimeoutError:
+                raise NoSuchElementException()
+        parent = await self._document_elem
+        try:
+            return await parent.find_element(by=by, value=value, timeout=None)
+        except (StaleElementReferenceException, StaleJSRemoteObjReference):
+            await self._on_loaded()
+            raise NoSuchElementException()
+
+    async def wait_for_element(self, by: str, value: str, timeout: float or None = 10,
+                               state: typing.Literal["attached", "visible"] = "attached") -> WebElement:
+        """wait for an element in the current target, without polling.
+        A ``MutationObserver`` in the isolated world resolves once an element matches, and is installed
+        again if the page reloads meanwhile.
+
+        .. code-block:: python
+
+            elem = await target.wait_for_element(By.CSS_SELECTOR, "#submit", state="visible")
+
+        :param by: one of the locators at :func:`By <selenium_driverless.types.by.By>`
+        :param value: the actual query to find the element by
+        :param timeout: how long to wait for the element in seconds, ``None`` for no timeout
+        :param state: ``"attached"`` to wait for the element to exist,
+            ``"visible"`` to additionally wait for it to be displayed
+
+        see :func:`WebElement.wait_for_element <selenium_driverless.types.webelement.WebElement.wait_for_element>`
+        """
         start = time.perf_counter()
-        elem = None
-        while not elem:
+        remaining = timeout
+        while True:
             parent = await self._document_elem
             try:
-                elem = await parent.find_element(by=by, value=value, timeout=None)
-            except (StaleElementReferenceException, NoSuchElementException, StaleJSRemoteObjReference):
+                return await parent.wait_for_element(by=by, value=value, timeout=remaining, state=state)
+            except (StaleElementReferenceException, StaleJSRemoteObjReference):
                 await self._on_loaded()
-            if (not timeout) or (time.perf_counter() - start) > timeout:
-                break
-            await asyncio.sleep(0.01)
-        if not elem:
-            raise NoSuchElementException()
-        return elem
+            if timeout is not None:
+                remaining = timeout - (time.perf_counter() - start)
+                if remaining <= 0:
+                    raise asyncio.TimeoutError(f"no element matching {by}={value} {state} "
+                                               f"within {timeout} seconds")
 
     async def find_elements(self, by: str, value: str, timeout: float = 3) -> typing.List[WebElement]:
         """find multiple elements in the current target
@@ -1116,6 +1424,40 @@ class Target:
         if not self.socket:
             await self._init()
         result = await self.socket.exec(method=cmd, params=cmd_args, timeout=timeout)
+        self._on_cmd_executed(cmd)
+        return result
+
+    async def execute_cdp_batch(self, cmds: typing.Iterable[typing.Tuple[str, typing.Optional[dict]]],
+                                timeout: float or None = 10) -> typing.List[typing.Union[dict, Exception]]:
+        """Execute multiple independent Chrome Devtools Protocol commands within one round-trip.
+        All frames are put on the wire at once (in order), and the replies gathered afterwards.
+
+        :param cmds: list of ``(cmd, cmd_args)``
+        :param timeout: timeout in seconds for all commands
+
+        :Returns:
+            A list with the result for each command, or the exception (:class:`cdp_socket.exceptions.CDPError`, :class:`asyncio.TimeoutError`) it failed with.
+
+        .. code-block:: python
+
+            results = await target.execute_cdp_batch([
+                ("Emulation.setFocusEmulationEnabled", {"enabled": True}),
+                ("Page.getLayoutMetrics", None)
+            ])
+
+        .. note::
+            commands don't wait for each other, don't use it for commands depending on each other's results
+        """
+        if not self.socket:
+            await self._init()
+        cmds = list(cmds)
+        results = await self.socket.exec_batch(cmds, timeout=timeout)
+        for (cmd, _), result in zip(cmds, results):
+            if not isinstance(result, Exception):
+                self._on_cmd_executed(cmd)
+        return results
+
+    def _on_cmd_executed(self, cmd: str):
         if cmd == "Page.enable":
             self._page_enabled = True
         elif cmd == "Page.disable":
@@ -1125,7 +1467,6 @@ class Target:
             self._dom_enabled = True
         elif cmd == "DOM.disable":
             self._dom_enabled = False
-        return result
 
     async def fetch(self, url: str,
                     method: typing.Literal[
@@ -1191,55 +1532,7 @@ class Target:
         if priority:
             options["priority"] = priority
 
-        script = """
-            async function bufferTobase64(array) {
-              return new Promise((resolve) => {
-                const blob = new Blob([array]);
-                const reader = new FileReader();
-                
-                reader.onload = (event) => {
-                  const dataUrl = event.target.result;
-                  const [_, base64] = dataUrl.split(',');
-                  
-                  resolve(base64);
-                };
-                
-                reader.readAsDataURL(blob);
-              });
-            };
-            async function base64ToBuffer(base64) {
-              const dataUrl = "data:application/octet-binary;base64," + base64;
-            
-              const res = await fetch(dataUrl)
-              return await res.arrayBuffer()
-            };
-
-            function headers2dict(headers){
-                var my_dict = {};
-                for (var pair of headers.entries()) {
-                        my_dict[pair[0]] = pair[1]};
-                return my_dict}
-
-            async function get(url, options){
-                if(options.body){options.body = await base64ToBuffer(options.body)}
-                var response = await fetch(url, options);
-                var buffer = await response.arrayBuffer()
-                var b64 = await bufferTobase64(buffer)
-                var res = {
-                        "b64":b64,
-                        "headers":headers2dict(response.headers),
-                        "ok":response.ok,
-                        "status_code":response.status,
-                        "redirected":response.redirected,
-                        "status_text":response.statusText,
-                        "type":response.type,
-                        "url":response.url
-                        };
-                return res;
-            }
-            return await get(arguments[0], arguments[1])
-        """
-        result = await self.eval_async(script, url, options, unique_context=True, timeout=timeout)
+        result = await self.scripts.call("fetch", url, options, await_res=True, max_depth=2, timeout=timeout)
         result["body"] = base64.b64decode(result["b64"])
         del result["b64"]
         return result
@@ -1403,20 +1696,13 @@ class TargetInfo:
 
     .. note::
 
-        the infos are not dynamic
+        the infos are kept current as long as the target is tracked by
+        :class:`TargetRegistry <selenium_driverless.types.target_registry.TargetRegistry>`
     """
 
-    def __init__(self, target_info: dict, target_getter: asyncio.Future or Target):
-        self._id = target_info.get('targetId')
-        self._type = target_info.get("type")
-        self._title = target_info.get("title")
-        self._url = target_info.get("url")
-        self._attached = target_info.get("attached")
-        self._opener_id = target_info.get("openerId")
-        self._can_access_opener = target_info.get('canAccessOpener')
-        self._opener_frame_id = target_info.get("openerFrameId")
-        self._browser_context_id = target_info.get('browserContextId')
-        self._subtype = target_info.get("subtype")
+    def __init__(self, target_info: dict, target_getter: typing.Union[Target, typing.Callable[[], Target]]):
+        # shared with the registry, updated in place
+        self._info = target_info
 
         self._target = target_getter
         self._started = False
@@ -1433,56 +1719,59 @@ class TargetInfo:
     @property
     def Target(self) -> Target:
         """
-        the Target itself
+        the Target itself, created on first access.
+        Connects on the first command executed
         """
+        if not isinstance(self._target, Target):
+            self._target = self._target()
         return self._target
 
     @property
     def id(self) -> str:
         """the ``Target.TargetID``"""
-        return self._id
+        return self._info.get("targetId")
 
     @property
     def type(self) -> str:
-        return self._type
+        return self._info.get("type")
 
     @property
     def title(self) -> str:
-        return self._title
+        return self._info.get("title")
 
     @property
     def url(self) -> str:
-        return self._url
+        return self._info.get("url")
 
     @property
     def attached(self) -> str:
         """Whether the target has an attached client."""
-        return self._attached
+        return self._info.get("attached")
 
     @property
     def opener_id(self) -> str:
         """Opener ``Target.TargetId``"""
-        return self._opener_id
+        return self._info.get("openerId")
 
     @property
     def can_access_opener(self):
         """Whether the target has access to the originating window."""
-        return self._can_access_opener
+        return self._info.get("canAccessOpener")
 
     @property
     def opener_frame_id(self):
         """``Page.FrameId`` of originating window (is only set if target has an opener)."""
-        return self._opener_frame_id
+        return self._info.get("openerFrameId")
 
     @property
     def browser_context_id(self):
         """``Browser.BrowserContextID``"""
-        return self._browser_context_id
+        return self._info.get("browserContextId")
 
     @property
     def subtype(self):
         """Provides additional details for specific target types. For example, for the type of "page", this may be set to "portal" or "prerender"""
-        return self._subtype
+        return self._info.get("subtype")
 
     def __repr__(self):
         return f'{self.__class__.__name__}(type="{self.type}",title="{self.title})"'
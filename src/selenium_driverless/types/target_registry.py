@@ -0,0 +1,127 @@
+import asyncio
+import typing
+
+
+class TargetRegistry:
+    """keeps the ``Target.TargetInfo`` of all targets of a browser in memory,
+    kept current by ``Target.targetCreated``, ``Target.targetInfoChanged`` and ``Target.targetDestroyed``
+    (see ``Target.setDiscoverTargets``).
+
+    The info dicts are updated in place, :class:`TargetInfo <selenium_driverless.types.target.TargetInfo>`
+    instances referencing them therefore stay current as well.
+
+    Not started by default, as discovering targets adds event traffic for the whole browser.
+    Once started with :func:`TargetRegistry.start <selenium_driverless.types.target_registry.TargetRegistry.start>`,
+    listing targets and reading target infos doesn't need a round-trip anymore.
+
+    .. note::
+        usually accessed with :func:`BaseTarget.registry <selenium_driverless.types.base_target.BaseTarget.registry>`
+    """
+
+    def __init__(self, base_target):
+        from selenium_driverless.types.base_target import BaseTarget
+        self._base_target: BaseTarget = base_target
+        self._infos: typing.Dict[str, dict] = {}
+        self._waiters: typing.List[typing.Tuple[typing.Callable[[dict], bool], asyncio.Future]] = []
+        self._started: typing.Optional[asyncio.Future] = None
+
+    @property
+    def started(self) -> bool:
+        """whether the registry receives events"""
+        return self._started is not None and self._started.done() and not self._started.exception()
+
+    @property
+    def infos(self) -> typing.Dict[str, dict]:
+        """the raw ``Target.TargetInfo`` dicts by ``Target.TargetID``, in order of creation"""
+        return self._infos
+
+    def get(self, target_id: str) -> typing.Optional[dict]:
+        """the ``Target.TargetInfo`` dict for a target, ``None`` if it isn't known (anymore)
+
+        :param target_id: the ``Target.TargetID``
+        """
+        return self._infos.get(target_id)
+
+    async def start(self, timeout: float = 10):
+        """start discovering targets, within a single round-trip"""
+        if self._started is None:
+            self._started = asyncio.get_running_loop().create_future()
+            socket = self._base_target.socket
+            socket.add_listener("Target.targetCreated", self._on_info)
+            socket.add_listener("Target.targetInfoChanged", self._on_info)
+            socket.add_listener("Target.targetDestroyed", self._on_destroyed)
+            try:
+                _, res = await self._base_target.execute_cdp_batch([
+                    ("Target.setDiscoverTargets", {"discover": True}),
+                    # covers targets which got created before the listeners were added
+                    ("Target.getTargets", None)
+                ], timeout=timeout)
+                if isinstance(res, Exception):
+                    raise res
+                for info in res["targetInfos"]:
+                    self._update(info)
+            except Exception as e:
+                socket.remove_listener("Target.targetCreated", self._on_info)
+                socket.remove_listener("Target.targetInfoChanged", self._on_info)
+                socket.remove_listener("Target.targetDestroyed", self._on_destroyed)
+                self._started.set_exception(e)
+                self._started = None
+                raise e
+            self._started.set_result(None)
+        await asyncio.shield(self._started)
+        return self
+
+    def __await__(self):
+        return self.start().__await__()
+
+    async def wait_for(self, predicate: typing.Callable[[dict], bool], timeout: float or None = None) -> dict:
+        """wait for a target matching ``predicate`` to exist, without polling
+
+        .. code-block:: python
+
+            info = await driver.base_target.registry.wait_for(lambda info: info["type"] == "service_worker")
+
+        :param predicate: called with each ``Target.TargetInfo`` dict on creation or change
+        :param timeout: timeout in seconds
+        """
+        await self.start()
+        for info in self._infos.values():
+            if predicate(info):
+                return info
+        fut = asyncio.get_running_loop().create_future()
+        waiter = (predicate, fut)
+        self._waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(f"no matching target got created within {timeout} seconds")
+        finally:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+
+    def _update(self, target_info: dict) -> dict:
+        _id = target_info["targetId"]
+        info = self._infos.get(_id)
+        if info is None:
+            info = dict(target_info)
+            self._infos[_id] = info
+        else:
+            info.update(target_info)
+        return info
+
+    def _on_info(self, params: dict):
+        info = self._update(params["targetInfo"])
+        for predicate, fut in list(self._waiters):
+            if not fut.done():
+                try:
+                    matches = predicate(info)
+                except Exception as e:
+                    fut.set_exception(e)
+                else:
+                    if matches:
+                        fut.set_result(info)
+
+    def _on_destroyed(self, params: dict):
+        self._infos.pop(params["targetId"], None)
@@ -33,14 +33,100 @@ from cdp_socket.exceptions import CDPError
 
 # driverless
 from selenium_driverless.types.by import By
+from selenium_driverless.types import JSEvalException
 from selenium_driverless.types.deserialize import JSRemoteObj, StaleJSRemoteObjReference
-from selenium_driverless.scripts.geometry import rand_mid_loc, overlap, is_point_in_polygon
+from selenium_driverless.types.script_registry import register_script
+from selenium_driverless.types.element_list import ElementList
+from selenium_driverless.scripts.geometry import rand_mid_loc, overlap, is_point_in_polygon, intersect_rectangles, \
+    get_bounds
 
 
 class NoSuchElementException(Exception):
     pass
 
 
+# random points generated before giving up on a layer of the box model
+_MAX_POINT_TRIES = 200
+
+
+# sent along with DOM.getBoxModel within one batch, see WebElement.geometry.
+# Not a registered script, as the batch can't install the helpers first
+_P_VISIBLE = """
+    function(obj){
+        const style = window.getComputedStyle(obj);
+        const elem_visible = ((style.display !== 'none') && (style.visibility !== 'hidden'))
+        const vw = Math.max(document.documentElement.clientWidth || 0, window.innerWidth || 0)
+        const vh = Math.max(document.documentElement.clientHeight || 0, window.innerHeight || 0)
+        return [elem_visible, vh, vw];
+    }"""
+
+register_script("css_metrics", """
+    function(obj){
+        function getRotationAngle(target)
+            {
+              const _obj = window.getComputedStyle(target, null);
+              const matrix = _obj.getPropertyValue('transform');
+              let angle = 0;
+              if (matrix !== 'none')
+              {
+                const values = matrix.split('(')[1].split(')')[0].split(',');
+                const a = values[0];
+                const b = values[1];
+                angle = Math.round(Math.atan2(b, a) * (180/Math.PI));
+              }
+
+              return (angle < 0) ? angle +=360 : angle;
+            }
+        var _rects = obj.getClientRects()
+        var rects = []
+        for(let i = 0; i < _rects.length; i++){
+            rects.push(_rects[i].toJSON())
+        }
+        var rotation = getRotationAngle(obj)
+        return [rects, rotation]
+    }""")
+
+register_script("xpath", """
+    function(obj, xpath){
+        return document.evaluate(xpath, obj, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null)
+    }""")
+
+register_script("wait_for", """
+    function(obj, by, value, state, timeout){
+        function query(){
+            let elem = null;
+            if(by === "css selector"){elem = obj.querySelector(value)}
+            else if(by === "tag name"){elem = obj.getElementsByTagName(value)[0]}
+            else {elem = document.evaluate(value, obj, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue}
+            if(elem && state === "visible"){
+                const style = window.getComputedStyle(elem);
+                if(style.display === 'none' || style.visibility === 'hidden' || !elem.getClientRects().length){
+                    return null
+                }
+            }
+            return elem
+        }
+        const found = query();
+        if(found){return found}
+        return new Promise((resolve) => {
+            let timer = null;
+            const observer = new MutationObserver(() => {
+                const elem = query();
+                if(elem){
+                    observer.disconnect();
+                    clearTimeout(timer);
+                    resolve(elem)
+                }
+            });
+            observer.observe(obj.ownerDocument ? obj : document, {childList: true, subtree: true,
+                attributes: state === "visible", characterData: false});
+            if(timeout !== null){
+                timer = setTimeout(() => {observer.disconnect(); resolve(null)}, timeout)
+            }
+        })
+    }""")
+
+
 class StaleElementReferenceException(StaleJSRemoteObjReference):
     def __init__(self, elem):
         elem._stale = True
@@ -143,16 +229,7 @@ class WebElement(JSRemoteObj):
     async def __obj_id_for_context__(self, context_id: int = None):
         self._check_stale()
         if not self._obj_ids.get(context_id):
-            args = {}
-            if self._backend_node_id:
-                args["backendNodeId"] = self._backend_node_id
-            elif self._node_id:
-                args["nodeId"] = self._node_id
-            else:
-                raise ValueError(f"missing remote element id's for {self}")
-
-            if context_id:
-                args["executionContextId"] = context_id
+            args = self._resolve_node_args(context_id)
             try:
                 res = await self.__target__.execute_cdp_cmd("DOM.resolveNode", args)
             except CDPError as e:
@@ -160,16 +237,43 @@ class WebElement(JSRemoteObj):
                     raise StaleElementReferenceException(self)
                 else:
                     raise e
-            obj_id = res["object"].get("objectId")
-            if obj_id:
-                if self.__context_id__ == context_id:
-                    self.___obj_id__ = obj_id
-                self._obj_ids[context_id] = obj_id
-            class_name = res["object"].get("className")
-            if class_name:
-                self._class_name = class_name
+            self._on_resolved(context_id, res)
         return self._obj_ids.get(context_id)
 
+    def _resolve_node_args(self, context_id: int = None) -> dict:
+        args = {}
+        if self._backend_node_id:
+            args["backendNodeId"] = self._backend_node_id
+        elif self._node_id:
+            args["nodeId"] = self._node_id
+        else:
+            raise ValueError(f"missing remote element id's for {self}")
+
+        if context_id:
+            args["executionContextId"] = context_id
+        # noinspection PyProtectedMember
+        args["objectGroup"] = self.__target__._object_group_name
+        return args
+
+    def _on_resolved(self, context_id: int, res: dict):
+        # the result of DOM.resolveNode
+        obj_id = res["object"].get("objectId")
+        if obj_id:
+            # noinspection PyProtectedMember
+            self.__target__._own_object(self, obj_id)
+            if self.__context_id__ == context_id:
+                self.___obj_id__ = obj_id
+            self._obj_ids[context_id] = obj_id
+        class_name = res["object"].get("className")
+        if class_name:
+            self._class_name = class_name
+
+    def _forget_obj_ids(self):
+        # the objects got released, resolve again on next use
+        if self._backend_node_id or self._node_id:
+            self._obj_ids = {}
+            self.___obj_id__ = None
+
     @property
     def __context_id__(self):
         if self.__obj_id__:
@@ -298,12 +402,14 @@ class WebElement(JSRemoteObj):
         :param timeout: how long to wait for the element to exist
         :param idx: might be removed
         """
-        elems = []
-        start = time.perf_counter()
-        while not elems:
-            elems = await self.find_elements(by=by, value=value)
-            if (not timeout) or (time.perf_counter() - start) > timeout:
-                break
+        if timeout:
+            try:
+                elem = await self.wait_for_element(by=by, value=value, timeout=timeout)
+            except asyncio.TimeoutError:
+                raise NoSuchElementException()
+            if not idx:
+                return elem
+        elems = await self.find_elements(by=by, value=value)
         if elems:
             if isinstance(elems, list):
                 return elems[idx]
@@ -313,14 +419,37 @@ class WebElement(JSRemoteObj):
                     elems)
         raise NoSuchElementException()
 
-    async def find_elements(self, by: str = By.ID, value: str or None = None):
-        """find multiple elements in the current target
+    async def wait_for_element(self, by: str, value: str, timeout: float or None = 10,
+                               state: typing.Literal["attached", "visible"] = "attached") -> "WebElement":
+        """wait for an element within this element to exist.
+        Uses a ``MutationObserver`` in the isolated world, which resolves once an element matches,
+        within a single round-trip and without polling.
 
-        :param by: one of the locators at :func:`By <selenium_driverless.types.by.By>`
-        :param value: the actual query to find the elements by
-        """
-        from selenium_driverless.types.by import By
+        .. code-block:: python
+
+            elem = await document.wait_for_element(By.CSS_SELECTOR, "#submit", state="visible")
 
+        :param by: one of the locators at :func:`By <selenium_driverless.types.by.By>`
+        :param value: the actual query to find the element by
+        :param timeout: how long to wait for the element in seconds, ``None`` for no timeout
+        :param state: ``"attached"`` to wait for the element to exist,
+            ``"visible"`` to additionally wait for it to be displayed (doesn't check viewport or opacity)
+        """
+        if state not in ["attached", "visible"]:
+            raise ValueError(f'state needs to be "attached" or "visible", but got "{state}"')
+        by, value = self._to_locator(by, value)
+        if by not in [By.TAG_NAME, By.CSS_SELECTOR, By.XPATH]:
+            raise ValueError("unexpected by")
+        elem = await self.__target__.scripts.call("wait_for", by, value, state,
+                                                  None if timeout is None else timeout * 1000,
+                                                  obj=self, await_res=True, serialization="deep",
+                                                  timeout=None if timeout is None else timeout + 5)
+        if elem is None:
+            raise asyncio.TimeoutError(f"no element matching {by}={value} {state} within {timeout} seconds")
+        return elem
+
+    @staticmethod
+    def _to_locator(by: str, value: str) -> typing.Tuple[str, str]:
         if by == By.ID:
             by = By.XPATH
             value = f'//*[@id="{value}"]'
@@ -330,24 +459,30 @@ class WebElement(JSRemoteObj):
         elif by == By.NAME:
             by = By.XPATH
             value = f'//*[@name="{value}"]'
+        return by, value
 
+    async def find_elements(self, by: str = By.ID, value: str or None = None) -> ElementList:
+        """find multiple elements in the current target,
+        as :class:`ElementList <selenium_driverless.types.element_list.ElementList>`
+
+        :param by: one of the locators at :func:`By <selenium_driverless.types.by.By>`
+        :param value: the actual query to find the elements by
+        """
+        by, value = self._to_locator(by, value)
         if by == By.TAG_NAME:
-            return await self.execute_script("return obj.getElementsByTagName(arguments[0])",
-                                             value, serialization="deep", unique_context=True, timeout=10)
+            elems = await self.execute_script("return obj.getElementsByTagName(arguments[0])",
+                                              value, serialization="deep", unique_context=True, timeout=10)
         elif by == By.CSS_SELECTOR:
-            return await self.execute_script("return obj.querySelectorAll(arguments[0])", value, timeout=10,
-                                             unique_context=True)
+            elems = await self.execute_script("return obj.querySelectorAll(arguments[0])", value, timeout=10,
+                                              unique_context=True)
         elif by == By.XPATH:
-            script = """return document.evaluate(
-                          arguments[0],
-                          obj,
-                          null,
-                          XPathResult.ORDERED_NODE_SNAPSHOT_TYPE,
-                          null,
-                        );"""
-            return await self.execute_script(script, value, serialization="deep", timeout=10, unique_context=True)
+            elems = await self.__target__.scripts.call("xpath", value, obj=self, serialization="deep", timeout=10)
         else:
             raise ValueError("unexpected by")
+        if self._loop:
+            from selenium_driverless.sync.element_list import ElementList as SyncElementList
+            return SyncElementList(elems, target=self.__target__, loop=self._loop)
+        return ElementList(elems, target=self.__target__)
 
     async def _describe(self):
         args = {"pierce": True}
@@ -476,19 +611,15 @@ class WebElement(JSRemoteObj):
         return await self.__target__.execute_cdp_cmd("DOM.focus", args)
 
     # noinspection PyIncorrectDocstring
-    async def is_clickable(self, listener_depth=3, box_model: dict = None):
+    async def is_clickable(self, listener_depth=3, box_model: dict = None, geometry: dict = None):
         """
         returns ``True`` if the element type is one of "a", "button", "command", "details", "input", "select", "textarea", "video", "map"
         otherwise checks for "click", "mousedown" or "mouseup" event listeners on the element
 
         :param listener_depth: the depth (nested elements) to get event-listeners for
+        :param geometry: a snapshot from :func:`WebElement.geometry <selenium_driverless.types.webelement.WebElement.geometry>` to reuse
         """
-        if box_model is None:
-            try:
-                box_model = await self.box_model
-            except ElementNotVisible:
-                return False
-        if not await self.is_visible(box_model=box_model):
+        if not await self.is_visible(box_model=box_model, geometry=geometry):
             return False
         _type = await self.tag_name
         if _type in ["a", "button", "command", "details", "input", "select", "textarea", "video", "map"]:
@@ -511,21 +642,32 @@ class WebElement(JSRemoteObj):
         moves the mouse to the element
         see :func:`Elem.send_keys <selenium_driverless.types.webelement.WebElement.click> for details or the arguments`
         """
-        if scroll_to:
-            await self.scroll_to()
+        (x, y), _ = await self._wait_mid_location(visible_timeout, spread_a, spread_b, bias_a, bias_b, border,
+                                                  scroll_to=scroll_to, box_model=box_model)
+        await self.__target__.pointer.move_to(x, y=y, total_time=timeout)
+
+    async def _wait_mid_location(self, visible_timeout: float, spread_a: float, spread_b: float, bias_a: float,
+                                 bias_b: float, border: float, scroll_to: bool = True,
+                                 box_model: dict = None) -> typing.Tuple[typing.List[int], typing.Optional[dict]]:
+        # the point to click at, and the geometry it got computed from
         cords = None
+        geometry = None
         start = time.perf_counter()
         while not cords:
             try:
                 if box_model is None:
-                    box_model = await self.box_model
-                cords = await self.mid_location(spread_a, spread_b, bias_a, bias_b, border, box_model=box_model)
+                    geometry = await self.geometry(scroll_to=scroll_to)
+                elif scroll_to:
+                    await self.scroll_to()
+                # scroll on the first attempt only, not to fight scrolling by the page or the user
+                scroll_to = False
+                cords = await self.mid_location(spread_a, spread_b, bias_a, bias_b, border, box_model=box_model,
+                                                geometry=geometry)
             except ElementNotVisible:
                 await asyncio.sleep(0.05)
             if (time.perf_counter() - start) > visible_timeout:
                 raise asyncio.TimeoutError(f"Couldn't compute element location within {visible_timeout} seconds")
-        x, y = cords
-        await self.__target__.pointer.move_to(x, y=y, total_time=timeout)
+        return cords, geometry
 
     # noinspection PyIncorrectDocstring
     async def click(self, timeout: float = None, visible_timeout: float = 10, spread_a: float = 1, spread_b: float = 1,
@@ -551,22 +693,10 @@ class WebElement(JSRemoteObj):
             relative to the element.
             (=> 99.7 %)
         """
-        if scroll_to:
-            await self.scroll_to()
-        cords = None
-        start = time.perf_counter()
-        while not cords:
-            try:
-                if box_model is None:
-                    box_model = await self.box_model
-                cords = await self.mid_location(spread_a, spread_b, bias_a, bias_b, border, box_model=box_model)
-            except ElementNotVisible:
-                await asyncio.sleep(0.05)
-            if (time.perf_counter() - start) > visible_timeout:
-                raise asyncio.TimeoutError(f"Couldn't compute element location within {visible_timeout} seconds")
-        x, y = cords
+        (x, y), geometry = await self._wait_mid_location(visible_timeout, spread_a, spread_b, bias_a, bias_b, border,
+                                                         scroll_to=scroll_to, box_model=box_model)
         if ensure_clickable:
-            is_clickable = await self.is_clickable(box_model=box_model)
+            is_clickable = await self.is_clickable(box_model=box_model, geometry=geometry)
             if not is_clickable:
                 raise ElementNotClickable(x, y)
 
@@ -611,13 +741,15 @@ class WebElement(JSRemoteObj):
         args.update(self._args_builder)
         await self.__target__.execute_cdp_cmd("DOM.setFileInputFiles", args)
 
-    async def send_keys(self, text: str, click_kwargs: dict = None, click_on: bool = True) -> None:
+    async def send_keys(self, text: typing.Union[str, typing.Iterable[str]], click_kwargs: dict = None,
+                        click_on: bool = True, timing=None) -> None:
         """
         send text & keys to the target
 
-        :param text: the text to send to the target
+        :param text: the text to send to the target, see :func:`Target.send_keys <selenium_driverless.types.target.Target.send_keys>`
         :param click_kwargs: arguments to pass for :func:`Elem.click <selenium_driverless.types.webelement.WebElement.click>`
         :param click_on: whether to click on the element before sending the keys
+        :param timing: the timing model, see :func:`Target.send_keys <selenium_driverless.types.target.Target.send_keys>`
         """
         if click_kwargs is None:
             click_kwargs = {}
@@ -625,11 +757,11 @@ class WebElement(JSRemoteObj):
             await self.click(**click_kwargs)
         else:
             await self.focus()
-        await self.__target__.send_keys(text)
+        await self.__target__.send_keys(text, timing=timing)
 
     # noinspection PyIncorrectDocstring
     async def mid_location(self, spread_a: float = 1, spread_b: float = 1, bias_a: float = 0.5, bias_b: float = 0.5,
-                           border: float = 0.05, box_model: dict = None) -> typing.List[int]:
+                           border: float = 0.05, box_model: dict = None, geometry: dict = None) -> typing.List[int]:
         """
         returns random location in the element with probability close to the middle
 
@@ -639,50 +771,44 @@ class WebElement(JSRemoteObj):
         :param bias_b: bias over b (0-1)
         :param border: minimum border towards element edges (relative to the element => 1).
             Random generated points outside that border get re-generated.
+        :param geometry: a snapshot from :func:`WebElement.geometry <selenium_driverless.types.webelement.WebElement.geometry>` to reuse
 
         .. note::
             a spread of 1 is equivalent to 6 std.
             relative to the element.
             (=> 99.7 %)
         """
-        loop = asyncio.get_event_loop()
-        if box_model is None:
-            box_model = await self.box_model
-        visible, overlap_polygon = await self.p_visible(box_model=box_model)
-        if not visible:
+        if geometry is None:
+            geometry = await self.geometry(box_model=box_model)
+        if not geometry["p_visible"]:
             raise ElementNotVisible("Element is not displayed")
-        try:
-            box = await self.box_model
-        except CDPError as e:
-            message = 'Could not compute box model.'
-            if e.code == -32000 and message in e.message:
-                raise ElementNotVisible(message)
-            else:
-                raise e
+        box = geometry["box_model"]
+        overlap_polygon = geometry["polygon"]
 
         layers = ["content", "padding", "border"]
-        vertices = None
-        point = []
+        point = None
         for layer in layers:
-            vertices = box[layer]
+            # sample within the bounding box of the visible part of the layer only,
+            # elements mostly out of the viewport would miss most of the time otherwise
+            visible_part = intersect_rectangles(np.array(box[layer]), overlap_polygon)
+            if visible_part.size == 0:
+                continue
+            x_min, y_min, x_max, y_max = get_bounds(visible_part)
+            vertices = [[x_min, y_min], [x_max, y_min], [x_max, y_max], [x_min, y_max]]
             try:
-                def helper(_point):
-                    while (not _point) or (not is_point_in_polygon(_point, overlap_polygon)):
-                        # todo: add better overlap point generation
-                        _point = rand_mid_loc(vertices, spread_a, spread_b, bias_a, bias_b, border)
-                    return _point
-
-                try:
-                    point = await asyncio.wait_for(loop.run_in_executor(None, lambda: helper(point)), 2)
-                except asyncio.TimeoutError:
-                    raise ValueError('The area of the element is 0')
+                for _ in range(_MAX_POINT_TRIES):
+                    _point = rand_mid_loc(vertices, spread_a, spread_b, bias_a, bias_b, border)
+                    if is_point_in_polygon(_point, overlap_polygon):
+                        point = _point
+                        break
             except ValueError as e:
                 if e.args[0] != 'The area of the element is 0':
                     raise e
-        if vertices is None:
-            raise ValueError('The area of the element is 0')
+            if point is not None:
+                break
+        if point is None:
+            raise ElementNotVisible("Couldn't find a visible point within the element")
 
-        # noinspection PyUnboundLocalVariable
         x = int(point[0])
         y = int(point[1])
         return [x, y]
@@ -784,51 +910,97 @@ class WebElement(JSRemoteObj):
         return not await self.get_property("disabled")
 
     # RenderedWebElement Items
-    async def p_visible(self, box_model: dict = None) -> typing.Tuple[float, typing.Union[np.ndarray, list]]:
+    async def p_visible(self, box_model: dict = None,
+                        geometry: dict = None) -> typing.Tuple[float, typing.Union[np.ndarray, list]]:
 
         """
         Whether the element is visible to a user.
         This does not check the opacity, since the element might still be interactable.
         Returns the percentage (0.0 to 1.0) visible within the viewport and polygon of the area visible
-        """
-        visible = 0
-        polygon = np.array([])
-        loop = asyncio.get_event_loop()
-
-        elem_visible, vh, vw = await self.execute_script("""
-            const style = window.getComputedStyle(obj);
-            const elem_visible = ((style.display !== 'none') && (style.visibility !== 'hidden'))
-            const vw = Math.max(document.documentElement.clientWidth || 0, window.innerWidth || 0)
-            const vh = Math.max(document.documentElement.clientHeight || 0, window.innerHeight || 0)
-            return [elem_visible, vh, vw];
-            """, unique_context=True, max_depth=4)
 
-        viewport = np.array([[0, 0], [vw, 0], [vw, vh], [0, vh]])
-        if elem_visible:
-            if box_model is None:
-                try:
-                    box_model = await self.box_model
-                except ElementNotVisible:
-                    return visible, polygon
-            visible, polygon = await loop.run_in_executor(None, lambda: overlap(viewport, box_model["border"]))
-
-        return visible, polygon
+        :param geometry: a snapshot from :func:`WebElement.geometry <selenium_driverless.types.webelement.WebElement.geometry>` to reuse
+        """
+        if geometry is None:
+            try:
+                geometry = await self.geometry(box_model=box_model)
+            except ElementNotVisible:
+                return 0, np.array([])
+        return geometry["p_visible"], geometry["polygon"]
 
-    async def is_visible(self, box_model: dict = None, minimum_p: float = 0.0001):
+    async def is_visible(self, box_model: dict = None, minimum_p: float = 0.0001, geometry: dict = None):
         """
         returns true if the area of the element which is visible is bigger than minimum_p (0 to 1, percentage visible)
 
+        :param geometry: a snapshot from :func:`WebElement.geometry <selenium_driverless.types.webelement.WebElement.geometry>` to reuse
+
         .. note:
             This does not check opacity=0
         """
-        if box_model is None:
-            try:
-                box_model = await self.box_model
-            except ElementNotVisible:
-                return False
-        visible, _ = await self.p_visible(box_model=box_model)
+        visible, _ = await self.p_visible(box_model=box_model, geometry=geometry)
         return visible > minimum_p
 
+    async def geometry(self, scroll_to: bool = False, box_model: dict = None) -> dict:
+        """a snapshot of the geometry of the element, within a single round-trip.
+        ``DOM.scrollIntoViewIfNeeded`` (optional), ``DOM.getBoxModel`` and a ``Runtime.callFunctionOn``
+        for the computed visibility and viewport are sent at once.
+
+        .. code-block:: python
+
+            {
+                "box_model": {...},  # see WebElement.box_model
+                "visible": True,  # display and visibility of the computed style
+                "viewport": np.array([[0, 0], [vw, 0], [vw, vh], [0, vh]]),
+                "p_visible": 100.0,  # see WebElement.p_visible
+                "polygon": np.array([...])  # the visible area
+            }
+
+        :param scroll_to: whether to scroll to the element first
+        :param box_model: a box model to use instead of fetching it
+        """
+        target = self.__target__
+        for _ in range(2):
+            context_id = await self.__isolated_exec_id__
+            obj_id = await self.__obj_id_for_context__(context_id)
+            args = self._args_builder
+            cmds = []
+            if scroll_to:
+                cmds.append(("DOM.scrollIntoViewIfNeeded", args))
+            if box_model is None:
+                cmds.append(("DOM.getBoxModel", args))
+            cmds.append(("Runtime.callFunctionOn", {"functionDeclaration": _P_VISIBLE, "objectId": obj_id,
+                                                    "arguments": [{"objectId": obj_id}], "returnByValue": True}))
+            results = await target.execute_cdp_batch(cmds)
+            if scroll_to:
+                res = results.pop(0)
+                # like WebElement.scroll_to, the box model tells whether it's visible anyway
+                if isinstance(res, Exception) and not isinstance(res, CDPError):
+                    raise res
+            model = box_model
+            if box_model is None:
+                res = results.pop(0)
+                if isinstance(res, Exception):
+                    self._raise_box_model_error(res)
+                model = self._parse_box_model(res["model"])
+            res = results.pop(0)
+            if isinstance(res, CDPError) and res.code == -32000 and res.message in [
+                    'Cannot find context with specified id', 'Could not find object with given id']:
+                # the context got replaced, resolve again
+                target._discard_isolated_world(context_id)
+                self._forget_obj_ids()
+                continue
+            elif isinstance(res, Exception):
+                raise res
+            if "exceptionDetails" in res.keys():
+                raise JSEvalException(res["exceptionDetails"])
+            elem_visible, vh, vw = res["result"]["value"]
+            viewport = np.array([[0, 0], [vw, 0], [vw, vh], [0, vh]])
+            p_visible, polygon = 0, np.array([])
+            if elem_visible:
+                p_visible, polygon = overlap(viewport, model["border"])
+            return {"box_model": model, "visible": elem_visible, "viewport": viewport,
+                    "p_visible": p_visible, "polygon": polygon}
+        raise StaleElementReferenceException(self)
+
     @property
     async def location_once_scrolled_into_view(self) -> dict:
         """
@@ -885,31 +1057,7 @@ class WebElement(JSRemoteObj):
 
     @property
     async def css_metrics(self) -> typing.List[dict, float]:
-        script = """
-            function getRotationAngle(target) 
-                {
-                  const _obj = window.getComputedStyle(target, null);
-                  const matrix = _obj.getPropertyValue('transform');
-                  let angle = 0; 
-                  if (matrix !== 'none') 
-                  {
-                    const values = matrix.split('(')[1].split(')')[0].split(',');
-                    const a = values[0];
-                    const b = values[1];
-                    angle = Math.round(Math.atan2(b, a) * (180/Math.PI));
-                  } 
-                
-                  return (angle < 0) ? angle +=360 : angle;
-                }
-            var _rects = obj.getClientRects()
-            var rects = []
-            for(let i = 0; i < _rects.length; i++){
-                rects.push(_rects[i].toJSON())
-            }
-            var rotation = getRotationAngle(obj)
-            return [rects, rotation]
-        """
-        return await self.execute_script(script, max_depth=4)
+        return await self.__target__.scripts.call("css_metrics", obj=self, max_depth=4)
 
     @property
     async def box_model(self) -> dict:
@@ -919,15 +1067,20 @@ class WebElement(JSRemoteObj):
         try:
             res = await self.__target__.execute_cdp_cmd("DOM.getBoxModel", args)
         except CDPError as e:
-            message = 'Could not compute box model.'
-            if e.code == -32000 and e.message == 'Cannot find context with specified id':
+            self._raise_box_model_error(e)
+        return self._parse_box_model(res['model'])
+
+    def _raise_box_model_error(self, e: Exception):
+        message = 'Could not compute box model.'
+        if isinstance(e, CDPError) and e.code == -32000:
+            if e.message == 'Cannot find context with specified id':
                 raise StaleElementReferenceException(self)
-            elif e.code == -32000 and message in e.message:
+            elif message in e.message:
                 raise ElementNotVisible(message)
-            else:
-                raise e
+        raise e
 
-        model = res['model']
+    @staticmethod
+    def _parse_box_model(model: dict) -> dict:
         keys = ['content', 'padding', 'border', 'margin']
         for key in keys:
             quad = model[key]
@@ -1023,14 +1176,15 @@ class WebElement(JSRemoteObj):
 
     async def execute_raw_script(self, script: str, *args, await_res: bool = False, serialization: str = None,
                                  max_depth: int = 2, timeout: float = 2, execution_context_id: str = None,
-                                 unique_context: bool = True):
+                                 unique_context: bool = True, plain: bool = False):
         return await self.__exec_raw__(script, *args, await_res=await_res, serialization=serialization,
                                        max_depth=max_depth, timeout=timeout,
                                        execution_context_id=execution_context_id,
-                                       unique_context=unique_context)
+                                       unique_context=unique_context, plain=plain)
 
     async def execute_script(self, script: str, *args, max_depth: int = 2, serialization: str = None,
-                             timeout: float = 2, execution_context_id: str = None, unique_context: bool = True):
+                             timeout: float = 2, execution_context_id: str = None, unique_context: bool = True,
+                             plain: bool = False):
         """executes JavaScript synchronously
 
         .. code-block:: js
@@ -1043,10 +1197,11 @@ class WebElement(JSRemoteObj):
         """
         return await self.__exec__(script, *args, max_depth=max_depth, serialization=serialization,
                                    timeout=timeout, unique_context=unique_context,
-                                   execution_context_id=execution_context_id)
+                                   execution_context_id=execution_context_id, plain=plain)
 
     async def execute_async_script(self, script: str, *args, max_depth: int = 2, serialization: str = None,
-                                   timeout: float = 2, execution_context_id: str = None, unique_context: bool = True):
+                                   timeout: float = 2, execution_context_id: str = None, unique_context: bool = True,
+                                   plain: bool = False):
         """executes JavaScript asynchronously
 
         .. warning::
@@ -1061,11 +1216,11 @@ class WebElement(JSRemoteObj):
         """
         return await self.__exec_async__(script, *args, max_depth=max_depth, serialization=serialization,
                                          timeout=timeout, unique_context=unique_context,
-                                         execution_context_id=execution_context_id)
+                                         execution_context_id=execution_context_id, plain=plain)
 
     async def eval_async(self, script: str, *args, max_depth: int = 2, serialization: str = None,
                          timeout: float = 2, execution_context_id: str = None,
-                         unique_context: bool = True):
+                         unique_context: bool = True, plain: bool = False):
         """executes JavaScript asynchronously
 
         .. code-block:: js
@@ -1081,7 +1236,7 @@ class WebElement(JSRemoteObj):
         """
         return await self.__eval_async__(script, *args, max_depth=max_depth, serialization=serialization,
                                          timeout=timeout, unique_context=unique_context,
-                                         execution_context_id=execution_context_id)
+                                         execution_context_id=execution_context_id, plain=plain)
 
     def __repr__(self):
         return (f'{self.__class__.__name__}("{self.class_name}", '
@@ -0,0 +1,136 @@
+import json
+import typing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class Codec:
+    """JSON codec for CDP frames, using the stdlib ``json`` module.
+
+    Subclass this to plug in your own implementation, see :func:`get_codec <selenium_driverless.utils.codec.get_codec>`
+    """
+    name: str = "json"
+
+    def dumps(self, obj) -> str:
+        """serialize a frame to send"""
+        return json.dumps(obj)
+
+    def loads(self, data: typing.Union[str, bytes]):
+        """deserialize json"""
+        return json.loads(data)
+
+    def loads_frame(self, data: typing.Union[str, bytes]) -> dict:
+        """deserialize a received frame.
+        ``params`` and ``result`` might be left undecoded, see :func:`Codec.decode_payload <selenium_driverless.utils.codec.Codec.decode_payload>`
+        """
+        return self.loads(data)
+
+    def decode_payload(self, payload):
+        """decode ``params`` or ``result`` of a frame returned by :func:`Codec.loads_frame <selenium_driverless.utils.codec.Codec.loads_frame>`"""
+        return payload
+
+    def __repr__(self):
+        return f'<{type(self).__module__}.{type(self).__name__} (name="{self.name}")>'
+
+
+class OrjsonCodec(Codec):
+    """JSON codec using `orjson <https://github.com/ijl/orjson>`_"""
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson isn't installed")
+        self._option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj) -> str:
+        try:
+            return orjson.dumps(obj, option=self._option).decode("utf-8")
+        except TypeError:
+            # integers > 64 bit, unsupported subclasses
+            return json.dumps(obj)
+
+    def loads(self, data: typing.Union[str, bytes]):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # lone surrogates, integers > 64 bit
+            return json.loads(data)
+
+
+class MsgspecCodec(Codec):
+    """JSON codec using `msgspec <https://github.com/jcrist/msgspec>`_
+
+    Only the envelope (``id``, ``method``, ``sessionId``, ``error``) of received frames is decoded directly.
+    ``params`` and ``result`` are kept as raw json until needed, events without any listener are never decoded.
+    """
+    name = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("msgspec isn't installed")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._frame_decoder = msgspec.json.Decoder(typing.Dict[str, msgspec.Raw])
+
+    def dumps(self, obj) -> str:
+        try:
+            return self._encoder.encode(obj).decode("utf-8")
+        except (TypeError, OverflowError, UnicodeEncodeError):
+            # integers > 64 bit, lone surrogates
+            return json.dumps(obj)
+
+    def loads(self, data: typing.Union[str, bytes, "msgspec.Raw"]):
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError:
+            if isinstance(data, msgspec.Raw):
+                data = bytes(data)
+            return json.loads(data)
+
+    def loads_frame(self, data: typing.Union[str, bytes]) -> dict:
+        try:
+            frame = self._frame_decoder.decode(data)
+        except msgspec.DecodeError:
+            return json.loads(data)
+        for key, value in frame.items():
+            if not (key == "params" or key == "result"):
+                frame[key] = self.loads(value)
+        return frame
+
+    def decode_payload(self, payload):
+        if isinstance(payload, msgspec.Raw):
+            return self.loads(payload)
+        return payload
+
+
+_CODECS = {"json": Codec, "orjson": OrjsonCodec, "msgspec": MsgspecCodec}
+
+
+def get_codec(codec: typing.Union[str, Codec, None] = None) -> Codec:
+    """get a codec for CDP frames
+
+    :param codec: an instance of :class:`Codec <selenium_driverless.utils.codec.Codec>`, or one of ``"json"``, ``"orjson"``, ``"msgspec"``.
+        Defaults to ``"json"``, ``"auto"`` picks msgspec or orjson if installed, and falls back to ``json``.
+    """
+    if isinstance(codec, Codec):
+        return codec
+    if codec is None:
+        return Codec()
+    if codec == "auto":
+        if msgspec is not None:
+            return MsgspecCodec()
+        if orjson is not None:
+            return OrjsonCodec()
+        return Codec()
+    try:
+        return _CODECS[codec]()
+    except KeyError:
+        raise ValueError(f"expected one of {list(_CODECS.keys())} or \"auto\", but got: {codec}")
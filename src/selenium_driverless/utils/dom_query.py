@@ -0,0 +1,754 @@
+"""CSS selector and XPath subsets, evaluated on :class:`DomNode <selenium_driverless.types.dom_mirror.DomNode>` trees
+
+supported CSS:
+    type, universal, ``#id``, ``.class``, ``[attr]``, ``[attr=|~=|^=|$=|*=||=value i]``,
+    ``:first-child``, ``:last-child``, ``:only-child``, ``:nth-child(an+b|odd|even)``, ``:empty``, ``:root``,
+    ``:not(...)``, combinators `` ``, ``>``, ``+``, ``~`` and selector lists
+
+supported XPath:
+    absolute and relative location paths with ``/`` and ``//``, unions with ``|``,
+    the ``child``, ``descendant``, ``descendant-or-self``, ``self``, ``parent``, ``ancestor``,
+    ``ancestor-or-self``, ``following-sibling`` and ``preceding-sibling`` axes, ``.``, ``..``,
+    node tests ``name``, ``*``, ``text()``, ``node()``, and predicates with ``@attr``, paths, strings, numbers,
+    ``=``, ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``and``, ``or`` and the functions
+    ``contains``, ``starts-with``, ``normalize-space``, ``string``, ``string-length``, ``concat``, ``not``,
+    ``position``, ``last``, ``count``, ``name``, ``local-name``, ``true`` and ``false``
+"""
+import re
+import typing
+
+ELEMENT_NODE = 1
+TEXT_NODE = 3
+CDATA_SECTION_NODE = 4
+DOCUMENT_NODE = 9
+DOCUMENT_FRAGMENT_NODE = 11
+
+
+def iter_descendants(node, pierce: bool = False) -> typing.Iterator:
+    """all descendants of a node in document order, without recursion
+
+    :param node: the node to start from (excluded)
+    :param pierce: whether to include shadow roots and iframe documents
+    """
+    stack = [iter(_children(node, pierce))]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            continue
+        yield child
+        stack.append(iter(_children(child, pierce)))
+
+
+def _children(node, pierce: bool) -> list:
+    if not pierce:
+        return node.children or []
+    children = []
+    if node.content_document is not None:
+        children.append(node.content_document)
+    children.extend(node.shadow_roots)
+    children.extend(node.children or [])
+    return children
+
+
+def _parent_element(node):
+    parent = node.parent
+    if parent is not None and parent.node_type == ELEMENT_NODE:
+        return parent
+
+
+def _element_siblings(node) -> list:
+    parent = node.parent
+    if parent is None:
+        return [node]
+    return [child for child in parent.children or [] if child.node_type == ELEMENT_NODE]
+
+
+# CSS
+
+_IDENT = r"-?(?:[_a-zA-Z\u00a0-\uffff]|\\.)(?:[_a-zA-Z0-9\u00a0-\uffff-]|\\.)*"
+_CSS_TOKEN = re.compile(r"""
+    (?P<ws>\s+)
+    |(?P<comb>[>+~])
+    |(?P<comma>,)
+    |(?P<star>\*)
+    |\#(?P<id>{ident})
+    |\.(?P<cls>{ident})
+    |\[\s*(?P<attr>{ident})\s*(?:(?P<op>[~|^$*]?=)\s*(?:"(?P<dq>(?:[^"\\]|\\.)*)"|'(?P<sq>(?:[^'\\]|\\.)*)'|(?P<uq>{ident}))
+        \s*(?P<flag>[iIsS])?\s*)?\]
+    |:(?P<pseudo>{ident})(?P<paren>\()?
+    |(?P<tag>{ident})
+""".format(ident=_IDENT), re.VERBOSE)
+_NTH = re.compile(r"^\s*(?:(?P<odd>odd)|(?P<even>even)|(?P<a>[+-]?\d*)n\s*(?:(?P<sign>[+-])\s*(?P<b1>\d+))?|(?P<b>[+-]?\d+))\s*$",
+                  re.IGNORECASE)
+
+
+def _unescape(value: str) -> str:
+    return re.sub(r"\\(.)", r"\1", value)
+
+
+class _Compound:
+    __slots__ = ("tag", "ids", "classes", "attrs", "pseudos")
+
+    def __init__(self):
+        self.tag: typing.Optional[str] = None
+        self.ids: typing.List[str] = []
+        self.classes: typing.List[str] = []
+        # (name, op, value, case-insensitive)
+        self.attrs: typing.List[typing.Tuple[str, typing.Optional[str], typing.Optional[str], bool]] = []
+        # (name, argument)
+        self.pseudos: typing.List[typing.Tuple[str, typing.Any]] = []
+
+    def match(self, node) -> bool:
+        if node.node_type != ELEMENT_NODE:
+            return False
+        if self.tag is not None and (node.local_name or "").lower() != self.tag:
+            return False
+        attributes = node.attributes
+        for _id in self.ids:
+            if attributes.get("id") != _id:
+                return False
+        if self.classes:
+            classes = attributes.get("class", "").split()
+            for cls in self.classes:
+                if cls not in classes:
+                    return False
+        for name, op, value, insensitive in self.attrs:
+            actual = attributes.get(name)
+            if actual is None:
+                return False
+            if op is None:
+                continue
+            if insensitive:
+                actual, value = actual.lower(), value.lower()
+            if op == "=":
+                if actual != value:
+                    return False
+            elif op == "~=":
+                if value not in actual.split():
+                    return False
+            elif op == "|=":
+                if not (actual == value or actual.startswith(value + "-")):
+                    return False
+            elif op == "^=":
+                if not (value and actual.startswith(value)):
+                    return False
+            elif op == "$=":
+                if not (value and actual.endswith(value)):
+                    return False
+            elif op == "*=":
+                if not (value and value in actual):
+                    return False
+        for name, arg in self.pseudos:
+            if not _match_pseudo(node, name, arg):
+                return False
+        return True
+
+
+def _match_pseudo(node, name: str, arg) -> bool:
+    if name == "not":
+        return not any(_match_complex(node, parts, len(parts) - 1) for parts in arg)
+    if name == "root":
+        return node.parent is not None and node.parent.node_type == DOCUMENT_NODE
+    if name == "empty":
+        return not any(child.node_type in (ELEMENT_NODE, TEXT_NODE, CDATA_SECTION_NODE)
+                       for child in node.children or [])
+    siblings = _element_siblings(node)
+    if name == "first-child":
+        return siblings[0] is node
+    if name == "last-child":
+        return siblings[-1] is node
+    if name == "only-child":
+        return len(siblings) == 1
+    if name == "nth-child":
+        a, b = arg
+        idx = siblings.index(node) + 1
+        if a == 0:
+            return idx == b
+        n, rem = divmod(idx - b, a)
+        return rem == 0 and n >= 0
+    raise ValueError(f"unsupported pseudo class :{name}")
+
+
+def _parse_nth(arg: str) -> typing.Tuple[int, int]:
+    match = _NTH.match(arg)
+    if not match:
+        raise ValueError(f"invalid :nth-child({arg})")
+    if match.group("odd"):
+        return 2, 1
+    if match.group("even"):
+        return 2, 0
+    if match.group("b") is not None:
+        return 0, int(match.group("b"))
+    a = match.group("a")
+    a = {"": 1, "+": 1, "-": -1}[a] if a in ("", "+", "-") else int(a)
+    b = int(match.group("b1") or 0)
+    if match.group("sign") == "-":
+        b = -b
+    return a, b
+
+
+def _closing_paren(selector: str, start: int) -> int:
+    depth = 1
+    idx = start
+    while idx < len(selector):
+        char = selector[idx]
+        if char == "\\":
+            idx += 2
+            continue
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return idx
+        idx += 1
+    raise ValueError(f"unbalanced parentheses in {selector}")
+
+
+_Complex = typing.List[typing.Tuple[typing.Optional[str], _Compound]]
+_css_cache: typing.Dict[str, typing.List[_Complex]] = {}
+
+
+def parse_css(selector: str) -> typing.List[_Complex]:
+    """parse a selector list into ``[[(combinator, compound), ...], ...]``, cached"""
+    parsed = _css_cache.get(selector)
+    if parsed is not None:
+        return parsed
+    result: typing.List[_Complex] = []
+    parts: _Complex = []
+    compound: typing.Optional[_Compound] = None
+    combinator: typing.Optional[str] = None
+    pos = 0
+    while pos < len(selector):
+        match = _CSS_TOKEN.match(selector, pos)
+        if not match:
+            raise ValueError(f"unsupported selector {selector!r} at position {pos}")
+        pos = match.end()
+        if match.group("ws") is not None:
+            if compound is not None:
+                parts.append((combinator, compound))
+                compound = None
+                combinator = " "
+            continue
+        if match.group("comb") is not None:
+            if compound is not None:
+                parts.append((combinator, compound))
+                compound = None
+            elif not parts:
+                raise ValueError(f"selector {selector!r} starts with a combinator")
+            combinator = match.group("comb")
+            continue
+        if match.group("comma") is not None:
+            if compound is None and combinator == " ":
+                # whitespace before the comma isn't a descendant combinator
+                combinator, compound = parts.pop()
+            if compound is None:
+                raise ValueError(f"empty selector in {selector!r}")
+            parts.append((combinator, compound))
+            result.append(parts)
+            parts, compound, combinator = [], None, None
+            continue
+        if compound is None:
+            compound = _Compound()
+        if match.group("star") is not None:
+            pass
+        elif match.group("id") is not None:
+            compound.ids.append(_unescape(match.group("id")))
+        elif match.group("cls") is not None:
+            compound.classes.append(_unescape(match.group("cls")))
+        elif match.group("attr") is not None:
+            value = match.group("dq")
+            if value is None:
+                value = match.group("sq")
+            if value is None:
+                value = match.group("uq")
+            if value is not None:
+                value = _unescape(value)
+            compound.attrs.append((_unescape(match.group("attr")).lower(), match.group("op"), value,
+                                   (match.group("flag") or "").lower() == "i"))
+        elif match.group("pseudo") is not None:
+            name = match.group("pseudo").lower()
+            arg = None
+            if match.group("paren"):
+                end = _closing_paren(selector, pos)
+                arg = selector[pos:end]
+                pos = end + 1
+            if name == "not" and arg is not None:
+                compound.pseudos.append((name, parse_css(arg)))
+            elif name == "nth-child" and arg is not None:
+                compound.pseudos.append((name, _parse_nth(arg)))
+            elif name in ("first-child", "last-child", "only-child", "empty", "root") and arg is None:
+                compound.pseudos.append((name, None))
+            else:
+                raise ValueError(f"unsupported pseudo class :{name}")
+        elif match.group("tag") is not None:
+            compound.tag = _unescape(match.group("tag")).lower()
+        else:
+            raise ValueError(f"unsupported selector {selector!r} at position {match.start()}")
+    if compound is None and combinator == " ":
+        # trailing whitespace
+        combinator, compound = parts.pop()
+    if compound is None:
+        raise ValueError(f"selector {selector!r} ends without a compound selector")
+    parts.append((combinator, compound))
+    result.append(parts)
+    _css_cache[selector] = result
+    return result
+
+
+def _match_complex(node, parts: _Complex, idx: int) -> bool:
+    combinator, compound = parts[idx]
+    if not compound.match(node):
+        return False
+    if idx == 0:
+        return True
+    if combinator == " ":
+        ancestor = _parent_element(node)
+        while ancestor is not None:
+            if _match_complex(ancestor, parts, idx - 1):
+                return True
+            ancestor = _parent_element(ancestor)
+        return False
+    if combinator == ">":
+        parent = _parent_element(node)
+        return parent is not None and _match_complex(parent, parts, idx - 1)
+    siblings = _element_siblings(node)
+    previous = siblings[:siblings.index(node)]
+    if combinator == "+":
+        return bool(previous) and _match_complex(previous[-1], parts, idx - 1)
+    # "~"
+    return any(_match_complex(sibling, parts, idx - 1) for sibling in previous)
+
+
+def matches(node, selector: str) -> bool:
+    """whether a node matches a CSS selector (list)"""
+    return any(_match_complex(node, parts, len(parts) - 1) for parts in parse_css(selector))
+
+
+def select(root, selector: str, pierce: bool = False) -> list:
+    """``root.querySelectorAll(selector)``
+
+    :param root: the node to search within
+    :param selector: the CSS selector (list)
+    :param pierce: whether to search within shadow roots and iframes as well
+    """
+    selectors = parse_css(selector)
+    return [node for node in iter_descendants(root, pierce) if node.node_type == ELEMENT_NODE
+            and any(_match_complex(node, parts, len(parts) - 1) for parts in selectors)]
+
+
+# XPath
+
+_XPATH_TOKEN = re.compile(r"""
+    \s*(?:
+    (?P<num>\d+(?:\.\d*)?|\.\d+)
+    |"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'
+    |(?P<op>//|/|\.\.|\.|::|\(|\)|\[|\]|@|,|\||!=|<=|>=|=|<|>|\*)
+    |(?P<name>[_a-zA-Z][\w.-]*(?::[_a-zA-Z][\w.-]*)?)
+    )""", re.VERBOSE)
+_AXES = {"child", "descendant", "descendant-or-self", "self", "parent", "ancestor", "ancestor-or-self",
+         "following-sibling", "preceding-sibling", "attribute"}
+_FUNCTIONS = {"contains", "starts-with", "normalize-space", "string", "string-length", "concat", "not",
+              "position", "last", "count", "name", "local-name", "true", "false"}
+
+
+def _tokenize_xpath(expr: str) -> typing.List[typing.Tuple[str, str]]:
+    tokens = []
+    pos = 0
+    expr = expr.strip()
+    while pos < len(expr):
+        match = _XPATH_TOKEN.match(expr, pos)
+        if not match or match.end() == pos:
+            raise ValueError(f"unsupported XPath {expr!r} at position {pos}")
+        pos = match.end()
+        for kind in ("num", "dq", "sq", "op", "name"):
+            value = match.group(kind)
+            if value is not None:
+                tokens.append(("str" if kind in ("dq", "sq") else kind, value))
+                break
+    return tokens
+
+
+def string_value(item) -> str:
+    """the XPath string-value of a node or attribute value"""
+    if isinstance(item, str):
+        return item
+    if item.node_type in (ELEMENT_NODE, DOCUMENT_NODE, DOCUMENT_FRAGMENT_NODE):
+        return "".join(node.node_value or "" for node in iter_descendants(item)
+                       if node.node_type in (TEXT_NODE, CDATA_SECTION_NODE))
+    return item.node_value or ""
+
+
+def _to_bool(value) -> bool:
+    # node-sets are true if not empty, as are strings
+    return bool(value)
+
+
+def _to_str(value) -> str:
+    if isinstance(value, list):
+        return string_value(value[0]) if value else ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else str(value)
+    return value
+
+
+def _to_num(value) -> float:
+    if isinstance(value, (list, str)):
+        try:
+            return float(_to_str(value).strip())
+        except ValueError:
+            return float("nan")
+    return float(value)
+
+
+def _compare(op: str, left, right) -> bool:
+    if isinstance(left, list) or isinstance(right, list):
+        lefts = [string_value(item) for item in left] if isinstance(left, list) else [left]
+        rights = [string_value(item) for item in right] if isinstance(right, list) else [right]
+        return any(_compare(op, _left, _right) for _left in lefts for _right in rights)
+    if op in ("=", "!="):
+        if isinstance(left, bool) or isinstance(right, bool):
+            left, right = _to_bool(left), _to_bool(right)
+        elif isinstance(left, float) or isinstance(right, float):
+            left, right = _to_num(left), _to_num(right)
+        return (left == right) if op == "=" else (left != right)
+    left, right = _to_num(left), _to_num(right)
+    return {"<": left < right, "<=": left <= right, ">": left > right, ">=": left >= right}[op]
+
+
+class _Context:
+    __slots__ = ("node", "position", "size", "pierce")
+
+    def __init__(self, node, position: int, size: int, pierce: bool):
+        self.node = node
+        self.position = position
+        self.size = size
+        self.pierce = pierce
+
+
+class _XPathParser:
+    def __init__(self, expr: str):
+        self.expr = expr
+        self.tokens = _tokenize_xpath(expr)
+        self.pos = 0
+
+    def peek(self, offset: int = 0) -> typing.Tuple[typing.Optional[str], typing.Optional[str]]:
+        idx = self.pos + offset
+        if idx < len(self.tokens):
+            return self.tokens[idx]
+        return None, None
+
+    def take(self, value: str = None) -> typing.Tuple[str, str]:
+        token = self.peek()
+        if token[0] is None or (value is not None and token[1] != value):
+            raise ValueError(f"unsupported XPath {self.expr!r}, expected {value or 'more'} got {token[1]}")
+        self.pos += 1
+        return token
+
+    def parse(self):
+        expr = self.parse_or()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"unsupported XPath {self.expr!r}, unexpected {self.peek()[1]}")
+        return expr
+
+    def parse_or(self):
+        left = self.parse_and()
+        while self.peek() == ("name", "or"):
+            self.take()
+            right = self.parse_and()
+            left = (lambda _l, _r: lambda ctx: _to_bool(_l(ctx)) or _to_bool(_r(ctx)))(left, right)
+        return left
+
+    def parse_and(self):
+        left = self.parse_compare()
+        while self.peek() == ("name", "and"):
+            self.take()
+            right = self.parse_compare()
+            left = (lambda _l, _r: lambda ctx: _to_bool(_l(ctx)) and _to_bool(_r(ctx)))(left, right)
+        return left
+
+    def parse_compare(self):
+        left = self.parse_union()
+        while self.peek()[0] == "op" and self.peek()[1] in ("=", "!=", "<", "<=", ">", ">="):
+            op = self.take()[1]
+            right = self.parse_union()
+            left = (lambda _l, _r, _op: lambda ctx: _compare(_op, _l(ctx), _r(ctx)))(left, right, op)
+        return left
+
+    def parse_union(self):
+        left = self.parse_primary_or_path()
+        while self.peek() == ("op", "|"):
+            self.take()
+            right = self.parse_primary_or_path()
+            left = (lambda _l, _r: lambda ctx: _document_order(_l(ctx) + _r(ctx), ctx.pierce))(left, right)
+        return left
+
+    def parse_primary_or_path(self):
+        kind, value = self.peek()
+        if kind == "num":
+            self.take()
+            number = float(value)
+            return lambda ctx: number
+        if kind == "str":
+            self.take()
+            return lambda ctx: value
+        if kind == "op" and value == "(":
+            self.take()
+            expr = self.parse_or()
+            self.take(")")
+            predicates = []
+            while self.peek() == ("op", "["):
+                self.take()
+                predicates.append(self.parse_or())
+                self.take("]")
+            if predicates:
+                return (lambda _expr: lambda ctx: _filter(_expr(ctx), predicates, ctx.pierce))(expr)
+            return expr
+        if kind == "name" and self.peek(1) == ("op", "(") and value in _FUNCTIONS:
+            return self.parse_function()
+        return self.parse_path()
+
+    def parse_function(self):
+        name = self.take()[1]
+        self.take("(")
+        args = []
+        if self.peek() != ("op", ")"):
+            args.append(self.parse_or())
+            while self.peek() == ("op", ","):
+                self.take()
+                args.append(self.parse_or())
+        self.take(")")
+        return _make_function(name, args, self.expr)
+
+    def parse_path(self):
+        absolute = None
+        kind, value = self.peek()
+        if kind == "op" and value in ("/", "//"):
+            absolute = self.take()[1]
+        steps = []
+        if absolute == "//":
+            steps.append(("descendant-or-self", "node()", []))
+        if absolute != "/" or self._starts_step():
+            steps.append(self.parse_step())
+        while self.peek()[0] == "op" and self.peek()[1] in ("/", "//"):
+            if self.take()[1] == "//":
+                steps.append(("descendant-or-self", "node()", []))
+            steps.append(self.parse_step())
+        return _make_path(absolute is not None, steps)
+
+    def _starts_step(self) -> bool:
+        kind, value = self.peek()
+        return kind == "name" or (kind == "op" and value in (".", "..", "@", "*"))
+
+    def parse_step(self):
+        kind, value = self.peek()
+        if (kind, value) == ("op", "."):
+            self.take()
+            return "self", "node()", []
+        if (kind, value) == ("op", ".."):
+            self.take()
+            return "parent", "node()", []
+        axis = "child"
+        if (kind, value) == ("op", "@"):
+            self.take()
+            axis = "attribute"
+        elif kind == "name" and self.peek(1) == ("op", "::"):
+            axis = self.take()[1]
+            self.take("::")
+            if axis not in _AXES:
+                raise ValueError(f"unsupported XPath axis {axis} in {self.expr!r}")
+        kind, value = self.take()
+        if (kind, value) == ("op", "*"):
+            test = "*"
+        elif kind == "name" and self.peek() == ("op", "("):
+            self.take("(")
+            self.take(")")
+            test = value + "()"
+            if test not in ("text()", "node()"):
+                raise ValueError(f"unsupported XPath node test {test} in {self.expr!r}")
+        elif kind == "name":
+            test = value.lower()
+        else:
+            raise ValueError(f"unsupported XPath {self.expr!r}, unexpected {value}")
+        predicates = []
+        while self.peek() == ("op", "["):
+            self.take()
+            predicates.append(self.parse_or())
+            self.take("]")
+        return axis, test, predicates
+
+
+def _make_function(name: str, args: list, expr: str):
+    def arg_str(ctx, idx: int = 0):
+        if len(args) > idx:
+            return _to_str(args[idx](ctx))
+        return string_value(ctx.node)
+
+    def nodes(ctx):
+        value = args[0](ctx) if args else [ctx.node]
+        if not isinstance(value, list):
+            raise ValueError(f"{name}() expects a node-set in {expr!r}")
+        return value
+
+    if name == "contains":
+        return lambda ctx: arg_str(ctx, 1) in arg_str(ctx, 0)
+    if name == "starts-with":
+        return lambda ctx: arg_str(ctx, 0).startswith(arg_str(ctx, 1))
+    if name == "normalize-space":
+        return lambda ctx: " ".join(arg_str(ctx).split())
+    if name == "string":
+        return lambda ctx: arg_str(ctx)
+    if name == "string-length":
+        return lambda ctx: float(len(arg_str(ctx)))
+    if name == "concat":
+        return lambda ctx: "".join(_to_str(arg(ctx)) for arg in args)
+    if name == "not":
+        return lambda ctx: not _to_bool(args[0](ctx))
+    if name == "position":
+        return lambda ctx: float(ctx.position)
+    if name == "last":
+        return lambda ctx: float(ctx.size)
+    if name == "count":
+        return lambda ctx: float(len(nodes(ctx)))
+    if name in ("name", "local-name"):
+        def _name(ctx):
+            _nodes = nodes(ctx)
+            if not _nodes or isinstance(_nodes[0], str):
+                return ""
+            return (_nodes[0].local_name or "") if name == "local-name" else (_nodes[0].node_name or "").lower()
+
+        return _name
+    if name == "true":
+        return lambda ctx: True
+    if name == "false":
+        return lambda ctx: False
+    raise ValueError(f"unsupported XPath function {name}()")
+
+
+def _axis(node, axis: str, pierce: bool) -> list:
+    if axis == "child":
+        return list(_children(node, pierce))
+    if axis == "descendant":
+        return list(iter_descendants(node, pierce))
+    if axis == "descendant-or-self":
+        return [node, *iter_descendants(node, pierce)]
+    if axis == "self":
+        return [node]
+    if axis == "parent":
+        return [node.parent] if node.parent is not None else []
+    if axis in ("ancestor", "ancestor-or-self"):
+        res = [node] if axis == "ancestor-or-self" else []
+        parent = node.parent
+        while parent is not None:
+            res.append(parent)
+            parent = parent.parent
+        # reverse axis, proximity order
+        return res
+    if axis in ("following-sibling", "preceding-sibling"):
+        if node.parent is None:
+            return []
+        siblings = node.parent.children or []
+        idx = siblings.index(node)
+        if axis == "following-sibling":
+            return siblings[idx + 1:]
+        return siblings[:idx][::-1]
+    raise ValueError(f"unsupported XPath axis {axis}")
+
+
+def _node_test(node, test: str) -> bool:
+    if test == "node()":
+        return True
+    if test == "text()":
+        return node.node_type in (TEXT_NODE, CDATA_SECTION_NODE)
+    if node.node_type != ELEMENT_NODE:
+        return False
+    return test == "*" or (node.local_name or "").lower() == test
+
+
+def _document_order(items: list, pierce: bool) -> list:
+    nodes = [item for item in items if not isinstance(item, str)]
+    if len(nodes) <= 1:
+        return items
+    # deduplicate and sort by the position within the (top) document
+    root = nodes[0]
+    while root.parent is not None:
+        root = root.parent
+    order = {id(root): 0}
+    for idx, node in enumerate(iter_descendants(root, pierce=True), start=1):
+        order[id(node)] = idx
+    unique = {id(node): node for node in nodes}
+    return sorted(unique.values(), key=lambda node: order.get(id(node), -1))
+
+
+def _filter(selected: list, predicates: list, pierce: bool) -> list:
+    if not isinstance(selected, list):
+        raise ValueError("predicates can only filter node-sets")
+    for predicate in predicates:
+        size = len(selected)
+        filtered = []
+        for position, child in enumerate(selected, start=1):
+            value = predicate(_Context(child, position, size, pierce))
+            if isinstance(value, float):
+                keep = value == position
+            else:
+                keep = _to_bool(value)
+            if keep:
+                filtered.append(child)
+        selected = filtered
+    return selected
+
+
+def _make_path(absolute: bool, steps: list):
+    def evaluate(ctx: _Context) -> list:
+        if absolute:
+            root = ctx.node
+            while root.parent is not None and root.node_type != DOCUMENT_NODE:
+                root = root.parent
+            current = [root]
+        else:
+            current = [ctx.node]
+        for axis, test, predicates in steps:
+            if axis == "attribute":
+                res = []
+                for node in current:
+                    attributes = getattr(node, "attributes", None) or {}
+                    if test == "*":
+                        res.extend(attributes.values())
+                    elif test in attributes:
+                        res.append(attributes[test])
+                current = res
+                continue
+            res = []
+            for node in current:
+                if isinstance(node, str):
+                    raise ValueError("attributes don't have children")
+                selected = [child for child in _axis(node, axis, ctx.pierce) if _node_test(child, test)]
+                res.extend(_filter(selected, predicates, ctx.pierce))
+            current = _document_order(res, ctx.pierce) if len(current) > 1 or axis.startswith(
+                ("ancestor", "preceding")) else res
+        return current
+
+    return evaluate
+
+
+_xpath_cache: typing.Dict[str, typing.Callable] = {}
+
+
+def xpath(context, expr: str, pierce: bool = False) -> list:
+    """evaluate an XPath expression, returning the matched nodes in document order
+
+    :param context: the context node
+    :param expr: the XPath expression, which has to return a node-set
+    :param pierce: whether to search within shadow roots and iframes as well
+    """
+    compiled = _xpath_cache.get(expr)
+    if compiled is None:
+        compiled = _XPathParser(expr).parse()
+        _xpath_cache[expr] = compiled
+    res = compiled(_Context(context, 1, 1, pierce))
+    if not isinstance(res, list):
+        raise ValueError(f"XPath {expr!r} doesn't return a node-set")
+    return [item for item in res if not isinstance(item, str)]
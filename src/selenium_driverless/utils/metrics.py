@@ -0,0 +1,224 @@
+import bisect
+import time
+import typing
+
+from selenium_driverless import EXC_HANDLER
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class CommandStats:
+    """statistics for a single CDP method on a single target"""
+    __slots__ = ("count", "errors", "timeouts", "in_flight", "total_time", "max_time", "bytes_sent",
+                 "bytes_received", "buckets")
+
+    def __init__(self, n_buckets: int):
+        self.count = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.in_flight = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        # last one is +Inf
+        self.buckets = [0] * (n_buckets + 1)
+
+
+class EventStats:
+    """statistics for a single CDP event on a single target"""
+    __slots__ = ("count", "bytes_received")
+
+    def __init__(self):
+        self.count = 0
+        self.bytes_received = 0
+
+
+class CDPMetrics:
+    """per-method CDP metrics: call counts, latency histograms, payload sizes, in-flight commands and event rates,
+    labeled by target id.
+
+    .. code-block:: python
+
+        async with webdriver.Chrome(metrics=True) as driver:
+            await driver.get("https://example.com")
+            print(driver.base_target.metrics.to_prometheus())
+
+    :param buckets: upper bounds of the latency histogram in seconds
+
+    Hooks are called synchronously and should return fast, exceptions are passed to ``EXC_HANDLER``:
+
+    - ``on_command_start(target_id: str, method: str, params: dict)``
+    - ``on_command_end(target_id: str, method: str, duration: float, error: Exception or None)``
+    """
+
+    def __init__(self, buckets: typing.Sequence[float] = DEFAULT_BUCKETS):
+        self._buckets = tuple(sorted(buckets))
+        self.on_command_start: typing.List[typing.Callable[[str, str, dict], None]] = []
+        self.on_command_end: typing.List[typing.Callable[[str, str, float, typing.Optional[Exception]], None]] = []
+        self._commands: typing.Dict[typing.Tuple[str, str], CommandStats] = {}
+        self._events: typing.Dict[typing.Tuple[str, str], EventStats] = {}
+        self._pending: typing.Dict[typing.Tuple[int, int], typing.Tuple[CommandStats, str, str, float]] = {}
+        self._since = time.monotonic()
+
+    @property
+    def buckets(self) -> typing.Tuple[float, ...]:
+        """upper bounds of the latency histogram in seconds"""
+        return self._buckets
+
+    @property
+    def in_flight(self) -> int:
+        """the number of commands waiting for a response"""
+        return len(self._pending)
+
+    def reset(self):
+        """reset all statistics, responses for commands currently in flight aren't recorded"""
+        self._commands = {}
+        self._events = {}
+        self._pending = {}
+        self._since = time.monotonic()
+
+    def command_start(self, conn_id: int, _id: int, target_id: str, method: str, params: dict, size: int):
+        """record a command being sent
+
+        :param conn_id: identifies the connection, ``id`` is only unique within a connection
+        :param _id: the ``id`` of the command
+        :param target_id: the target the command is sent to
+        :param method: the CDP method
+        :param params: the parameters
+        :param size: the size of the frame sent in bytes
+        """
+        key = (target_id, method)
+        stats = self._commands.get(key)
+        if stats is None:
+            stats = self._commands[key] = CommandStats(len(self._buckets))
+        stats.in_flight += 1
+        stats.bytes_sent += size
+        self._pending[(conn_id, _id)] = (stats, target_id, method, time.perf_counter())
+        for hook in self.on_command_start:
+            try:
+                hook(target_id, method, params)
+            except Exception as e:
+                EXC_HANDLER(e)
+
+    def command_end(self, conn_id: int, _id: int, size: int = 0, error: Exception = None, timeout: bool = False):
+        """record the response for a command, or a timeout
+
+        :param conn_id: identifies the connection
+        :param _id: the ``id`` of the command
+        :param size: the size of the response frame in bytes
+        :param error: the error returned
+        :param timeout: whether no response arrived in time
+        """
+        pending = self._pending.pop((conn_id, _id), None)
+        if pending is None:
+            return
+        stats, target_id, method, start = pending
+        duration = time.perf_counter() - start
+        stats.in_flight -= 1
+        stats.count += 1
+        stats.bytes_received += size
+        if timeout:
+            stats.timeouts += 1
+        elif error is not None:
+            stats.errors += 1
+        stats.total_time += duration
+        if duration > stats.max_time:
+            stats.max_time = duration
+        stats.buckets[bisect.bisect_left(self._buckets, duration)] += 1
+        for hook in self.on_command_end:
+            try:
+                hook(target_id, method, duration, error)
+            except Exception as e:
+                EXC_HANDLER(e)
+
+    def event(self, target_id: str, method: str, size: int):
+        """record a received event
+
+        :param target_id: the target the event got emitted on
+        :param method: the CDP event
+        :param size: the size of the frame in bytes
+        """
+        key = (target_id, method)
+        stats = self._events.get(key)
+        if stats is None:
+            stats = self._events[key] = EventStats()
+        stats.count += 1
+        stats.bytes_received += size
+
+    def as_dict(self) -> dict:
+        """all statistics as a dict
+
+        .. code-block:: python
+
+            {
+                "elapsed": 12.3,
+                "commands": {target_id: {method: {"count": 1, "errors": 0, "timeouts": 0, "in_flight": 0,
+                                                   "total_time": 0.01, "max_time": 0.01, "mean_time": 0.01,
+                                                   "bytes_sent": 70, "bytes_received": 120,
+                                                   "histogram": {0.001: 0, ..., "+Inf": 1}}}},
+                "events": {target_id: {method: {"count": 20, "bytes_received": 4000, "rate": 1.6}}}
+            }
+        """
+        elapsed = time.monotonic() - self._since
+        commands = {}
+        for (target_id, method), stats in self._commands.items():
+            histogram = {}
+            cumulative = 0
+            for bound, count in zip((*self._buckets, "+Inf"), stats.buckets):
+                cumulative += count
+                histogram[bound] = cumulative
+            commands.setdefault(target_id, {})[method] = {
+                "count": stats.count, "errors": stats.errors, "timeouts": stats.timeouts,
+                "in_flight": stats.in_flight, "total_time": stats.total_time, "max_time": stats.max_time,
+                "mean_time": stats.total_time / stats.count if stats.count else 0.0,
+                "bytes_sent": stats.bytes_sent, "bytes_received": stats.bytes_received,
+                "histogram": histogram
+            }
+        events = {}
+        for (target_id, method), stats in self._events.items():
+            events.setdefault(target_id, {})[method] = {
+                "count": stats.count, "bytes_received": stats.bytes_received,
+                "rate": stats.count / elapsed if elapsed else 0.0
+            }
+        return {"elapsed": elapsed, "commands": commands, "events": events}
+
+    def to_prometheus(self, prefix: str = "cdp") -> str:
+        """all statistics in the `Prometheus text format <https://prometheus.io/docs/instrumenting/exposition_formats/>`_
+
+        :param prefix: prefix for the metric names
+        """
+        lines = [
+            f"# TYPE {prefix}_command_duration_seconds histogram",
+        ]
+        counters = {"errors": [], "timeouts": [], "in_flight": [], "bytes_sent": [], "bytes_received": []}
+        for (target_id, method), stats in self._commands.items():
+            labels = f'target="{_escape(target_id)}",method="{_escape(method)}"'
+            cumulative = 0
+            for bound, count in zip((*self._buckets, "+Inf"), stats.buckets):
+                cumulative += count
+                lines.append(f'{prefix}_command_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"{prefix}_command_duration_seconds_sum{{{labels}}} {stats.total_time}")
+            lines.append(f"{prefix}_command_duration_seconds_count{{{labels}}} {stats.count}")
+            for name, values in counters.items():
+                values.append(f"{{{labels}}} {getattr(stats, name)}")
+        for name, values in counters.items():
+            metric = f"{prefix}_commands_in_flight" if name == "in_flight" else f"{prefix}_command_{name}_total"
+            lines.append(f"# TYPE {metric} {'gauge' if name == 'in_flight' else 'counter'}")
+            lines.extend(metric + value for value in values)
+        lines.append(f"# TYPE {prefix}_events_total counter")
+        event_bytes = []
+        for (target_id, method), stats in self._events.items():
+            labels = f'target="{_escape(target_id)}",method="{_escape(method)}"'
+            lines.append(f"{prefix}_events_total{{{labels}}} {stats.count}")
+            event_bytes.append(f"{prefix}_event_bytes_received_total{{{labels}}} {stats.bytes_received}")
+        lines.append(f"# TYPE {prefix}_event_bytes_received_total counter")
+        lines.extend(event_bytes)
+        return "\n".join(lines) + "\n"
+
+    def __repr__(self):
+        return f'<{type(self).__module__}.{type(self).__name__} (commands={len(self._commands)}, in_flight={self.in_flight})>'
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -162,3 +162,43 @@ def safe_wrap_fut(fn: typing.Awaitable):
     background_tasks.add(task)
     task.add_done_callback(background_tasks.discard)
     return fut
+
+
+_reaper = None
+
+
+def reap_dir(path: str) -> typing.Optional[str]:
+    """rename a directory to a trash path next to it and delete it in a background thread.
+    Returns the trash path, or ``None`` if the directory doesn't exist
+
+    :param path: the directory to delete
+    """
+    global _reaper
+    import shutil
+    import uuid
+    from concurrent.futures import ThreadPoolExecutor
+
+    path = os.path.abspath(path)
+    if not os.path.isdir(path):
+        return None
+    trash = f"{path}.trash-{uuid.uuid4().hex}"
+    try:
+        # atomic, the original path can be reused right away
+        os.rename(path, trash)
+    except OSError:
+        # files in use (windows), delete in place
+        trash = path
+
+    def delete():
+        for _ in range(20):
+            shutil.rmtree(trash, ignore_errors=True)
+            if not os.path.isdir(trash):
+                return
+            # chrome might still be writing to it
+            time.sleep(0.5)
+
+    if _reaper is None:
+        # joined at exit, directories are deleted completely
+        _reaper = ThreadPoolExecutor(max_workers=1, thread_name_prefix="selenium_driverless_reaper")
+    _reaper.submit(delete)
+    return trash
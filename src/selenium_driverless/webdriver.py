@@ -50,12 +50,14 @@ from selenium_driverless.types.context import Context
 from selenium_driverless.scripts.driver_utils import get_target
 from selenium_driverless.types.target import Target, TargetInfo
 from selenium_driverless.types.base_target import BaseTarget
+from selenium_driverless.types.connection import dup_pipe_fds
 from selenium_driverless.sync.base_target import BaseTarget as SyncBaseTarget
 
 # others
-from cdp_socket.utils.conn import get_json
 from selenium_driverless.types.options import Options as ChromeOptions
 from selenium_driverless.utils.utils import sel_driverless_path
+from selenium_driverless.utils.codec import Codec, get_codec
+from selenium_driverless.utils.metrics import CDPMetrics
 from selenium_driverless.types import JSEvalException
 from selenium_driverless import EXC_HANDLER
 
@@ -69,7 +71,12 @@ class Chrome:
             options: ChromeOptions = None,
             timeout: float = 30,
             debug: bool = False,
-            max_ws_size: int = 2 ** 27
+            max_ws_size: int = 2 ** 27,
+            flatten: bool = False,
+            codec: typing.Union[str, Codec, None] = None,
+            metrics: typing.Union[bool, CDPMetrics, None] = None,
+            record: str = None,
+            replay: str = None
     ) -> None:
         # noinspection GrazieInspection
         """Creates a new instance of the chrome target. Starts the service and
@@ -86,6 +93,11 @@ class Chrome:
                 :param timeout: timeout in seconds to start chrome
                 :param debug: redirect errors from the chromium process output (stderr) to console
                 :param max_ws_size: maximum size for websocket messages in bytes. 2^27 ~= 130 MB by default
+                :param flatten: multiplex all targets over the single browser websocket using flattened sessions (``Target.attachToTarget(flatten=True)``) instead of opening a websocket per target
+                :param codec: the JSON codec for CDP frames. ``"json"``, ``"orjson"``, ``"msgspec"``, ``"auto"`` for the fastest installed one, or an instance of :class:`Codec <selenium_driverless.utils.codec.Codec>`. Defaults to ``"json"``.
+                :param metrics: record per-method metrics for all CDP traffic, ``True`` or an instance of :class:`CDPMetrics <selenium_driverless.utils.metrics.CDPMetrics>`. Available at ``driver.base_target.metrics``
+                :param record: record all CDP frames to this file (gzip-compressed JSON-lines). Implies ``flatten=True``
+                :param replay: play back a file recorded with ``record`` as a fake browser, chrome doesn't get started. Implies ``flatten=True``
                 """
         self._prefs = {}
         self._auth_interception_enabled = None
@@ -107,6 +119,14 @@ class Chrome:
         self._contexts: typing.Dict[str, Context] = {}
         self._temp_dir = tempfile.TemporaryDirectory(prefix="selenium_driverless_").name
         self._max_ws_size = max_ws_size
+        self._flatten = flatten
+        self._codec = get_codec(codec)
+        self._metrics = metrics
+        self._record = record
+        self._replay = replay
+        self._new_context_lock: typing.Optional[asyncio.Lock] = None
+        self._context_pools: typing.Dict[tuple, typing.List[Context]] = {}
+        self._context_pool_tasks: typing.Dict[tuple, asyncio.Task] = {}
 
         self._auth = {}
 
@@ -154,7 +174,12 @@ class Chrome:
                 # extension
                 self._options.add_extension(sel_driverless_path() + "files/mv3_extension")
 
-            if not self._options.debugger_address:
+            pipe = self._options.remote_debugging_pipe and not self._replay
+            # noinspection PyProtectedMember
+            if pipe and (self._options._is_remote or self._options.debugger_address):
+                raise ValueError("remote_debugging_pipe can't be used with a remote browser or debugger_address")
+            pipe_fds = None
+            if not (self._options.debugger_address or pipe or self._replay):
                 from selenium_driverless.utils.utils import random_port
                 port = random_port()
                 self._options._debugger_address = f"127.0.0.1:{port}"
@@ -219,7 +244,7 @@ class Chrome:
             # noinspection PyProtectedMember
             self._is_remote = self._options._is_remote
 
-            if not self._is_remote:
+            if not (self._is_remote or self._replay):
                 path = options.binary_location
                 args = options.arguments
                 if self._debug:
@@ -227,22 +252,52 @@ class Chrome:
                 else:
                     self._stderr = tempfile.TemporaryFile(prefix="selenium_driverless")
                     self._stderr_file = self._stderr
+                preexec_fn = os.setsid if os.name == 'posix' else None
+                if pipe:
+                    if os.name != 'posix':
+                        raise NotImplementedError("--remote-debugging-pipe is only supported on posix")
+                    # chrome reads commands from fd 3 and writes to fd 4
+                    cmd_read, cmd_write = os.pipe()
+                    res_read, res_write = os.pipe()
+
+                    def preexec_fn():
+                        os.setsid()
+                        dup_pipe_fds(cmd_read, res_write)
+
+                    # pipe() returns the lowest free fds, 3 and 4 are in use now and can be passed
+                    pass_fds = (3, 4)
+                else:
+                    pass_fds = ()
+
                 self._process = subprocess.Popen(
                     [path, *args],
                     stdin=subprocess.PIPE,
                     stdout=subprocess.PIPE,
                     stderr=self._stderr,
+                    # fd 3 and 4 are inherited with --remote-debugging-pipe
                     close_fds=True,
-                    preexec_fn=os.setsid if os.name == 'posix' else None,
+                    pass_fds=pass_fds,
+                    preexec_fn=preexec_fn,
                     creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == 'nt' else 0,
                     shell=False,
                     text=True,
                     env=self._options.env
                 )
-
+                if pipe:
+                    # noinspection PyUnboundLocalVariable
+                    os.close(cmd_read)
+                    # noinspection PyUnboundLocalVariable
+                    os.close(res_write)
+                    # noinspection PyUnboundLocalVariable
+                    pipe_fds = (res_read, cmd_write)
+
+            if pipe or self._replay:
+                self.port = None
+                self._host = None
+            else:
                 host, port = self._options.debugger_address.split(":")
                 port = int(port)
-                if port == 0:
+                if port == 0 and not self._is_remote:
                     path = self._options.user_data_dir + "/DevToolsActivePort"
                     while not os.path.isfile(path):
                         await asyncio.sleep(0.1)
@@ -250,17 +305,23 @@ class Chrome:
                     port = int(port.split("\n")[0])
                     self._options.debugger_address = f"127.0.0.1:{port}"
 
-            host, port = self._options.debugger_address.split(":")
-            self.port = int(port)
-            self._host = f"{host}:{self.port}"
+                host, port = self._options.debugger_address.split(":")
+                self.port = int(port)
+                self._host = f"{host}:{self.port}"
             if self._loop:
                 self._base_target = await SyncBaseTarget(host=self._host, is_remote=self._is_remote,
                                                          timeout=self._timeout, loop=self._loop,
-                                                         max_ws_size=self._max_ws_size)
+                                                         max_ws_size=self._max_ws_size, flatten=self._flatten,
+                                                         codec=self._codec, pipe=pipe_fds,
+                                                         metrics=self._metrics, record=self._record,
+                                                         replay=self._replay)
             else:
                 self._base_target = await BaseTarget(host=self._host, is_remote=self._is_remote,
                                                      timeout=self._timeout, loop=self._loop,
-                                                     max_ws_size=self._max_ws_size)
+                                                     max_ws_size=self._max_ws_size, flatten=self._flatten,
+                                                     codec=self._codec, pipe=pipe_fds,
+                                                     metrics=self._metrics, record=self._record,
+                                                     replay=self._replay)
 
             # fetch useragent at first headless run
             # noinspection PyUnboundLocalVariable
@@ -270,13 +331,14 @@ class Chrome:
                 user_agent = user_agent.replace("HeadlessChrome", "Chrome")
                 await set_default_ua(user_agent)
 
-            if not self._is_remote:
+            if self._process is not None:
                 # noinspection PyUnboundLocalVariable
                 self.browser_pid = self._process.pid
-            targets = await get_json(self._host, timeout=self._timeout)
+            res = await self._base_target.execute_cdp_cmd("Target.getTargets")
+            targets = res["targetInfos"]
             for target in targets:
                 if target["type"] == "page" and not target["url"].startswith("chrome-extension://"):
-                    target_id = target["id"]
+                    target_id = target["targetId"]
                     self._current_target = await get_target(target_id=target_id, host=self._host,
                                                             loop=self._loop, is_remote=self._is_remote, timeout=10,
                                                             max_ws_size=self._max_ws_size, driver=self, context=None)
@@ -302,15 +364,17 @@ class Chrome:
                     self._base_context = context
                     self._contexts[_id] = context
                     break
-            await self.execute_cdp_cmd("Emulation.setFocusEmulationEnabled", {"enabled": True})
+            # independent of each other, don't wait for each response
+            setup = [self.execute_cdp_cmd("Emulation.setFocusEmulationEnabled", {"enabled": True})]
             if self._options.single_proxy:
-                await self.set_single_proxy(self._options.single_proxy)
+                setup.append(self.set_single_proxy(self._options.single_proxy))
             downloads_dir = self._options.downloads_dir
             if self._options.downloads_dir:
                 # ensure download events are dispatched
-                await self.set_download_behaviour("allowAndName", downloads_dir)
+                setup.append(self.set_download_behaviour("allowAndName", downloads_dir))
             else:
-                await self.set_download_behaviour("default")
+                setup.append(self.set_download_behaviour("default"))
+            await asyncio.gather(*setup)
             self._started = True
         return self
 
@@ -371,6 +435,15 @@ class Chrome:
         :param proxy_server: a proxy-server to use for the context
         :param proxy_bypass_list: a list of proxies to ignore
         """
+        if self._new_context_lock is None:
+            self._new_context_lock = asyncio.Lock()
+        # creating contexts concurrently races on the extension & auth state
+        async with self._new_context_lock:
+            return await self._new_context(proxy_bypass_list=proxy_bypass_list, proxy_server=proxy_server,
+                                           universal_access_origins=universal_access_origins, url=url)
+
+    async def _new_context(self, proxy_bypass_list: typing.List[str] = None, proxy_server: str = True,
+                           universal_access_origins: typing.List[str] = None, url: str = "about:blank") -> Context:
         await self.ensure_extensions_incognito_allowed()
         if proxy_bypass_list is None:
             proxy_bypass_list = ["localhost"]
@@ -441,6 +514,63 @@ class Chrome:
                     return context
         return context
 
+    async def acquire_context(self, proxy_bypass_list: typing.List[str] = None, proxy_server: str = True,
+                              universal_access_origins: typing.List[str] = None, pool_size: int = 1) -> Context:
+        """
+        get a new (incognito) context from a pool of contexts created ahead of time.
+        Returns instantly if a context with the same proxy settings is ready, and replenishes the pool in the background.
+
+        .. code-block:: python
+
+            context = await driver.acquire_context(proxy_server="http://localhost:5000")
+            await context.get("https://example.com")
+
+        :param proxy_server: a proxy-server to use for the context
+        :param proxy_bypass_list: a list of proxies to ignore
+        :param universal_access_origins: An optional list of origins to grant unlimited cross-origin access to
+        :param pool_size: the number of contexts to keep ready for these settings
+
+        .. note::
+            the first tab of the context starts at "about:blank". See :func:`Chrome.new_context <selenium_driverless.webdriver.Chrome.new_context>` for the parameters
+        """
+        key = (tuple(proxy_bypass_list) if proxy_bypass_list is not None else None,
+               proxy_server, tuple(universal_access_origins) if universal_access_origins else None)
+        pool = self._context_pools.setdefault(key, [])
+        context = None
+        while pool and context is None:
+            context = pool.pop(0)
+            if context.context_id not in self._contexts:
+                # got closed meanwhile
+                context = None
+        if context is None:
+            context = await self.new_context(proxy_bypass_list=proxy_bypass_list, proxy_server=proxy_server,
+                                             universal_access_origins=universal_access_origins)
+        self._fill_context_pool(key, pool_size)
+        return context
+
+    def _fill_context_pool(self, key: tuple, size: int):
+        task = self._context_pool_tasks.get(key)
+        if task is not None and not task.done():
+            return
+        proxy_bypass_list, proxy_server, universal_access_origins = key
+
+        async def fill():
+            pool = self._context_pools[key]
+            while len(pool) < size and self._started:
+                try:
+                    context = await self.new_context(
+                        proxy_bypass_list=list(proxy_bypass_list) if proxy_bypass_list is not None else None,
+                        proxy_server=proxy_server,
+                        universal_access_origins=list(universal_access_origins) if universal_access_origins else None
+                    )
+                except Exception as e:
+                    if self._started:
+                        EXC_HANDLER(e)
+                    return
+                pool.append(context)
+
+        self._context_pool_tasks[key] = asyncio.ensure_future(fill())
+
     async def get_targets(self,
                           _type: typing.Literal["page", "background_page", "service_worker", "browser", "other"] = None,
                           context_id: str or None = "self") -> typing.Dict[str, TargetInfo]:
@@ -482,22 +612,18 @@ class Chrome:
             await self.ensure_extensions_incognito_allowed()
         if not self._mv3_extension:
             import re
-            import time
-            start = time.perf_counter()
-            extension_target = None
-            while not extension_target:
-                targets = await self.get_targets(context_id=None)
-                for target in targets.values():
-                    if target.type == "service_worker":
-                        if re.fullmatch(
-                                r"chrome-extension://(.*)/"
-                                r"driverless_background_mv3_243ffdd55e32a012b4f253b2879af978\.js",
-                                target.url):
-                            extension_target = target.Target
-                            break
-                if not extension_target:
-                    if (time.perf_counter() - start) > timeout:
-                        raise asyncio.TimeoutError(f"Couldn't find mv3 extension within {timeout} seconds")
+
+            def is_extension(info: dict) -> bool:
+                return info["type"] == "service_worker" and bool(re.fullmatch(
+                    r"chrome-extension://(.*)/"
+                    r"driverless_background_mv3_243ffdd55e32a012b4f253b2879af978\.js",
+                    info["url"]))
+
+            try:
+                info = await self.base_target.registry.wait_for(is_extension, timeout=timeout)
+            except asyncio.TimeoutError:
+                raise asyncio.TimeoutError(f"Couldn't find mv3 extension within {timeout} seconds")
+            extension_target = await self.get_target(info["targetId"])
             while True:
                 try:
                     # fix WebRTC leak
@@ -678,18 +804,19 @@ class Chrome:
         target = self.current_target
         return target.pointer
 
-    async def send_keys(self, text: str):
+    async def send_keys(self, text: typing.Union[str, typing.Iterable[str]], timing=None):
         """
         send text & keys to the current target
 
-        :param text: the text to send
+        :param text: the text to send, see :func:`Target.send_keys <selenium_driverless.types.target.Target.send_keys>`
+        :param timing: the timing model, see :func:`Target.send_keys <selenium_driverless.types.target.Target.send_keys>`
         """
-        await self.current_target.send_keys(text)
+        await self.current_target.send_keys(text, timing=timing)
 
     async def execute_raw_script(self, script: str, *args, await_res: bool = False,
                                  serialization: typing.Literal["deep", "json", "idOnly"] = "deep",
                                  max_depth: int = None, timeout: float = 2, execution_context_id,
-                                 unique_context: bool = True):
+                                 unique_context: bool = True, plain: bool = False):
         """executes a JavaScript on ``GlobalThis`` such as
 
         .. code-block:: js
@@ -710,11 +837,11 @@ class Chrome:
         return await self.current_target.execute_raw_script(script, *args, await_res=await_res,
                                                             serialization=serialization, max_depth=max_depth,
                                                             timeout=timeout, execution_context_id=execution_context_id,
-                                                            unique_context=unique_context)
+                                                            unique_context=unique_context, plain=plain)
 
     async def execute_script(self, script: str, *args, max_depth: int = 2, serialization: str = None,
                              timeout: float = 2, execution_context_id: str = None,
-                             unique_context: bool = True):
+                             unique_context: bool = True, plain: bool = False):
         """executes JavaScript synchronously on ``GlobalThis`` such as
 
         .. code-block:: js
@@ -725,11 +852,22 @@ class Chrome:
                 """
         return await self.current_target.execute_script(script, *args, max_depth=max_depth, serialization=serialization,
                                                         timeout=timeout, execution_context_id=execution_context_id,
-                                                        unique_context=unique_context)
+                                                        unique_context=unique_context, plain=plain)
+
+    async def execute_script_many(self, script: str, elements: typing.Iterable[WebElement], *args,
+                                  max_depth: int = 2, serialization: str = None, timeout: float = 10,
+                                  plain: bool = False) -> list:
+        """executes JavaScript synchronously for multiple elements, with a single call per frame
+
+        see :func:`Target.execute_script_many <selenium_driverless.types.target.Target.execute_script_many>`
+        """
+        return await self.current_target.execute_script_many(script, elements, *args, max_depth=max_depth,
+                                                             serialization=serialization, timeout=timeout,
+                                                             plain=plain)
 
     async def execute_async_script(self, script: str, *args, max_depth: int = 2,
                                    serialization: str = None, timeout: float = 2, execution_context_id: str = None,
-                                   unique_context: bool = True):
+                                   unique_context: bool = True, plain: bool = False):
         """executes JavaScript asynchronously on ``GlobalThis`` such as
 
         .. warning::
@@ -746,11 +884,11 @@ class Chrome:
                                                               serialization=serialization,
                                                               timeout=timeout,
                                                               execution_context_id=execution_context_id,
-                                                              unique_context=unique_context)
+                                                              unique_context=unique_context, plain=plain)
 
     async def eval_async(self, script: str, *args, max_depth: int = 2,
                          serialization: str = None, timeout: float = 2, execution_context_id: str = None,
-                         unique_context: bool = True):
+                         unique_context: bool = True, plain: bool = False):
         """executes JavaScript asynchronously on ``GlobalThis`` such as
 
         .. code-block:: js
@@ -765,7 +903,7 @@ class Chrome:
         return await self.current_target.eval_async(script, *args, max_depth=max_depth, serialization=serialization,
                                                     timeout=timeout,
                                                     execution_context_id=execution_context_id,
-                                                    unique_context=unique_context)
+                                                    unique_context=unique_context, plain=plain)
 
     @property
     async def current_url(self) -> str:
@@ -792,15 +930,28 @@ class Chrome:
         """
         await self.current_target.focus()
 
-    async def quit(self, timeout: float = 30, clean_dirs: bool = True) -> None:
+    async def quit(self, timeout: float = 30, clean_dirs: bool = True, fast: bool = None) -> None:
         """Closes Chrome
         :param timeout: the maximum time waiting for chrome to quit correctly
         :param clean_dirs: whether to clean out the user-data-dir directory
+        :param fast: kill chrome right away and delete the directories in the background.
+            Defaults to :func:`ChromeOptions.fast_quit <selenium_driverless.types.options.Options.fast_quit>`
         """
         from selenium_driverless import EXC_HANDLER
 
         loop = asyncio.get_running_loop()
 
+        for task in self._context_pool_tasks.values():
+            task.cancel()
+        self._context_pool_tasks.clear()
+        self._context_pools.clear()
+
+        if fast is None:
+            fast = self._options.fast_quit
+        if fast and self._started:
+            await self._fast_quit(timeout=timeout, clean_dirs=clean_dirs)
+            return
+
         def clean_dirs_sync(dirs: typing.List[str]):
             for _dir in dirs:
                 while os.path.isdir(_dir):
@@ -877,6 +1028,46 @@ class Chrome:
                                 ResourceWarning)
                             raise e
 
+    async def _fast_quit(self, timeout: float = 30, clean_dirs: bool = True) -> None:
+        from selenium_driverless.utils.utils import reap_dir
+        loop = asyncio.get_running_loop()
+        self._started = False
+        if self._is_remote or self._process is None:
+            # not allowed to kill, dispose the contexts in parallel
+            # noinspection PyProtectedMember
+            contexts = [context for context in self._contexts.values() if context._is_incognito]
+            await asyncio.gather(*[context.quit(timeout=timeout) for context in contexts])
+            try:
+                await self.base_target.execute_cdp_cmd("Browser.close", timeout=7)
+            except websockets.ConnectionClosedError:
+                pass
+            except Exception as e:
+                EXC_HANDLER(e)
+        else:
+            try:
+                if os.name == 'posix':
+                    os.killpg(os.getpgid(self._process.pid), signal.SIGKILL)
+                else:
+                    self._process.kill()
+                await loop.run_in_executor(None, lambda: self._process.wait(timeout))
+            except ProcessLookupError:
+                # exited already
+                pass
+            except Exception as e:
+                EXC_HANDLER(e)
+            else:
+                self._process = None
+        if self._stderr_file:
+            try:
+                self._stderr.close()
+            except Exception as e:
+                EXC_HANDLER(e)
+        if not self._is_remote:
+            # renamed right away, deleted in the background
+            reap_dir(self._temp_dir)
+            if clean_dirs:
+                reap_dir(self._options.user_data_dir)
+
     def __del__(self):
         try:
             if self._started:
@@ -1063,6 +1254,14 @@ class Chrome:
         """
         return await self.current_target.find_element(by=by, value=value, timeout=timeout)
 
+    async def wait_for_element(self, by: str, value: str, timeout: float or None = 10,
+                               state: typing.Literal["attached", "visible"] = "attached") -> WebElement:
+        """wait for an element in the current target, without polling
+
+        see :func:`Target.wait_for_element <selenium_driverless.types.target.Target.wait_for_element>`
+        """
+        return await self.current_target.wait_for_element(by=by, value=value, timeout=timeout, state=state)
+
     async def find_elements(self, by: str, value: str, timeout: float = 3) -> typing.List[WebElement]:
         """find multiple elements in the current target
 
@@ -1475,6 +1674,13 @@ class Chrome:
         """
         return await self.current_context.execute_cdp_cmd(cmd=cmd, cmd_args=cmd_args, timeout=timeout)
 
+    async def execute_cdp_batch(self, cmds: typing.Iterable[typing.Tuple[str, typing.Optional[dict]]],
+                                timeout: float or None = 10) -> typing.List[typing.Union[dict, Exception]]:
+        """Execute multiple independent Chrome Devtools Protocol commands on the current target within one round-trip
+        see :func:`Context.execute_cdp_batch <selenium_driverless.types.context.Context.execute_cdp_batch>` for reference
+        """
+        return await self.current_context.execute_cdp_batch(cmds, timeout=timeout)
+
     async def fetch(self, *args, **kwargs) -> dict:
         """
         executes a JS ``fetch`` request within the current target
@@ -0,0 +1,116 @@
+import asyncio
+import os
+import time
+
+import pytest
+from selenium_driverless import webdriver
+from selenium_driverless.scripts.pool import ChromePool
+
+
+@pytest.mark.asyncio
+async def test_chrome_pool(h_options, test_server):
+    async with ChromePool(size=1, options=lambda: h_options, max_uses=2) as pool:
+        async with pool.lease() as driver:
+            await driver.get(test_server.url + "/cookie_setter?name=test&value=1")
+            await driver.new_window("tab")
+            await driver.new_context()
+            first = driver
+        async with pool.lease() as driver:
+            assert driver is first
+            assert len(await driver.base_context.get_targets(_type="page")) == 1
+            assert await driver.get_cookies() == []
+            assert len(await driver.contexts) == 1
+        async with pool.lease(timeout=30) as driver:
+            # recycled after max_uses
+            assert driver is not first
+
+
+@pytest.mark.asyncio
+async def test_acquire_context(h_driver):
+    first = await h_driver.acquire_context(proxy_server="http://localhost:5000")
+    assert first.context_id in await h_driver.contexts
+    # replenished in the background
+    await asyncio.sleep(3)
+    second = await h_driver.acquire_context(proxy_server="http://localhost:5000")
+    assert second.context_id != first.context_id
+    await first.quit()
+    await second.quit()
+
+
+@pytest.mark.asyncio
+async def test_fast_quit(h_options):
+    h_options.fast_quit = True
+    driver = await webdriver.Chrome(options=h_options)
+    await driver.new_context()
+    user_data_dir = driver._options.user_data_dir
+    start = time.perf_counter()
+    await driver.quit()
+    assert time.perf_counter() - start < 2
+    # renamed right away
+    assert not os.path.isdir(user_data_dir)
+
+
+class FakeDriver:
+    class _options:
+        auto_clean_dirs = True
+
+    browser_pid = None
+
+    async def quit(self, clean_dirs: bool = True):
+        pass
+
+
+class FlakyPool(ChromePool):
+    def __init__(self, failures: int, **kwargs):
+        super().__init__(size=1, respawn_backoff=0, **kwargs)
+        self.failures = failures
+        self.spawned = 0
+
+    async def _spawn(self):
+        self.spawned += 1
+        if self.spawned > 1 and self.failures:
+            self.failures -= 1
+            raise OSError("couldn't start chrome")
+        driver = FakeDriver()
+        self._drivers.add(driver)
+        self._uses[driver] = 0
+        self._idle.put_nowait(driver)
+
+    @staticmethod
+    async def _reset(driver):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_chrome_pool_respawn_retries():
+    async with FlakyPool(failures=2, respawn_retries=3) as pool:
+        driver = await pool.acquire()
+        await pool.release(driver, recycle=True)
+        assert await pool.acquire(timeout=5) is not driver
+        assert pool.spawned == 4
+
+
+@pytest.mark.asyncio
+async def test_chrome_pool_respawn_failure():
+    async with FlakyPool(failures=2, respawn_retries=0) as pool:
+        driver = await pool.acquire()
+        await pool.release(driver, recycle=True)
+        with pytest.raises(OSError):
+            await pool.acquire(timeout=5)
+        with pytest.raises(OSError):
+            await pool.acquire(timeout=5)
+        # recovers once starting works again
+        assert isinstance(await pool.acquire(timeout=5), FakeDriver)
+
+
+@pytest.mark.asyncio
+async def test_chrome_pool_rss_warning(monkeypatch):
+    from selenium_driverless.scripts import pool as pool_module
+    monkeypatch.setattr(pool_module, "process_rss", lambda pid: None)
+    async with FlakyPool(failures=0, max_rss=2 ** 30) as pool:
+        with pytest.warns(UserWarning) as record:
+            for _ in range(3):
+                driver = await pool.acquire()
+                driver.browser_pid = 1
+                await pool.release(driver)
+        assert len(record) == 1
@@ -61,6 +61,28 @@ async def h_driver() -> typing.Generator[webdriver.Chrome, None, None]:
         yield _driver
 
 
+@pytest.fixture
+def h_options() -> webdriver.ChromeOptions:
+    options = mk_opt(headless=True)
+    options.headless = not no_headless
+    return options
+
+
+@pytest_asyncio.fixture
+async def h_driver_factory(h_options) -> typing.Generator[typing.Callable[..., typing.Awaitable[webdriver.Chrome]], None, None]:
+    """starts headless drivers with custom kwargs, quits them after the test"""
+    drivers = []
+
+    async def factory(options: webdriver.ChromeOptions = None, **kwargs) -> webdriver.Chrome:
+        _driver = await webdriver.Chrome(options=h_options if options is None else options, **kwargs)
+        drivers.append(_driver)
+        return _driver
+
+    yield factory
+    for _driver in drivers:
+        await _driver.quit()
+
+
 @pytest.fixture
 def sync_driver() -> typing.Generator[webdriver.Chrome, None, None]:
     options = mk_opt()
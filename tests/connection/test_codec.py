@@ -0,0 +1,63 @@
+import json
+
+import pytest
+from selenium_driverless.utils.codec import Codec, OrjsonCodec, MsgspecCodec, get_codec
+
+CODECS = ["json", "orjson", "msgspec"]
+
+
+@pytest.fixture(params=CODECS)
+def codec(request) -> Codec:
+    try:
+        return get_codec(request.param)
+    except ImportError:
+        pytest.skip(f"{request.param} isn't installed")
+
+
+def test_default_codec():
+    assert type(get_codec()) is Codec
+    assert type(get_codec("auto")) in (Codec, OrjsonCodec, MsgspecCodec)
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+@pytest.mark.parametrize("obj", [
+    {"id": 1, "method": "Runtime.evaluate", "params": {"expression": "'\\ud800'"}},
+    {"text": "\ud800 lone surrogate"},
+    {"big": 2 ** 53 + 1, "bigger": 2 ** 70, "negative": -2 ** 64},
+    {"unicode": "ä€😀", "nested": [None, True, 1.5, {"a": []}]},
+])
+def test_round_trip(codec, obj):
+    data = codec.dumps(obj)
+    assert json.loads(data) == obj
+    assert codec.loads(data) == obj
+    assert codec.loads(data.encode("utf-8", "surrogatepass")) == obj
+
+
+def test_lone_surrogate_frame(codec):
+    # chrome escapes lone surrogates in strings it returns
+    data = '{"id": 3, "result": {"result": {"type": "string", "value": "\\ud83d"}}}'
+    frame = codec.loads_frame(data)
+    assert codec.decode_payload(frame["result"])["result"]["value"] == "\ud83d"
+
+
+def test_big_int_frame(codec):
+    data = '{"id": 4, "result": {"value": %d}}' % (2 ** 70)
+    frame = codec.loads_frame(data)
+    assert frame["id"] == 4
+    assert codec.decode_payload(frame["result"])["value"] == 2 ** 70
+
+
+def test_lazy_payload():
+    msgspec = pytest.importorskip("msgspec")
+    codec = MsgspecCodec()
+    data = b'{"method": "Network.requestWillBeSent", "sessionId": "abc", "params": {"requestId": "1", "n": 18014398509481985}}'
+    frame = codec.loads_frame(data)
+    assert frame["method"] == "Network.requestWillBeSent" and frame["sessionId"] == "abc"
+    # kept raw until needed
+    assert isinstance(frame["params"], msgspec.Raw)
+    assert codec.decode_payload(frame["params"]) == {"requestId": "1", "n": 2 ** 54 + 1}
+    # already decoded payloads pass through
+    assert codec.decode_payload({"a": 1}) == {"a": 1}
+    error = codec.loads_frame(b'{"id": 2, "error": {"code": -32000, "message": "x"}}')
+    assert error["error"] == {"code": -32000, "message": "x"}
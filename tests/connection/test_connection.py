@@ -0,0 +1,98 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from cdp_socket.exceptions import CDPError
+from selenium_driverless import webdriver
+from selenium_driverless.types.by import By
+from selenium_driverless.types.connection import Session, PipeConnection, dup_pipe_fds
+
+
+@pytest.mark.asyncio
+async def test_flattened_sessions(h_driver_factory, test_server):
+    driver = await h_driver_factory(flatten=True)
+    target = driver.current_target
+    await target.get(test_server.url)
+    assert isinstance(target.socket, Session)
+    assert target.socket.connection == driver.base_target.socket
+    assert await target.execute_script("return document.body.textContent") == "Hello World!"
+    new_tab = await driver.new_window("tab")
+    assert await new_tab.execute_script("return 1+1") == 2
+    await new_tab.close()
+
+
+@pytest.mark.asyncio
+async def test_execute_cdp_batch(h_driver):
+    version, metrics, err = await h_driver.execute_cdp_batch([
+        ("Browser.getVersion", None),
+        ("Page.getLayoutMetrics", None),
+        ("Not.aMethod", {})
+    ])
+    assert "userAgent" in version
+    assert "cssVisualViewport" in metrics
+    assert isinstance(err, CDPError)
+
+
+@pytest.mark.asyncio
+async def test_remote_debugging_pipe(h_driver_factory, h_options, test_server):
+    h_options.remote_debugging_pipe = True
+    driver = await h_driver_factory()
+    assert isinstance(driver.base_target.socket, PipeConnection)
+    await driver.get(test_server.url)
+    assert await driver.execute_script("return document.body.textContent") == "Hello World!"
+
+
+@pytest.mark.asyncio
+async def test_cdp_metrics(h_driver_factory, test_server):
+    driver = await h_driver_factory(metrics=True)
+    metrics = driver.base_target.metrics
+    ended = []
+    metrics.on_command_end.append(lambda target_id, method, duration, error: ended.append(method))
+    await driver.get(test_server.url)
+    stats = metrics.as_dict()["commands"][driver.current_target.id]["Page.navigate"]
+    assert stats["count"] == 1 and stats["in_flight"] == 0
+    assert "Page.navigate" in ended
+    assert 'method="Page.navigate"' in metrics.to_prometheus()
+
+
+@pytest.mark.asyncio
+async def test_record_replay(h_driver_factory, test_server, tmp_path):
+    path = str(tmp_path / "session.cdp.gz")
+
+    async def run(**kwargs):
+        driver = await h_driver_factory(**kwargs)
+        await driver.get(test_server.url)
+        elems = await driver.find_elements(By.TAG_NAME, "body")
+        return [await elem.text for elem in elems]
+
+    recorded = await run(record=path)
+    # no chrome started
+    assert await run(replay=path) == recorded
+
+
+@pytest.mark.skipif(os.name != "posix", reason="--remote-debugging-pipe is only supported on posix")
+def test_dup_pipe_fds():
+    leaked_read, leaked_write = os.pipe()
+    os.set_inheritable(leaked_read, True)
+    cmd_read, cmd_write = os.pipe()
+    res_read, res_write = os.pipe()
+    script = "import os; os.write(4, os.read(3, 5)[::-1]); print(len(os.listdir('/proc/self/fd')) if os.path.isdir('/proc/self/fd') else 6)"
+    process = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE, text=True, close_fds=True,
+                               pass_fds=(3, 4), preexec_fn=lambda: dup_pipe_fds(cmd_read, res_write))
+    os.close(cmd_read)
+    os.close(res_write)
+    os.write(cmd_write, b"hello")
+    assert os.read(res_read, 5) == b"olleh"
+    # stdin, stdout, stderr, 3, 4 and the one listing the directory
+    assert process.communicate()[0].strip() == "6"
+    for fd in (leaked_read, leaked_write, cmd_write, res_read):
+        os.close(fd)
+
+
+@pytest.mark.asyncio
+async def test_remote_debugging_pipe_remote(h_options):
+    h_options.remote_debugging_pipe = True
+    h_options.debugger_address = "127.0.0.1:9222"
+    with pytest.raises(ValueError):
+        await webdriver.Chrome(options=h_options)
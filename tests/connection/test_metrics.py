@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+from selenium_driverless.types.connection import Connection
+from selenium_driverless.utils.metrics import CDPMetrics
+
+
+class FakeConnection(Connection):
+    def __init__(self, metrics: CDPMetrics):
+        super().__init__(websock_url="ws://localhost:0", metrics=metrics, loop=asyncio.get_running_loop())
+        self.sent = []
+
+    async def _send_raw(self, data: str):
+        self.sent.append(data)
+
+
+def raising_hook(*args):
+    raise ValueError("hook failed")
+
+
+@pytest.fixture
+def exceptions(monkeypatch):
+    caught = []
+    monkeypatch.setattr("selenium_driverless.utils.metrics.EXC_HANDLER", caught.append)
+    return caught
+
+
+def test_raising_hooks(exceptions):
+    metrics = CDPMetrics()
+    metrics.on_command_start.append(raising_hook)
+    metrics.on_command_end.append(raising_hook)
+    metrics.command_start(1, 1, "target", "Page.enable", None, 30)
+    assert metrics.in_flight == 1
+    metrics.command_end(1, 1, 10)
+    assert metrics.in_flight == 0
+    stats = metrics.as_dict()["commands"]["target"]["Page.enable"]
+    assert stats["count"] == 1 and stats["in_flight"] == 0
+    assert len(exceptions) == 2
+
+
+@pytest.mark.asyncio
+async def test_raising_hooks_connection(exceptions):
+    metrics = CDPMetrics()
+    metrics.on_command_start.append(raising_hook)
+    metrics.on_command_end.append(raising_hook)
+    conn = FakeConnection(metrics)
+    _id = await conn.send("Browser.getVersion")
+    # the frame got written despite the hook
+    assert len(conn.sent) == 1
+    await conn._on_frame('{"id": %d, "result": {"product": "Chrome"}}' % _id)
+    assert await conn.wait_reply(_id, timeout=1) == {"product": "Chrome"}
+    assert metrics.in_flight == 0
+    assert len(exceptions) == 2
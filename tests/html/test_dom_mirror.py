@@ -0,0 +1,25 @@
+import asyncio
+
+import pytest
+from selenium_driverless.types.by import By
+
+
+@pytest.mark.asyncio
+async def test_dom_mirror(h_driver, test_server):
+    target = h_driver.current_target
+    await h_driver.get(test_server.url)
+    await h_driver.execute_script("document.body.innerHTML = '<ul id=\"list\"><li class=\"a\">one</li></ul>'")
+    mirror = await target.mirror_dom()
+    assert [node.text for node in mirror.find_nodes(By.CSS_SELECTOR, "#list > li.a")] == ["one"]
+    await h_driver.execute_script("""
+        const li = document.createElement("li");
+        li.textContent = "two";
+        document.getElementById("list").appendChild(li);
+        document.querySelector("li.a").setAttribute("data-x", "1")
+    """)
+    await asyncio.sleep(0.5)
+    assert [node.text for node in mirror.find_nodes(By.XPATH, "//ul/li")] == ["one", "two"]
+    assert mirror.find_node(By.CSS_SELECTOR, "[data-x='1']").text == "one"
+    elem = await mirror.find_element(By.XPATH, "//li[text()='two']")
+    assert await elem.text == "two"
+    await mirror.stop()
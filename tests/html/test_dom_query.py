@@ -0,0 +1,85 @@
+import itertools
+
+import pytest
+from selenium_driverless.types.dom_mirror import DomNode
+from selenium_driverless.utils import dom_query
+
+_ids = itertools.count(1)
+
+
+def elem(tag, *children, **attrs):
+    return {"nodeType": 1, "nodeName": tag.upper(), "localName": tag,
+            "attributes": [item for pair in attrs.items() for item in pair], "children": list(children)}
+
+
+def text(value):
+    return {"nodeType": 3, "nodeName": "#text", "nodeValue": value}
+
+
+def build(node, parent=None):
+    _id = next(_ids)
+    res = DomNode({"nodeId": _id, "backendNodeId": _id, **node}, parent, None)
+    res.children = [build(child, res) for child in node.get("children", [])]
+    return res
+
+
+@pytest.fixture
+def document():
+    return build({"nodeType": 9, "nodeName": "#document", "children": [
+        elem("html", elem("body",
+                          elem("h1", text("title"), id="title"),
+                          elem("div",
+                               elem("p", text("first"), **{"class": "a b"}),
+                               elem("p", text("second"), **{"class": "b"}),
+                               elem("span", text("third")),
+                               id="content", lang="en-US"),
+                          elem("p", text("last"))))
+    ]})
+
+
+def texts(nodes):
+    return [node.text for node in nodes]
+
+
+@pytest.mark.parametrize("selector", ["h1 , p", "h1,p", "h1, p", " h1 ,p "])
+def test_selector_list_whitespace(document, selector):
+    assert texts(dom_query.select(document, selector)) == ["title", "first", "second", "last"]
+
+
+@pytest.mark.parametrize("selector", ["div p ", "div p", "  div   p  ", "div > p", "div>p "])
+def test_trailing_whitespace(document, selector):
+    assert texts(dom_query.select(document, selector)) == ["first", "second"]
+
+
+def test_select(document):
+    assert texts(dom_query.select(document, "#title")) == ["title"]
+    assert texts(dom_query.select(document, "p.b")) == ["first", "second"]
+    assert texts(dom_query.select(document, ".a.b")) == ["first"]
+    assert texts(dom_query.select(document, "[lang|=en] :last-child")) == ["third"]
+    assert texts(dom_query.select(document, "div p:nth-child(2)")) == ["second"]
+    assert texts(dom_query.select(document, "h1 ~ p")) == ["last"]
+    assert texts(dom_query.select(document, "p + span")) == ["third"]
+    assert texts(dom_query.select(document, "p:not(.a, div > p:nth-child(2))")) == ["last"]
+
+
+def test_matches(document):
+    body = document.children[0].children[0]
+    assert dom_query.matches(body, "html > body")
+    assert dom_query.matches(body, "div , body ")
+    assert not dom_query.matches(body, "div")
+
+
+@pytest.mark.parametrize("selector", ["", ",p", "p,", "p >", "> p", "p::before"])
+def test_invalid_selectors(selector):
+    with pytest.raises(ValueError):
+        dom_query.parse_css(selector)
+
+
+def test_xpath(document):
+    assert texts(dom_query.xpath(document, "//p")) == ["first", "second", "last"]
+    assert texts(dom_query.xpath(document, "//div/p[2]")) == ["second"]
+    assert texts(dom_query.xpath(document, "//p[contains(@class, 'a')]")) == ["first"]
+    assert texts(dom_query.xpath(document, "//*[@id='content']/*[last()]")) == ["third"]
+    assert texts(dom_query.xpath(document, "//h1 | //span")) == ["title", "third"]
+    assert texts(dom_query.xpath(document, "//p[normalize-space(text())='last']")) == ["last"]
+    assert [node.local_name for node in dom_query.xpath(document, "//span/ancestor::*")] == ["html", "body", "div"]
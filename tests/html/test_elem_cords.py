@@ -1,3 +1,4 @@
+from selenium_driverless.types.by import By
 from selenium_driverless.types.webelement import WebElement, ElementNotVisible
 from selenium_driverless.webdriver import Chrome
 import asyncio
@@ -250,3 +251,34 @@ async def test_elem_visible(h_driver, subtests):
         visible = await elem.is_visible()
         with subtests.test(style=style_script, visible=visible, expected=expected):
             assert visible == expected
+
+
+@pytest.mark.asyncio
+async def test_element_geometry(h_driver, test_server):
+    await h_driver.get(test_server.url)
+    await h_driver.execute_script("document.body.innerHTML = '<button style=\"margin-top: 3000px\">click</button>'")
+    elem = await h_driver.find_element(By.TAG_NAME, "button")
+    geometry = await elem.geometry(scroll_to=True)
+    assert geometry["visible"]
+    assert geometry["p_visible"] > 0
+    assert await elem.is_visible(geometry=geometry)
+    assert await elem.is_clickable(geometry=geometry)
+    x, y = await elem.mid_location(geometry=geometry)
+    assert 0 <= y <= geometry["viewport"][2][1]
+    await elem.click()
+
+
+@pytest.mark.asyncio
+async def test_mid_location_mostly_hidden():
+    import numpy as np
+    from selenium_driverless.scripts.geometry import overlap
+    # 10000px wide, only the last 100px are within the viewport
+    quad = [[-9900, 0], [100, 0], [100, 50], [-9900, 50]]
+    viewport = np.array([[0, 0], [800, 0], [800, 600], [0, 600]])
+    p_visible, polygon = overlap(viewport, np.array(quad))
+    geometry = {"box_model": {"content": quad, "padding": quad, "border": quad}, "visible": True,
+                "viewport": viewport, "p_visible": p_visible, "polygon": polygon}
+    for _ in range(100):
+        # noinspection PyTypeChecker
+        x, y = await WebElement.mid_location(None, geometry=geometry)
+        assert 0 <= x <= 100 and 0 <= y <= 50
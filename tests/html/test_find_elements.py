@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+from selenium_driverless.types.by import By
+
+
+@pytest.mark.asyncio
+async def test_element_list(h_driver, test_server):
+    await h_driver.get(test_server.url)
+    elems = await h_driver.find_elements(By.CSS_SELECTOR, "*")
+    assert len(elems) > 0
+    texts = await elems.texts()
+    assert len(texts) == len(elems)
+    assert texts[0] == await elems[0].text
+    assert len(await elems.attributes("id")) == len(elems)
+    assert len(await elems.rects()) == len(elems)
+    props = await elems.properties(["tagName", "id"])
+    assert props["tagName"][0] == "HTML"
+    assert len(props["id"]) == len(elems)
+    assert await h_driver.execute_script_many("return obj.tagName + arguments[0]", elems[:1], "!") == ["HTML!"]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_element(h_driver, test_server):
+    await h_driver.get(test_server.url)
+    await h_driver.execute_script("""
+        setTimeout(() => {
+            const elem = document.createElement("div");
+            elem.id = "delayed";
+            elem.style.display = "none";
+            document.body.appendChild(elem);
+            setTimeout(() => {elem.style.display = "block"; elem.textContent = "visible"}, 200)
+        }, 200)
+    """)
+    elem = await h_driver.wait_for_element(By.ID, "delayed", timeout=5)
+    assert await elem.text == ""
+    elem = await h_driver.wait_for_element(By.CSS_SELECTOR, "#delayed", timeout=5, state="visible")
+    assert await elem.text == "visible"
+    with pytest.raises(asyncio.TimeoutError):
+        await h_driver.wait_for_element(By.CSS_SELECTOR, "#missing", timeout=0.5)
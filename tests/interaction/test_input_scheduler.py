@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+from cdp_socket.exceptions import CDPError
+from selenium_driverless.input.scheduler import InputScheduler
+
+
+class FakeSocket:
+    """replies after ``delay`` seconds, with an error for ``{"x": -1}`` and never for ``{"x": None}``"""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.replies = {}
+
+    async def send(self, method, params=None):
+        _id = len(self.replies)
+        loop = asyncio.get_event_loop()
+        fut = loop.create_future()
+        self.replies[_id] = fut
+        x = (params or {}).get("x", 0)
+        if x == -1:
+            loop.call_later(self.delay, fut.set_exception, CDPError({"code": -32000, "message": "bad"}))
+        elif x is not None:
+            loop.call_later(self.delay, fut.set_result, {})
+        return _id
+
+    async def wait_reply(self, _id, method=None, params=None, timeout=2):
+        return await asyncio.wait_for(self.replies[_id], timeout)
+
+
+class FakeTarget:
+    def __init__(self):
+        self.socket = FakeSocket()
+
+
+def move(x):
+    return "Input.dispatchMouseEvent", {"type": "mouseMoved", "x": x, "y": 0}
+
+
+@pytest.mark.asyncio
+async def test_input_scheduler(h_driver, test_server):
+    await h_driver.get(test_server.url)
+    target = h_driver.current_target
+    await target.pointer.move_to(500, 300, total_time=0.3)
+    stats = target.input_scheduler.stats()
+    assert stats["sent"] > 0 and stats["p95"] < 0.05
+    assert target.input_scheduler.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_input_scheduler_batches():
+    scheduler = InputScheduler(FakeTarget())
+    failing = [(0, *move(-1)), (0.01, *move(1))]
+    ok = [(0, *move(2)), (0.01, *move(3))]
+    results = await asyncio.gather(scheduler.run(failing), scheduler.run(ok), return_exceptions=True)
+    assert isinstance(results[0], CDPError)
+    assert not isinstance(results[1], Exception)
+    assert scheduler.pending == 0 and not scheduler.errors
+
+    # events sent without a batch are flushed with the scheduler
+    await scheduler.run(failing, flush=False)
+    batch = scheduler.batch()
+    await scheduler.run(ok, flush=False, batch=batch)
+    await batch.flush()
+    with pytest.raises(CDPError):
+        await scheduler.flush()
+    assert not scheduler.errors
+
+
+@pytest.mark.asyncio
+async def test_input_scheduler_flush_timeout():
+    scheduler = InputScheduler(FakeTarget())
+    batch = scheduler.batch()
+    await scheduler.send(*move(-1), batch=batch)
+    await scheduler.send(*move(None), batch=batch)
+    with pytest.raises(asyncio.TimeoutError):
+        await batch.flush(timeout=0.1)
+    # neither the error nor the late reply leak into the next flush
+    assert batch.pending == 0 and not batch.errors
+    await scheduler.send(*move(1), batch=batch)
+    await batch.flush()
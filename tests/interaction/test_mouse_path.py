@@ -0,0 +1,23 @@
+import numpy as np
+
+from selenium_driverless.scripts.geometry import PathTimeline, PathLibrary, catmull_rom
+
+
+def test_path_timeline():
+    path = np.array([[i, 2 * i] for i in range(100)])
+    timeline = PathTimeline(path, total_time=0.5, accel=2, mid_time=0.4)
+    assert timeline.at(0) == (0, 0)
+    assert timeline.at(0.5) == (99, 198)
+    assert timeline.at(0.2)[0] in (49, 50)
+    times, points = timeline.schedule(freq=60)
+    assert times[0] == 0 and times[-1] <= 0.5
+    assert points[-1].tolist() == [99, 198]
+    assert np.all(np.diff(times) > 0) and np.all(np.diff(points[:, 0]) > 0)
+
+
+def test_path_library():
+    spline = catmull_rom([[0, 0], [10, 5], [20, 0]], 50)
+    assert spline[0].tolist() == [0, 0] and spline[-1].tolist() == [20, 0]
+    library = PathLibrary(size=4, samples=500)
+    path = library.path([100, 0], [400, 300])
+    assert path[0] == (100, 0) and path[-1] == (400, 300)
@@ -3,6 +3,8 @@ import asyncio
 import pytest
 from selenium_driverless.types.target import KEY_MAPPING
 from selenium_driverless.types.webelement import WebElement
+from selenium_driverless.types.by import By
+from selenium_driverless.input.keyboard import InsertText
 
 
 @pytest.mark.asyncio
@@ -23,3 +25,13 @@ async def test_assert_chars(h_driver, subtests):
             assert value == key
             await elem.execute_script("obj.value=''; obj.textContent=''")
             await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_send_keys_timing(h_driver, test_server):
+    await h_driver.get(test_server.url)
+    await h_driver.execute_script("document.body.innerHTML = '<textarea></textarea>'")
+    elem = await h_driver.find_element(By.TAG_NAME, "textarea")
+    await elem.send_keys(["Hi!\n", InsertText("x" * 500), " ok"], timing="instant")
+    await elem.send_keys("Ab", click_on=False, timing="fast")
+    assert await elem.execute_script("return obj.value") == "Hi!\n" + "x" * 500 + " okAb"
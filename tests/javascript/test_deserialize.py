@@ -0,0 +1,44 @@
+from selenium_driverless.types.deserialize import parse_deep_sync, JSMap, JSSet
+
+
+def number(value):
+    return {"type": "number", "value": value}
+
+
+def obj(**kwargs):
+    return {"type": "object", "value": [[k, v] for k, v in kwargs.items()]}
+
+
+def test_plain_map():
+    deep = {"type": "map", "value": [["a", number(1)], [number(2), number(3)]]}
+    assert parse_deep_sync(deep, plain=True) == {"a": 1, 2: 3}
+
+
+def test_plain_map_unhashable_keys():
+    deep = {"type": "map", "value": [[obj(a=number(1)), number(2)], ["b", number(3)]]}
+    assert parse_deep_sync(deep, plain=True) == [[{"a": 1}, 2], ["b", 3]]
+
+
+def test_plain_set():
+    deep = {"type": "set", "value": [number(1), {"type": "string", "value": "a"}]}
+    assert parse_deep_sync(deep, plain=True) == {1, "a"}
+
+
+def test_plain_set_unhashable_members():
+    deep = {"type": "set", "value": [obj(a=number(1)), {"type": "array", "value": [number(2)]}]}
+    assert parse_deep_sync(deep, plain=True) == [{"a": 1}, [2]]
+
+
+def test_map_object_keys():
+    deep = {"type": "map", "value": [[obj(a=number(1)), number(2)]]}
+    res = parse_deep_sync(deep)
+    assert isinstance(res, JSMap)
+    assert len(res) == 1
+
+
+def test_set_object_members():
+    deep = {"type": "set", "value": [obj(a=number(1)), number(2)]}
+    res = parse_deep_sync(deep)
+    assert isinstance(res, JSSet)
+    assert 2 in res
+    assert len(res) == 2
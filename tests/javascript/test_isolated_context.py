@@ -1,4 +1,5 @@
 import pytest
+from selenium_driverless.types.by import By
 
 
 @pytest.mark.asyncio
@@ -23,3 +24,56 @@ async def test_isolated_execution_context(h_driver):
     mocked = await h_driver.execute_script("return document.documentElement.outerHTML", unique_context=False)
     assert mocked == "mocked value:)"
     assert src != "mocked value:)"
+
+
+@pytest.mark.asyncio
+async def test_shared_isolated_world(h_driver, test_server):
+    target = h_driver.current_target
+    await h_driver.get(test_server.url)
+    elems = await h_driver.find_elements(By.CSS_SELECTOR, "*")
+    world = await target._isolated_context_id
+    assert {await elem.__isolated_exec_id__ for elem in elems} == {world}
+    await h_driver.get(test_server.url)
+    assert await target._isolated_context_id != world
+
+
+@pytest.mark.asyncio
+async def test_execution_context_tracker(h_driver, test_server):
+    target = h_driver.current_target
+    await h_driver.get(test_server.url)
+    with pytest.warns(UserWarning):
+        tracker = await target.track_execution_contexts()
+    main = await tracker.wait_for()
+    await h_driver.get(test_server.url)
+    assert await tracker.wait_for() != main
+    assert await target.execute_script("return 1+1") == 2
+
+
+@pytest.mark.asyncio
+async def test_exec_retrying_timeout():
+    import asyncio
+    import time
+    from selenium_driverless.types.target import Target
+    from selenium_driverless.types.deserialize import StaleJSRemoteObjReference
+
+    timeouts = []
+
+    class GlobalThis:
+        async def execute_script(self, script, *args, timeout, **kwargs):
+            timeouts.append(timeout)
+            await asyncio.sleep(0.1)
+            raise StaleJSRemoteObjReference(self)
+
+    class FakeTarget:
+        class _execution_contexts:
+            started = False
+
+        async def _global_this(self, context_id):
+            return GlobalThis()
+
+    start = time.perf_counter()
+    with pytest.raises(asyncio.TimeoutError):
+        await Target._exec_retrying(FakeTarget(), "execute_script", "return 1", timeout=0.35,
+                                    execution_context_id=1)
+    assert time.perf_counter() - start < 0.6
+    assert timeouts[0] <= 0.35 and all(a > b for a, b in zip(timeouts, timeouts[1:]))
@@ -0,0 +1,54 @@
+import pytest
+from selenium_driverless.types.by import By
+from selenium_driverless.types.script_registry import register_script
+
+
+@pytest.mark.asyncio
+async def test_node_list_bulk(h_driver, test_server):
+    await h_driver.get(test_server.url)
+    count = await h_driver.execute_script("return document.querySelectorAll('*').length")
+    elems = await h_driver.execute_script("return document.querySelectorAll('*')")
+    assert len(elems) == count
+    assert await elems[0].tag_name == "html"
+    snapshot = await h_driver.execute_script(
+        "return document.evaluate('//*', document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null)")
+    assert len(snapshot) == count
+
+
+@pytest.mark.asyncio
+async def test_plain_results(h_driver):
+    script = "return Array.from({length: 1000}, (_, i) => ({i: i, s: String(i), a: [i, null]}))"
+    rows = await h_driver.execute_script(script, max_depth=3, plain=True)
+    assert type(rows) is list and type(rows[0]) is dict
+    assert rows[999] == {"i": 999, "s": "999", "a": [999, None]}
+    rows = await h_driver.execute_script(script, max_depth=3)
+    assert rows[999].s == "999"
+
+
+@pytest.mark.asyncio
+async def test_object_group(h_driver, test_server):
+    target = h_driver.current_target
+    await h_driver.get(test_server.url)
+    async with target.object_group() as group:
+        obj = await target.execute_script("return {a: 1}", max_depth=0)
+        elem = await target.find_element(By.TAG_NAME, "body")
+        assert await elem.text is not None
+    assert group.released
+    with pytest.raises(Exception):
+        await obj.__exec__("return obj.a")
+    # elements get resolved again
+    assert await elem.text is not None
+
+
+@pytest.mark.asyncio
+async def test_script_registry(h_driver, test_server):
+    target = h_driver.current_target
+    await h_driver.get(test_server.url)
+    register_script("test_sum", "function(a, b){return a + b}")
+    assert await target.scripts.call("test_sum", 1, 2) == 3
+    assert await target.scripts.call("test_sum", 2, 2) == 4
+    body = await h_driver.find_element(By.TAG_NAME, "body")
+    assert len(await body.find_elements(By.XPATH, "//*")) >= 0
+    await h_driver.get(test_server.url)
+    # installed again in the new context
+    assert await target.scripts.call("test_sum", 1, 1) == 2
@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_target_registry(h_driver, test_server):
+    registry = h_driver.base_target.registry
+    # opt-in
+    assert not registry.started
+    await registry.start()
+    assert registry.started
+    info = await h_driver.current_target_info
+    await h_driver.get(test_server.url)
+    # updated by Target.targetInfoChanged
+    assert info.url == test_server.url + "/"
+    target = await h_driver.new_window("tab")
+    assert target.id in registry.infos
+    await target.close()
+    await asyncio.sleep(0.5)
+    assert target.id not in registry.infos
+
+
+@pytest.mark.asyncio
+async def test_lazy_target_infos(h_driver):
+    context = h_driver.current_context
+    new_tab = await h_driver.new_window("tab", activate=False)
+    infos = await h_driver.get_targets(context_id=None)
+    for _id, info in infos.items():
+        if _id not in context._targets:
+            # no target created while listing
+            assert not isinstance(info._target, type(h_driver.current_target))
+    tab = (await h_driver.get_targets(_type="page"))[h_driver.current_target.id].Target
+    assert tab is h_driver.current_target
+    await new_tab.close()